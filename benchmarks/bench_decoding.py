@@ -0,0 +1,145 @@
+"""Message decoding benchmark: stdlib json vs the typed decoders.
+
+Frames are either recorded payloads (one raw JSON frame per line) or, by
+default, a deterministic synthetic stream for the venue: one book snapshot
+per market followed by incremental updates, with a trade mixed in every
+20 messages.
+
+Each backend decodes every frame; "json -> dict" is the baseline the
+adapters used to consume, the others produce the typed records. Before
+timing, every typed backend is checked to produce the same records for
+the frames and to reject the same malformed frames with ValueError.
+
+Usage:
+    python benchmarks/bench_decoding.py [--frames N] [--file frames.jsonl] [--venue Polymarket|Kalshi]
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from prediction_markets_ui.core import decoding
+from prediction_markets_ui.core.feeds import SyntheticKalshiFeed, SyntheticPolymarketFeed, encode_frame
+
+
+def _trade(venue: str, feed) -> dict:
+    if venue == "Polymarket":
+        return {
+            "event_type": "last_trade_price", "market": feed.market, "asset_id": feed.asset_id,
+            "price": "0.50", "size": "25", "side": "BUY", "timestamp": str(feed.timestamp_ms),
+        }
+    return {
+        "type": "trade", "sid": 2,
+        "msg": {"market_ticker": feed.market, "yes_price": 50, "no_price": 50, "count": 25,
+                "taker_side": "yes", "ts": feed.timestamp_ms // 1000},
+    }
+
+
+def _synthetic(venue: str, count: int) -> list[bytes]:
+    feed_type = SyntheticPolymarketFeed if venue == "Polymarket" else SyntheticKalshiFeed
+    feeds = [feed_type(f"market{i}", seed=i, depth=20) for i in range(10)]
+    frames = [encode_frame(feed.snapshot()) for feed in feeds]
+    while len(frames) < count:
+        feed = feeds[len(frames) % len(feeds)]
+        msg = _trade(venue, feed) if len(frames) % 20 == 0 else feed.next_message()
+        frames.append(encode_frame(msg))
+    return frames
+
+
+# Frames every backend must reject; numbers where strings are expected
+# (and the reverse) are the usual venue-side schema slips
+MALFORMED = {
+    "Polymarket": [
+        b'{"market": "m"}',
+        b'{"event_type": "book", "bids": [{"price": 0.5, "size": "10"}]}',
+        b'{"event_type": "book", "asks": [{"price": "0.5"}]}',
+        b'{"event_type": "book", "bids": {"price": "0.5", "size": "10"}}',
+        b'{"event_type": "last_trade_price", "price": 0.5, "size": "1"}',
+        b'{"event_type": "last_trade_price", "price": "0.5", "timestamp": 1700000000000}',
+        b'{"event_type": "price_change", "price_changes": [{"asset_id": "a", "price": "0.5", "size": 1, "side": "BUY"}]}',
+        b'{"event_type": null}',
+        b'[{"event_type": "book"}, 3]',
+        b'"book"',
+        b'{"event_type": "book"',
+    ],
+    "Kalshi": [
+        b'{"msg": {}}',
+        b'{"type": "orderbook_delta", "msg": {"price": "50", "delta": 1}}',
+        b'{"type": "orderbook_delta", "msg": {"price": 50.5, "delta": 1}}',
+        b'{"type": "orderbook_delta", "msg": {"price": 50, "delta": true}}',
+        b'{"type": "orderbook_snapshot", "msg": {"yes": [[50]]}}',
+        b'{"type": "orderbook_snapshot", "msg": {"yes": [[50, "10"]]}}',
+        b'{"type": "trade", "msg": {"yes_price": 50, "ts": "1700000000"}}',
+        b'{"type": "trade", "msg": null}',
+        b'{"type": "trade", "seq": "1"}',
+        b'[{"type": "trade"}, []]',
+        b'{"type": "trade"',
+    ],
+}
+
+
+def check(venue: str, decoders: dict, frames: list[bytes]):
+    """Raise AssertionError unless all decoders agree on `frames` and reject MALFORMED."""
+    decoded = {name: [decoder.decode(frame) for frame in frames] for name, decoder in decoders.items()}
+    reference = next(iter(decoded.values()))
+    for name, records in decoded.items():
+        assert records == reference, f"{name} decodes differently"
+    for frame in MALFORMED[venue]:
+        for name, decoder in decoders.items():
+            try:
+                decoder.decode(frame)
+            except ValueError:
+                continue
+            raise AssertionError(f"{name} accepted malformed frame {frame!r}")
+
+
+def _recorded(path: str) -> list[bytes]:
+    with open(path, "rb") as f:
+        return [line.rstrip(b"\n") for line in f if line.strip()]
+
+
+def bench(decode, frames: list[bytes], rounds: int) -> float:
+    """Best-of-rounds microseconds per frame."""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for frame in frames:
+            decode(frame)
+        samples.append((time.perf_counter() - start) / len(frames) * 1e6)
+    return min(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100_000)
+    parser.add_argument("--file", help="recorded frames, one JSON frame per line")
+    parser.add_argument("--venue", default="Polymarket", choices=("Polymarket", "Kalshi"))
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    frames = _recorded(args.file) if args.file else _synthetic(args.venue, args.frames)
+    make = decoding.polymarket_decoder if args.venue == "Polymarket" else decoding.kalshi_decoder
+    size = statistics.mean(len(frame) for frame in frames)
+    print(f"{len(frames)} {args.venue} frames, mean {size:.0f} bytes")
+
+    decoders = {"json": make("json")}
+    if decoding.orjson is not None:
+        decoders["orjson"] = make("orjson")
+    if decoding.msgspec is not None:
+        decoders["msgspec"] = make("msgspec")
+    check(args.venue, decoders, frames[:1000])
+    print(f"{', '.join(decoders)}: same records, {len(MALFORMED[args.venue])} malformed frames rejected")
+
+    candidates = [("json -> dict", json.loads)]
+    candidates += [(f"{name} -> records", decoder.decode) for name, decoder in decoders.items()]
+
+    baseline = None
+    for name, decode in candidates:
+        per_frame = bench(decode, frames, args.rounds)
+        baseline = baseline or per_frame
+        print(f"{name:<20} {per_frame:6.2f} us/frame   {baseline / per_frame:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
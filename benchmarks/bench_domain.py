@@ -0,0 +1,87 @@
+"""Domain record memory benchmark: dicts vs slotted records.
+
+Builds a catalog of markets and a book of open orders twice, once as the
+plain dicts the widgets used to carry in their item data and once as the
+slotted domain records held by the stores, and reports the traced
+allocation of each.
+
+Usage:
+    python benchmarks/bench_domain.py [--markets N] [--orders N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from prediction_markets_ui.core.domain import Event, Market, MarketCatalog, Order, OrderStore
+
+
+def _dict_markets(count: int) -> dict:
+    events = {}
+    for i in range(count):
+        event_id = f"event-{i // 5}"
+        event = events.setdefault(event_id, {"type": "event", "id": event_id, "title": f"Event {i // 5}",
+                                             "category": "Crypto", "markets": []})
+        event["markets"].append({"type": "market", "id": f"market-{i}", "event_id": event_id,
+                                 "title": f"Market {i}", "venue": "Polymarket", "venue_market": f"0x{i:040x}"})
+    return events
+
+
+def _record_markets(count: int) -> MarketCatalog:
+    catalog = MarketCatalog()
+    for start in range(0, count, 5):
+        event_id = f"event-{start // 5}"
+        catalog.add_event(
+            Event(event_id, f"Event {start // 5}", "Crypto"),
+            [Market(f"market-{i}", event_id, f"Market {i}", "Polymarket", f"0x{i:040x}")
+             for i in range(start, min(start + 5, count))],
+        )
+    return catalog
+
+
+def _dict_orders(count: int) -> dict:
+    return {
+        f"c{i}": {"client_id": f"c{i}", "market_id": f"market-{i % 500}", "side": "BUY", "outcome": "YES",
+                  "order_type": "LIMIT", "size": 10.0 + i, "price": 0.5, "order_id": f"o{i}",
+                  "filled": 0.0, "status": "OPEN", "reason": ""}
+        for i in range(count)
+    }
+
+
+def _record_orders(count: int) -> OrderStore:
+    store = OrderStore()
+    for i in range(count):
+        order = Order(f"c{i}", f"market-{i % 500}", "BUY", "YES", "LIMIT", 10.0 + i, 0.5, f"o{i}", status="OPEN")
+        store.orders[order.client_id] = order
+        store._by_order_id[order.order_id] = order.client_id
+    return store
+
+
+def traced(build, count: int) -> int:
+    """Bytes still allocated by `build(count)` once it returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = build(count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--markets", type=int, default=50_000)
+    parser.add_argument("--orders", type=int, default=10_000)
+    args = parser.parse_args()
+
+    for label, count, as_dicts, as_records in (
+        ("markets", args.markets, _dict_markets, _record_markets),
+        ("orders", args.orders, _dict_orders, _record_orders),
+    ):
+        dicts, records = traced(as_dicts, count), traced(as_records, count)
+        print(f"{count:>7} {label:<8} dicts {dicts / 1e6:7.2f} MB   records {records / 1e6:7.2f} MB"
+              f"   {dicts / records:4.2f}x  ({(dicts - records) / count:.0f} B/record saved)")
+
+
+if __name__ == "__main__":
+    main()
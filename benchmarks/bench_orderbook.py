@@ -0,0 +1,75 @@
+"""Orderbook redraw benchmark: QTableWidget vs custom-painted DepthView.
+
+Each frame applies one level change to a deep book, then re-renders and
+repaints the orderbook synchronously.
+
+Usage:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_orderbook.py [--levels N] [--frames N]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+
+from PySide6 import QtWidgets
+
+from prediction_markets_ui.app import apply_app_style
+from prediction_markets_ui.core.orderbook import PRICE_SCALE, OrderBook
+from prediction_markets_ui.widgets.trading_panel import OrderbookWidget
+
+
+def _deep_book(levels: int) -> OrderBook:
+    book = OrderBook("bench")
+    step = PRICE_SCALE // 2 // (levels + 1)
+    mid = PRICE_SCALE // 2
+    book.apply_snapshot(
+        [(mid - (i + 1) * step, 100.0 + i) for i in range(levels)],
+        [(mid + (i + 1) * step, 100.0 + i) for i in range(levels)],
+    )
+    return book
+
+
+def bench(app: QtWidgets.QApplication, painted: bool, levels: int, frames: int) -> list[float]:
+    book = _deep_book(levels)
+    widget = OrderbookWidget(painted=painted)
+    widget.DEPTH = levels
+    widget.resize(600, 900)
+    widget.show()
+    widget.set_book(book)
+    app.processEvents()
+
+    rng = random.Random(0)
+    ticks = [tick for tick, _ in book.bids.levels()]
+    results = []
+    for _ in range(frames):
+        book.apply_change("BUY", rng.choice(ticks), float(rng.randint(1, 500)))
+        start = time.perf_counter()
+        if painted:
+            widget.depth_view.refresh()
+        else:
+            widget.render_book()
+        widget.repaint()
+        results.append((time.perf_counter() - start) * 1000)
+    widget.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--levels", type=int, default=200)
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv)
+    apply_app_style(app)
+
+    for name, painted in (("table", False), ("painted", True)):
+        samples = bench(app, painted, args.levels, args.frames)
+        print(f"{name:<8} {args.levels} levels: median {statistics.median(samples):7.2f} ms/frame   "
+              f"max {max(samples):7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
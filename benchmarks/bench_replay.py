@@ -0,0 +1,89 @@
+"""Replay a market-data recording through the ingestor, without the UI.
+
+Every recorded market is linked, the frames are fed through
+`Ingestor.submit()` at the requested speed (held back rather than
+dropped when ingestion falls behind), and the ingestion counters
+are reported once the ingest thread has caught up. A consumer drains the
+queue every `--drain-ms`, like the GUI does.
+
+Without `--file`, a synthetic recording is made first (`--markets`
+Polymarket markets, `--frames` frames each).
+
+Usage:
+    python benchmarks/bench_replay.py [--file recording.bin] [--speed 1|10|max] [--drain-ms 100]
+"""
+
+import argparse
+import functools
+import os
+import tempfile
+import threading
+import time
+
+from prediction_markets_ui.core.feeds import SyntheticPolymarketFeed
+from prediction_markets_ui.core.ingest import Ingestor
+from prediction_markets_ui.core.recording import FrameRecorder, Replayer, recorded_markets
+from prediction_markets_ui.core.venues import KalshiAdapter, PolymarketAdapter
+
+
+def _synthetic(path: str, markets: int, frames: int):
+    """Record interleaved synthetic feeds, one frame per millisecond."""
+    recorder = FrameRecorder(path)
+    streams = [SyntheticPolymarketFeed(f"0x{i:040x}", seed=i).frames(frames) for i in range(markets)]
+    t = 1_700_000_000.0
+    for batch in zip(*streams):
+        for frame in batch:
+            t += 0.001
+            recorder.record("Polymarket", frame, t)
+    recorder.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--file", help="recording made with PM_UI_RECORD_FILE")
+    parser.add_argument("--speed", default="max", help="1, 10, ... or max")
+    parser.add_argument("--drain-ms", type=float, default=100)
+    parser.add_argument("--markets", type=int, default=20)
+    parser.add_argument("--frames", type=int, default=5_000)
+    args = parser.parse_args()
+
+    path = args.file
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(), "synthetic.bin")
+        _synthetic(path, args.markets, args.frames)
+
+    ingestor = Ingestor([PolymarketAdapter(), KalshiAdapter()])
+    markets = recorded_markets(path, ingestor.adapters)
+    for venue, venue_market in markets:
+        ingestor.link(f"{venue}:{venue_market}", venue, venue_market)
+    print(f"{path}: {os.path.getsize(path) / 1e6:.1f} MB, {len(markets)} markets")
+
+    stop = threading.Event()
+
+    def drain():
+        while not stop.wait(args.drain_ms / 1000):
+            ingestor.queue.drain()
+
+    consumer = threading.Thread(target=drain, daemon=True)
+    ingestor.start()
+    consumer.start()
+    replayer = Replayer(path, functools.partial(ingestor.submit, block=True), None if args.speed == "max" else float(args.speed))
+    start = time.perf_counter()
+    replayer.run()
+    while True:
+        stats = ingestor.stats()
+        if stats["applied"] + stats["dropped"] >= stats["received"] or time.perf_counter() - start > 600:
+            break
+        time.sleep(0.01)
+    total = time.perf_counter() - start
+    stop.set()
+    ingestor.stop()
+
+    replay = replayer.stats()
+    print(f"replayed {replay['frames']} frames in {replay['elapsed_s']:.2f}s "
+          f"({replay['frames_per_s']:,.0f}/s, up to {replay['max_behind_ms']:.0f} ms behind schedule)")
+    print(f"ingested in {total:.2f}s: " + ", ".join(f"{key} {value}" for key, value in ingestor.stats().items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""UI construction benchmark: window startup and market tab creation.
+
+Usage:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_ui.py [--rounds N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+
+from PySide6 import QtWidgets
+
+from prediction_markets_ui.app import apply_app_style
+from prediction_markets_ui.main_window import MainWindow
+from prediction_markets_ui.widgets.trading_panel import MarketTab
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def bench_startup(app: QtWidgets.QApplication, rounds: int) -> list[float]:
+    """MainWindow construction through first paint."""
+    results = []
+    for _ in range(rounds):
+        window = None
+
+        def build():
+            nonlocal window
+            window = MainWindow()
+            window.show()
+            app.processEvents()
+
+        results.append(_timed(build))
+        window.log_panel.restore_stdout()
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+    return results
+
+
+def bench_tab_creation(app: QtWidgets.QApplication, rounds: int) -> list[float]:
+    """Unpooled MarketTab construction, insertion and first paint."""
+    tabs = QtWidgets.QTabWidget()
+    tabs.resize(1000, 500)
+    tabs.show()
+    app.processEvents()
+
+    results = []
+    for i in range(rounds):
+        def build():
+            tab = MarketTab()
+            tabs.setCurrentIndex(tabs.addTab(tab, f"Market {i}"))
+            app.processEvents()
+
+        results.append(_timed(build))
+    return results
+
+
+def _report(name: str, samples: list[float]):
+    print(
+        f"{name:<14} median {statistics.median(samples):7.2f} ms   "
+        f"min {min(samples):7.2f} ms   max {max(samples):7.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv)
+    apply_app_style(app)
+
+    _report("startup", bench_startup(app, args.rounds))
+    _report("tab creation", bench_tab_creation(app, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
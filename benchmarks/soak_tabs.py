@@ -0,0 +1,104 @@
+"""Tab open/close soak test: memory growth per cycle.
+
+Opens and closes market tabs (a new market each cycle, like browsing
+through markets over a trading day) while a synthetic feed streams into
+every open market through the ingestor. Memory is sampled with
+tracemalloc and live Qt object counts every `--every` cycles, and the
+growth per cycle is reported after a warm-up.
+
+Usage:
+    QT_QPA_PLATFORM=offscreen python benchmarks/soak_tabs.py [--cycles 1000] [--open 3] [--every 100]
+"""
+
+import argparse
+import sys
+import time
+
+from PySide6 import QtWidgets
+
+from prediction_markets_ui.app import apply_app_style
+from prediction_markets_ui.core.feeds import SyntheticPolymarketFeed, encode_frame
+from prediction_markets_ui.main_window import MainWindow
+from prediction_markets_ui.memory import MemoryProbe
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=1000)
+    parser.add_argument("--open", type=int, default=3, help="tabs kept open while cycling")
+    parser.add_argument("--every", type=int, default=100, help="cycles between samples")
+    parser.add_argument("--messages", type=int, default=50, help="feed messages per cycle")
+    parser.add_argument("--warmup", type=int, default=200, help="cycles before the baseline")
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv[:1])
+    apply_app_style(app)
+    window = MainWindow()
+    window.show()
+    app.processEvents()
+    # Output goes to the terminal, not the Debug Console
+    window.log_panel.restore_stdout()
+
+    panel = window.trading_panel
+    ingestor = window.ingestor
+    feeds: dict[str, SyntheticPolymarketFeed] = {}
+
+    def open_market(n: int):
+        market_id = f"soak-{n}"
+        feed = feeds[market_id] = SyntheticPolymarketFeed(f"0xsoak{n}", seed=n)
+        ingestor.link(market_id, "Polymarket", feed.market)
+        ingestor.submit("Polymarket", next(feed.frames(1)))
+        panel.open_market(market_id, f"Soak market {n}")
+
+    def close_market(market_id: str):
+        feeds.pop(market_id)
+        tabs = panel.market_tabs
+        panel._on_tab_close(tabs.indexOf(panel._tabs[market_id]))
+
+    def stream(count: int):
+        for _ in range(count):
+            for feed in feeds.values():
+                ingestor.submit("Polymarket", encode_frame(feed.next_message()))
+        time.sleep(0.002)
+        window._drain_market_data()
+        panel._refresh_current()
+        app.processEvents()
+
+    for n in range(args.open):
+        open_market(n)
+
+    probe = MemoryProbe(frames=1)
+    probe.start_tracing()
+    samples = []
+    start = time.perf_counter()
+    for cycle in range(1, args.cycles + 1):
+        oldest = next(iter(feeds))
+        close_market(oldest)
+        open_market(args.open + cycle)
+        stream(args.messages // max(args.open, 1))
+
+        if cycle == args.warmup or (cycle > args.warmup and cycle % args.every == 0):
+            snap = probe.snapshot()
+            samples.append((cycle, snap))
+            if cycle > args.warmup:
+                traced, qt = probe.growth()
+                print(f"cycle {cycle:5d}: {snap.traced_bytes / 2**20:7.2f} MB traced, "
+                      f"{sum(snap.qt_objects.values()):6d} Qt objects, "
+                      f"{traced / args.every:+8.0f} B/cycle, "
+                      f"{sum(qt.values()) / args.every:+.2f} Qt objects/cycle")
+    elapsed = time.perf_counter() - start
+
+    if len(samples) > 1:
+        (first_cycle, first), (last_cycle, last) = samples[0], samples[-1]
+        cycles = last_cycle - first_cycle
+        traced, qt = probe.growth(first)
+        print(f"\n{args.cycles} cycles in {elapsed:.1f}s; after warm-up: "
+              f"{traced / cycles:+.0f} B/cycle, {sum(qt.values()) / cycles:+.2f} Qt objects/cycle")
+        print(probe.report(first))
+        print(probe.report())
+
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,27 @@
 """Application setup and configuration."""
 
 import os
+import sys
 from PySide6 import QtWidgets, QtGui
 
 from prediction_markets_ui.theme.palette import apply_dark_palette
 from prediction_markets_ui.theme.styles import get_global_stylesheet
 
 
+def _replay_speed(value: str) -> float | None:
+    """Speed multiplier, None for "max"; an invalid value warns and falls back to 1x."""
+    if value == "max":
+        return None
+    try:
+        speed = float(value)
+    except ValueError:
+        speed = 0.0
+    if not speed > 0:
+        print(f"PM_UI_REPLAY_SPEED={value!r} is not a positive number or 'max'; replaying at 1x", file=sys.stderr)
+        return 1.0
+    return speed
+
+
 # Environment configuration
 UI_THEME = os.getenv("PM_UI_THEME", "dark").lower()
 UI_FONT_FAMILY = os.getenv("PM_UI_FONT_FAMILY", "")
@@ -14,6 +29,23 @@ UI_FONT_SIZE = int(os.getenv("PM_UI_FONT_SIZE", "12"))
 UI_WINDOW_WIDTH = int(os.getenv("PM_UI_WIDTH", "1400"))
 UI_WINDOW_HEIGHT = int(os.getenv("PM_UI_HEIGHT", "900"))
 UI_MONITOR = os.getenv("PM_UI_MONITOR", "cursor").lower()
+UI_BOOK_VIEW = os.getenv("PM_UI_BOOK_VIEW", "table").lower()  # table / painted
+# Workspace session file; empty to disable saving and restoring
+UI_SESSION_FILE = os.getenv(
+    "PM_UI_SESSION_FILE", os.path.join(os.path.expanduser("~"), ".prediction_markets_ui", "session.bin")
+)
+# Record raw market-data frames to this file (empty to disable)
+UI_RECORD_FILE = os.getenv("PM_UI_RECORD_FILE", "")
+# Replay a recording instead of live feeds, at PM_UI_REPLAY_SPEED (1, 10, ... or "max")
+UI_REPLAY_FILE = os.getenv("PM_UI_REPLAY_FILE", "")
+UI_REPLAY_SPEED = _replay_speed(os.getenv("PM_UI_REPLAY_SPEED", "1").strip().lower())
+# Report GUI-thread stalls longer than this (ms, 0 to disable) to the Debug Console and the stall log
+UI_STALL_MS = float(os.getenv("PM_UI_STALL_MS", "300"))
+UI_STALL_LOG = os.getenv(
+    "PM_UI_STALL_LOG", os.path.join(os.path.expanduser("~"), ".prediction_markets_ui", "stalls.log")
+)
+# Let the performance HUD time paints; routes every Qt event through a Python notify()
+UI_PAINT_TIMING = os.getenv("PM_UI_PAINT_TIMING", "") == "1"
 
 
 def apply_app_style(app: QtWidgets.QApplication) -> None:
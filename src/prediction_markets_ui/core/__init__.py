@@ -1,3 +1,109 @@
 """Core integration for the trading UI."""
 
-# Exchange manager and signals will be implemented in Phase 2
+from prediction_markets_ui.core.candles import CandleEngine, CandleSeries, CandleSet
+from prediction_markets_ui.core.decoding import FrameDecoder, KalshiEvent, PolyEvent
+from prediction_markets_ui.core.domain import (
+    Event,
+    Fill,
+    Market,
+    MarketCatalog,
+    Order,
+    OrderStore,
+    Position,
+    PositionBook,
+    PriceLevel,
+)
+from prediction_markets_ui.core.engine import Engine
+from prediction_markets_ui.core.execution import BookWalker, FillEstimate
+from prediction_markets_ui.core.ingest import Ingestor, MarketDataQueue, MarketUpdate
+from prediction_markets_ui.core.operations import (
+    ChainError,
+    LocalChain,
+    Operation,
+    OperationsProgress,
+    OperationsQueue,
+)
+from prediction_markets_ui.core.orderbook import (
+    PRICE_SCALE,
+    BookEngine,
+    BookView,
+    ComplementView,
+    OrderBook,
+    from_ticks,
+    to_ticks,
+)
+from prediction_markets_ui.core.orders import (
+    CancelRequest,
+    CancelResult,
+    LocalExchange,
+    LocalSigner,
+    OrderAck,
+    OrderPipeline,
+    OrderRequest,
+)
+from prediction_markets_ui.core.recording import FrameRecorder, RecordedFrame, Replayer
+from prediction_markets_ui.core.scheduler import Priority, RateLimited, RequestScheduler
+from prediction_markets_ui.core.trades import TradeBuffer, TradeEngine
+from prediction_markets_ui.core.venues import (
+    ConsolidatedBook,
+    KalshiAdapter,
+    PolymarketAdapter,
+    VenueAdapter,
+    VenueRouter,
+)
+
+__all__ = [
+    "PRICE_SCALE",
+    "BookEngine",
+    "BookView",
+    "BookWalker",
+    "CancelRequest",
+    "CancelResult",
+    "CandleEngine",
+    "CandleSeries",
+    "CandleSet",
+    "ChainError",
+    "ComplementView",
+    "ConsolidatedBook",
+    "Engine",
+    "Event",
+    "Fill",
+    "FillEstimate",
+    "FrameDecoder",
+    "FrameRecorder",
+    "Ingestor",
+    "KalshiAdapter",
+    "KalshiEvent",
+    "LocalChain",
+    "LocalExchange",
+    "LocalSigner",
+    "Market",
+    "MarketCatalog",
+    "MarketDataQueue",
+    "MarketUpdate",
+    "Operation",
+    "OperationsProgress",
+    "OperationsQueue",
+    "Order",
+    "OrderAck",
+    "OrderBook",
+    "OrderPipeline",
+    "OrderRequest",
+    "OrderStore",
+    "PolyEvent",
+    "PolymarketAdapter",
+    "Position",
+    "PositionBook",
+    "PriceLevel",
+    "Priority",
+    "RateLimited",
+    "RecordedFrame",
+    "Replayer",
+    "RequestScheduler",
+    "TradeBuffer",
+    "TradeEngine",
+    "VenueAdapter",
+    "VenueRouter",
+    "from_ticks",
+    "to_ticks",
+]
@@ -0,0 +1,158 @@
+"""Incremental OHLC candles built from the trade stream."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+
+# Resolution name -> bucket length in seconds
+RESOLUTIONS = {"1s": 1, "1m": 60, "5m": 300, "1h": 3600}
+
+Candle = tuple[float, float, float, float, float, float]  # (time, open, high, low, close, volume)
+
+
+class CandleSeries:
+    """
+    Candles of one resolution, stored as parallel arrays.
+
+    Trades are folded into the last candle in O(1). Once more than
+    `max_candles` exist, the oldest are dropped in chunks.
+    """
+
+    __slots__ = ("seconds", "max_candles", "times", "opens", "highs", "lows", "closes", "volumes")
+
+    def __init__(self, seconds: int, max_candles: int = 100_000):
+        self.seconds = seconds
+        self.max_candles = max_candles
+        self.times = array("d")
+        self.opens = array("d")
+        self.highs = array("d")
+        self.lows = array("d")
+        self.closes = array("d")
+        self.volumes = array("d")
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def add_trade(self, ts: float, price: float, size: float):
+        bucket = ts - ts % self.seconds
+        times = self.times
+        if times and bucket == times[-1]:
+            i = len(times) - 1
+        elif not times or bucket > times[-1]:
+            self._append(bucket, price, size)
+            return
+        else:
+            # Late trade for an earlier bucket
+            i = bisect_left(times, bucket)
+            if i == len(times) or times[i] != bucket:
+                return  # Too old or a gap we don't backfill
+            if self.highs[i] < price:
+                self.highs[i] = price
+            if self.lows[i] > price:
+                self.lows[i] = price
+            self.volumes[i] += size
+            return
+
+        if self.highs[i] < price:
+            self.highs[i] = price
+        if self.lows[i] > price:
+            self.lows[i] = price
+        self.closes[i] = price
+        self.volumes[i] += size
+
+    def _append(self, bucket: float, price: float, size: float):
+        self.times.append(bucket)
+        self.opens.append(price)
+        self.highs.append(price)
+        self.lows.append(price)
+        self.closes.append(price)
+        self.volumes.append(size)
+        if len(self.times) > self.max_candles:
+            # Trim 10% at once so deletion cost is amortized
+            drop = max(self.max_candles // 10, 1)
+            for column in (self.times, self.opens, self.highs, self.lows, self.closes, self.volumes):
+                del column[:drop]
+
+    def index_range(self, start: float, end: float) -> tuple[int, int]:
+        """[lo, hi) indices of candles whose bucket starts within [start, end]."""
+        return bisect_left(self.times, start - self.seconds), bisect_right(self.times, end)
+
+    def decimate(self, start: float, end: float, buckets: int) -> list[Candle]:
+        """
+        Candles in [start, end], merged so that at most `buckets` remain.
+
+        Each output candle spans an equal slice of the time range; merging
+        keeps the first open, last close, overall high/low and summed volume.
+        """
+        lo, hi = self.index_range(start, end)
+        if hi <= lo or buckets <= 0:
+            return []
+
+        times, opens, highs, lows, closes, volumes = (
+            self.times, self.opens, self.highs, self.lows, self.closes, self.volumes
+        )
+        if hi - lo <= buckets:
+            return [(times[i], opens[i], highs[i], lows[i], closes[i], volumes[i]) for i in range(lo, hi)]
+
+        width = (end - start) / buckets
+        result = []
+        i = lo
+        while i < hi:
+            slot_end = start + (int((times[i] - start) // width) + 1) * width
+            j = bisect_left(times, slot_end, i, hi)
+            j = max(j, i + 1)
+            result.append((
+                times[i],
+                opens[i],
+                max(highs[i:j]),
+                min(lows[i:j]),
+                closes[j - 1],
+                sum(volumes[i:j]),
+            ))
+            i = j
+        return result
+
+
+class CandleSet:
+    """All resolutions of one market, updated together from each trade."""
+
+    __slots__ = ("market_id", "series")
+
+    def __init__(self, market_id: str, resolutions: dict[str, int] = RESOLUTIONS):
+        self.market_id = market_id
+        self.series = {name: CandleSeries(seconds) for name, seconds in resolutions.items()}
+
+    def add_trade(self, ts: float, price: float, size: float):
+        for series in self.series.values():
+            series.add_trade(ts, price, size)
+
+    def best_series(self, span: float, max_candles: int) -> CandleSeries:
+        """Finest resolution that fits `span` seconds into `max_candles` candles."""
+        ordered = sorted(self.series.values(), key=lambda s: s.seconds)
+        for series in ordered:
+            if span / series.seconds <= max_candles:
+                return series
+        return ordered[-1]
+
+    def last_time(self) -> float | None:
+        finest = min(self.series.values(), key=lambda s: s.seconds)
+        return finest.times[-1] if finest.times else None
+
+
+class CandleEngine:
+    """Owns the candle set of every market that has traded."""
+
+    def __init__(self, resolutions: dict[str, int] = RESOLUTIONS):
+        self._resolutions = resolutions
+        self._sets: dict[str, CandleSet] = {}
+
+    def candles(self, market_id: str) -> CandleSet:
+        candle_set = self._sets.get(market_id)
+        if candle_set is None:
+            candle_set = self._sets[market_id] = CandleSet(market_id, self._resolutions)
+        return candle_set
+
+    def on_trade(self, market_id: str, ts: float, price: float, size: float):
+        self.candles(market_id).add_trade(ts, price, size)
+
+    def remove(self, market_id: str):
+        self._sets.pop(market_id, None)
@@ -0,0 +1,213 @@
+"""Typed decoding of raw venue frames.
+
+Frames are decoded into slotted records that the venue adapters read by
+attribute. With msgspec installed the records are msgspec Structs, and
+the JSON is parsed and validated straight into them in one pass without
+building intermediate dicts. Without it they are slotted dataclasses,
+built from dicts parsed with orjson (or the stdlib json module) and
+checked field by field, which is slower but accepts and rejects the same
+frames.
+
+Unknown fields are ignored, so venue additions don't break decoding.
+Malformed frames raise ValueError.
+"""
+
+import dataclasses
+import json
+from typing import Any, Callable
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+Frame = bytes | str
+
+# Fastest parser available for the dict-based fallback
+_loads: Callable[[Frame], Any] = orjson.loads if orjson is not None else json.loads
+
+BACKEND = "msgspec" if msgspec is not None else ("orjson" if orjson is not None else "json")
+
+if msgspec is not None:
+    _Record = msgspec.Struct
+
+    def _record(cls):
+        return cls
+
+    def _default(factory):
+        return msgspec.field(default_factory=factory)
+else:
+    _Record = object
+    _record = dataclasses.dataclass(slots=True)
+
+    def _default(factory):
+        return dataclasses.field(default_factory=factory)
+
+
+_REQUIRED = object()
+
+
+def _field(data: dict, key: str, kind: type, default: Any = _REQUIRED) -> Any:
+    """
+    `data[key]`, checked to be exactly `kind` the way msgspec validates a
+    field (a number is not a str, a bool or float is not an int, null is
+    not allowed). Missing optional fields get `default`.
+    """
+    value = data.get(key, default)
+    if value is _REQUIRED:
+        raise ValueError(f"missing required field {key!r}")
+    if type(value) is not kind:
+        raise ValueError(f"expected {kind.__name__} for {key!r}, got {type(value).__name__}")
+    return value
+
+
+# ---- Polymarket market channel ----
+
+@_record
+class PolyLevel(_Record):
+    price: str
+    size: str
+
+
+@_record
+class PolyChange(_Record):
+    asset_id: str
+    price: str
+    size: str
+    side: str
+    hash: str = ""
+
+
+@_record
+class PolyEvent(_Record):
+    """One market-channel event ("book", "price_change", "last_trade_price", ...)."""
+
+    event_type: str
+    market: str = ""
+    asset_id: str = ""
+    bids: list[PolyLevel] = _default(list)
+    asks: list[PolyLevel] = _default(list)
+    price_changes: list[PolyChange] = _default(list)
+    price: str = ""
+    size: str = ""
+    side: str = ""
+    hash: str = ""
+    timestamp: str = ""  # Milliseconds since the epoch
+
+
+def _poly_level(data: dict) -> PolyLevel:
+    return PolyLevel(_field(data, "price", str), _field(data, "size", str))
+
+
+def _poly_event(data: dict) -> PolyEvent:
+    return PolyEvent(
+        _field(data, "event_type", str),
+        _field(data, "market", str, ""),
+        _field(data, "asset_id", str, ""),
+        [_poly_level(lv) for lv in _field(data, "bids", list, [])],
+        [_poly_level(lv) for lv in _field(data, "asks", list, [])],
+        [
+            PolyChange(_field(ch, "asset_id", str), _field(ch, "price", str), _field(ch, "size", str),
+                       _field(ch, "side", str), _field(ch, "hash", str, ""))
+            for ch in _field(data, "price_changes", list, [])
+        ],
+        _field(data, "price", str, ""),
+        _field(data, "size", str, ""),
+        _field(data, "side", str, ""),
+        _field(data, "hash", str, ""),
+        _field(data, "timestamp", str, ""),
+    )
+
+
+# ---- Kalshi orderbook and trade channels ----
+
+@_record
+class KalshiBody(_Record):
+    market_ticker: str = ""
+    yes: list[tuple[int, int]] = _default(list)  # Snapshot (cents, quantity)
+    no: list[tuple[int, int]] = _default(list)
+    price: int = 0          # Delta price, cents
+    delta: int = 0
+    side: str = ""          # "yes" / "no"
+    yes_price: int = 0      # Trade price, cents
+    count: int = 0
+    taker_side: str = ""
+    ts: int = 0             # Seconds since the epoch
+
+
+@_record
+class KalshiEvent(_Record):
+    """One Kalshi message envelope ("orderbook_snapshot", "orderbook_delta", "trade", ...)."""
+
+    type: str
+    msg: KalshiBody = _default(KalshiBody)
+    sid: int = 0
+    seq: int = 0
+
+
+def _kalshi_level(level: list) -> tuple[int, int]:
+    if type(level) is not list or len(level) != 2 or type(level[0]) is not int or type(level[1]) is not int:
+        raise ValueError(f"expected [int, int] level, got {level!r}")
+    return level[0], level[1]
+
+
+def _kalshi_event(data: dict) -> KalshiEvent:
+    body = _field(data, "msg", dict, {})
+    return KalshiEvent(
+        _field(data, "type", str),
+        KalshiBody(
+            _field(body, "market_ticker", str, ""),
+            [_kalshi_level(level) for level in _field(body, "yes", list, [])],
+            [_kalshi_level(level) for level in _field(body, "no", list, [])],
+            _field(body, "price", int, 0),
+            _field(body, "delta", int, 0),
+            _field(body, "side", str, ""),
+            _field(body, "yes_price", int, 0),
+            _field(body, "count", int, 0),
+            _field(body, "taker_side", str, ""),
+            _field(body, "ts", int, 0),
+        ),
+        _field(data, "sid", int, 0),
+        _field(data, "seq", int, 0),
+    )
+
+
+class FrameDecoder:
+    """
+    Decodes frames holding one record or a JSON array of records.
+
+    `from_dict` builds a record from a parsed dict and is only used when
+    msgspec isn't available.
+    """
+
+    def __init__(self, record_type: type, from_dict: Callable[[dict], Any], backend: str = BACKEND):
+        self.record_type = record_type
+        self.backend = backend
+        self._from_dict = from_dict
+        self._typed = msgspec.json.Decoder(list[record_type] | record_type) if backend == "msgspec" else None
+        self._loads = json.loads if backend == "json" else _loads
+
+    def decode(self, frame: Frame) -> list:
+        if self._typed is not None:
+            decoded = self._typed.decode(frame)
+            return decoded if isinstance(decoded, list) else [decoded]
+        data = self._loads(frame)
+        try:
+            if isinstance(data, list):
+                return [self._from_dict(item) for item in data]
+            return [self._from_dict(data)]
+        except (ValueError, TypeError, AttributeError) as exc:
+            raise ValueError(f"malformed {self.record_type.__name__}: {exc}") from exc
+
+
+def polymarket_decoder(backend: str = BACKEND) -> FrameDecoder:
+    return FrameDecoder(PolyEvent, _poly_event, backend)
+
+
+def kalshi_decoder(backend: str = BACKEND) -> FrameDecoder:
+    return FrameDecoder(KalshiEvent, _kalshi_event, backend)
@@ -0,0 +1,192 @@
+"""Domain records and the stores that own them.
+
+Records are slotted dataclasses: no per-instance __dict__, so a catalog
+of tens of thousands of markets costs a fraction of the equivalent dicts.
+Immutable ones (Event, Market, Fill, PriceLevel) are frozen; Order and
+Position are updated in place by their stores.
+
+Stores are the single owner of each record. Widgets keep only ids in
+their item data and look records up here.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from prediction_markets_ui.core.orderbook import PRICE_SCALE
+from prediction_markets_ui.core.orders import OrderAck, OrderRequest
+
+
+@dataclass(slots=True, frozen=True)
+class Event:
+    id: str
+    title: str
+    category: str = ""
+
+
+@dataclass(slots=True, frozen=True)
+class Market:
+    id: str
+    event_id: str
+    title: str
+    venue: str = ""
+    venue_market: str = ""  # Venue-native id (condition id, ticker)
+
+
+@dataclass(slots=True, frozen=True)
+class PriceLevel:
+    tick: int      # 1/PRICE_SCALE units of YES probability
+    size: float
+
+    @property
+    def price(self) -> float:
+        return self.tick / PRICE_SCALE
+
+
+@dataclass(slots=True, frozen=True)
+class Fill:
+    order_id: str
+    market_id: str
+    side: str       # "BUY" / "SELL"
+    outcome: str    # "YES" / "NO"
+    price: float
+    size: float
+    ts: float
+
+
+@dataclass(slots=True)
+class Order:
+    client_id: str
+    market_id: str
+    side: str
+    outcome: str
+    order_type: str
+    size: float
+    price: float | None
+    order_id: str = ""
+    filled: float = 0.0
+    status: str = "PENDING"  # PENDING / OPEN / CANCELING / REJECTED / CANCELED / FILLED
+    reason: str = ""
+
+
+@dataclass(slots=True)
+class Position:
+    market_id: str
+    outcome: str
+    size: float = 0.0
+    avg_price: float = 0.0
+
+
+class MarketCatalog:
+    """Events and markets by id, with each event's markets in listing order."""
+
+    def __init__(self):
+        self.events: dict[str, Event] = {}
+        self.markets: dict[str, Market] = {}
+        self._by_event: dict[str, list[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.markets)
+
+    def add_event(self, event: Event, markets: Iterable[Market] = ()):
+        self.events[event.id] = event
+        ids = self._by_event.setdefault(event.id, [])
+        for market in markets:
+            self.markets[market.id] = market
+            ids.append(market.id)
+
+    def event(self, event_id: str) -> Event | None:
+        return self.events.get(event_id)
+
+    def market(self, market_id: str) -> Market | None:
+        return self.markets.get(market_id)
+
+    def markets_of(self, event_id: str) -> Iterator[Market]:
+        for market_id in self._by_event.get(event_id, ()):
+            yield self.markets[market_id]
+
+
+class OrderStore:
+    """Orders by client id, indexed by venue order id once acked."""
+
+    def __init__(self):
+        self.orders: dict[str, Order] = {}
+        self._by_order_id: dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def get(self, client_id: str) -> Order | None:
+        return self.orders.get(client_id)
+
+    def by_order_id(self, order_id: str) -> Order | None:
+        client_id = self._by_order_id.get(order_id)
+        return None if client_id is None else self.orders.get(client_id)
+
+    def add(self, request: OrderRequest) -> Order:
+        order = Order(request.client_id, request.market_id, request.side, request.outcome,
+                      request.order_type, request.size, request.price)
+        self.orders[order.client_id] = order
+        return order
+
+    def apply_ack(self, ack: OrderAck) -> Order | None:
+        order = self.orders.get(ack.client_id)
+        if order is None:
+            return None
+        if ack.accepted:
+            order.status = "OPEN"
+            order.order_id = ack.order_id
+            self._by_order_id[ack.order_id] = order.client_id
+        else:
+            order.status = "REJECTED"
+            order.reason = ack.reason
+        return order
+
+    def set_status(self, order_id: str, status: str, reason: str = "") -> Order | None:
+        order = self.by_order_id(order_id)
+        if order is not None:
+            order.status = status
+            order.reason = reason
+        return order
+
+    def remove(self, order_id: str) -> Order | None:
+        """Forget a closed (canceled or filled) order."""
+        client_id = self._by_order_id.pop(order_id, None)
+        return None if client_id is None else self.orders.pop(client_id, None)
+
+    def open_orders(self, market_id: str | None = None) -> list[Order]:
+        return [
+            order for order in self.orders.values()
+            if order.status in ("OPEN", "CANCELING") and (market_id is None or order.market_id == market_id)
+        ]
+
+
+class PositionBook:
+    """Net position per (market, outcome), updated from fills."""
+
+    def __init__(self):
+        self.positions: dict[tuple[str, str], Position] = {}
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def get(self, market_id: str, outcome: str) -> Position | None:
+        return self.positions.get((market_id, outcome))
+
+    def apply_fill(self, fill: Fill) -> Position:
+        key = (fill.market_id, fill.outcome)
+        position = self.positions.get(key)
+        if position is None:
+            position = self.positions[key] = Position(fill.market_id, fill.outcome)
+        if fill.side == "BUY":
+            cost = position.avg_price * position.size + fill.price * fill.size
+            position.size += fill.size
+            position.avg_price = cost / position.size if position.size else 0.0
+        else:
+            # Sells realize PnL at the average price; the average is unchanged
+            position.size = max(position.size - fill.size, 0.0)
+            if not position.size:
+                del self.positions[key]
+        return position
+
+    def __iter__(self) -> Iterator[Position]:
+        return iter(list(self.positions.values()))
@@ -0,0 +1,140 @@
+"""Trading engine: market data, books, orders and positions, without a UI.
+
+`Engine` wires the core pieces together the way the app uses them. Feed
+frames go to `ingestor.submit()`; `drain()` applies what the ingest thread
+published to the books, candles and trade buffers; orders go through the
+pipeline and are tracked in the OrderStore.
+
+Callbacks from worker threads (order acks, cancel results) are passed
+through as given. The owner hands them back to `apply_ack()` /
+`apply_cancel_result()` on the thread that calls `drain()`, so all engine
+state is only ever touched from that one thread. The Qt main window does
+this through signals and timers, the headless runner from a plain loop.
+
+Nothing in `core` imports Qt.
+"""
+
+from typing import Callable
+
+from prediction_markets_ui.core.candles import CandleEngine
+from prediction_markets_ui.core.domain import Fill, MarketCatalog, Order, OrderStore, Position, PositionBook
+from prediction_markets_ui.core.ingest import Ingestor, MarketUpdate, SnapshotFetcher
+from prediction_markets_ui.core.orderbook import BookEngine
+from prediction_markets_ui.core.orders import (
+    CancelRequest,
+    CancelResult,
+    LocalExchange,
+    LocalSigner,
+    OrderAck,
+    OrderPipeline,
+    OrderRequest,
+)
+from prediction_markets_ui.core.recording import FrameRecorder
+from prediction_markets_ui.core.scheduler import RequestScheduler
+from prediction_markets_ui.core.trades import TradeEngine
+from prediction_markets_ui.core.venues import KalshiAdapter, PolymarketAdapter, VenueAdapter
+
+
+class Engine:
+    """Market-data and order state for a set of markets."""
+
+    def __init__(self, adapters: list[VenueAdapter] | None = None,
+                 exchange: LocalExchange | None = None,
+                 on_order_result: Callable[[OrderAck], None] | None = None,
+                 on_cancel: Callable[[CancelResult], None] | None = None,
+                 recorder: FrameRecorder | None = None,
+                 fetch_snapshot: SnapshotFetcher | None = None):
+        self.book_engine = BookEngine()
+        self.candle_engine = CandleEngine()
+        self.trade_engine = TradeEngine()
+        # Domain records; views keep only ids and look them up here
+        self.catalog = MarketCatalog()
+        self.orders = OrderStore()
+        self.positions = PositionBook()
+        # All REST traffic shares one rate-limited, prioritized scheduler
+        self.scheduler = RequestScheduler()
+        # Local stand-ins until the venue clients are wired in
+        exchange = exchange or LocalExchange()
+        self.order_pipeline = OrderPipeline(
+            LocalSigner(), exchange, on_result=on_order_result, scheduler=self.scheduler,
+            canceler=exchange.cancel, on_cancel=on_cancel,
+        )
+        # Feed messages are applied off the consumer's thread and conflated per
+        # market. Resync snapshots go through the scheduler's "book" endpoint
+        # when a `fetch_snapshot` (REST book call or feed resubscribe) is
+        # given; without one, a book that fails a checksum is flagged
+        # unverified until the feed sends its next snapshot.
+        self.ingestor = Ingestor(
+            adapters if adapters is not None else [PolymarketAdapter(), KalshiAdapter()],
+            fetch_snapshot=fetch_snapshot, scheduler=self.scheduler, recorder=recorder,
+        )
+
+    def start(self):
+        self.ingestor.start()
+
+    def close(self):
+        """Stop the ingest thread and the order workers, and close any recording."""
+        self.ingestor.stop()
+        if self.ingestor.recorder is not None:
+            self.ingestor.recorder.close()
+        self.order_pipeline.close()
+        self.scheduler.close()
+
+    # ---- Market data ----
+
+    def open_market(self, market_id: str, venue: str, venue_market: str):
+        """Route a venue market's feed messages to `market_id`."""
+        self.ingestor.link(market_id, venue, venue_market)
+
+    def close_market(self, market_id: str):
+        """Release everything held for a market; reopening starts from a fresh snapshot."""
+        self.ingestor.unlink(market_id)
+        self.book_engine.remove(market_id)
+        self.candle_engine.remove(market_id)
+        self.trade_engine.remove(market_id)
+
+    def drain(self) -> dict[str, MarketUpdate]:
+        """Apply the latest book state and pending trades of every updated market."""
+        updates = self.ingestor.queue.drain()
+        for market_id, update in updates.items():
+            if update.bids is not None:
+                book = self.book_engine.book(market_id)
+                book.apply_snapshot(update.bids, update.asks)
+                book.verified = update.verified
+            for ts, price, size, side in update.trades:
+                self.on_trade(market_id, ts, price, size, side)
+        return updates
+
+    def on_trade(self, market_id: str, ts: float, price: float, size: float, side: str):
+        """Record a trade for the market's tape and candles."""
+        self.trade_engine.on_trade(market_id, ts, price, size, side)
+        self.candle_engine.on_trade(market_id, ts, price, size)
+
+    # ---- Orders and positions ----
+
+    def submit_order(self, request: OrderRequest) -> Order:
+        """Send an order and track it as pending until its ack arrives."""
+        return self.orders.add(self.order_pipeline.submit(request))
+
+    def apply_ack(self, ack: OrderAck) -> Order | None:
+        return self.orders.apply_ack(ack)
+
+    def cancel(self, request: CancelRequest) -> CancelRequest:
+        """Send a batched cancel; the affected orders show CANCELING until the result."""
+        for order_id in request.order_ids:
+            order = self.orders.by_order_id(order_id)
+            if order is not None and order.status == "OPEN":
+                self.orders.set_status(order_id, "CANCELING")
+        return self.order_pipeline.cancel(request)
+
+    def apply_cancel_result(self, request: CancelRequest, result: CancelResult):
+        """Forget canceled orders; the rest of the request's orders stay open."""
+        for order_id in result.canceled:
+            self.orders.remove(order_id)
+        for order_id in request.order_ids:
+            order = self.orders.by_order_id(order_id)
+            if order is not None and order.status == "CANCELING":
+                self.orders.set_status(order_id, "OPEN")
+
+    def apply_fill(self, fill: Fill) -> Position:
+        return self.positions.apply_fill(fill)
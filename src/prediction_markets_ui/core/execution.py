@@ -0,0 +1,138 @@
+"""Fill estimation by walking the book."""
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import NamedTuple
+
+from prediction_markets_ui.core.orderbook import BookSide, BookView, MirroredSide, from_ticks, to_ticks
+
+
+class FillEstimate(NamedTuple):
+    shares: float          # Shares that would fill
+    notional: float        # USD paid (BUY) or received (SELL), before fees
+    vwap: float | None     # Average fill price
+    worst: float | None    # Price of the last level touched
+    slippage: float | None  # Adverse move of vwap vs mid (positive = worse)
+    fee: float
+    complete: bool         # False if the book (or limit price) ran out first
+
+
+class DepthLadder:
+    """
+    Cumulative depth of one book side, best level first.
+
+    `keys` increase away from the touch (ticks for asks, negated ticks for
+    bids) so a limit price maps to a level count with one bisect.
+    """
+
+    __slots__ = ("keys", "prices", "cum_shares", "cum_notional", "cum_fee")
+
+    def __init__(self, side: BookSide | MirroredSide, ascending: bool):
+        levels = list(side.levels())
+        self.keys = [t if ascending else -t for t, _ in levels]
+        self.prices = [from_ticks(t) for t, _ in levels]
+        self.cum_shares = list(accumulate(s for _, s in levels))
+        self.cum_notional = list(accumulate(p * s for p, (_, s) in zip(self.prices, levels)))
+        # Fee basis per level, min(p, 1 - p) * shares; multiply by the fee rate
+        self.cum_fee = list(accumulate(min(p, 1 - p) * s for p, (_, s) in zip(self.prices, levels)))
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def levels_within(self, limit_tick: int | None, ascending: bool) -> int:
+        """Number of levels at or better than `limit_tick`."""
+        if limit_tick is None:
+            return len(self.keys)
+        return bisect_right(self.keys, limit_tick if ascending else -limit_tick)
+
+    def walk(self, shares: float | None = None, usd: float | None = None,
+             levels: int | None = None) -> tuple[float, float, float | None, float]:
+        """
+        Fill `shares` (or spend/receive `usd`) over the first `levels` levels.
+
+        Returns (filled shares, notional, worst price, fee basis), where the
+        fee basis sums min(p, 1 - p) over every share taken at price p.
+        """
+        n = len(self.prices) if levels is None else levels
+        if n == 0:
+            return 0.0, 0.0, None, 0.0
+
+        if shares is not None:
+            cum, target = self.cum_shares, shares
+        else:
+            cum, target = self.cum_notional, usd
+        i = bisect_left(cum, target, 0, n)
+        if i == n:
+            # Not enough depth: take everything available
+            return self.cum_shares[n - 1], self.cum_notional[n - 1], self.prices[n - 1], self.cum_fee[n - 1]
+
+        before_shares = self.cum_shares[i - 1] if i else 0.0
+        before_notional = self.cum_notional[i - 1] if i else 0.0
+        before_fee = self.cum_fee[i - 1] if i else 0.0
+        price = self.prices[i]
+        level_fee = min(price, 1 - price)
+        if shares is not None:
+            part = shares - before_shares
+            return shares, before_notional + part * price, price, before_fee + part * level_fee
+        part = (usd - before_notional) / price
+        return before_shares + part, usd, price, before_fee + part * level_fee
+
+
+class BookWalker:
+    """
+    Estimates fills against a book view.
+
+    Ladders are rebuilt only when the view's version changes, so repeated
+    estimates (e.g. on every keystroke) cost a couple of bisects.
+    """
+
+    def __init__(self, view: BookView | None = None, fee_rate: float = 0.0):
+        self.view = view
+        # Taker fee rate, charged as rate * min(p, 1 - p) per share
+        self.fee_rate = fee_rate
+        self._version = -1
+        self._asks: DepthLadder | None = None
+        self._bids: DepthLadder | None = None
+
+    def set_view(self, view: BookView | None):
+        self.view = view
+        self._version = -1
+
+    def _ladder(self, side: str) -> DepthLadder | None:
+        view = self.view
+        if view is None:
+            return None
+        if view.version != self._version:
+            self._asks = DepthLadder(view.asks, ascending=True)
+            self._bids = DepthLadder(view.bids, ascending=False)
+            self._version = view.version
+        return self._asks if side == "BUY" else self._bids
+
+    def estimate(self, side: str, shares: float | None = None, usd: float | None = None,
+                 limit: float | None = None) -> FillEstimate | None:
+        """
+        Estimate an immediate fill for BUY (walks asks) or SELL (walks bids).
+
+        Give either `shares` or `usd`. With `limit`, only levels at or
+        better than the limit price are taken (the marketable part of a
+        limit order).
+        """
+        ladder = self._ladder(side)
+        if ladder is None:
+            return None
+
+        ascending = side == "BUY"
+        limit_tick = None if limit is None else to_ticks(limit)
+        levels = ladder.levels_within(limit_tick, ascending)
+        filled, notional, worst, fee_basis = ladder.walk(shares, usd, levels)
+
+        vwap = notional / filled if filled else None
+        mid = self.view.mid()
+        slippage = None
+        if vwap is not None and mid is not None:
+            slippage = vwap - mid if ascending else mid - vwap
+        # Charged level by level: the fee depends on each fill price, not the vwap
+        fee = self.fee_rate * fee_basis if filled else 0.0
+        target = shares if shares is not None else usd
+        done = filled if shares is not None else notional
+        return FillEstimate(filled, notional, vwap, worst, slippage, fee, done >= target - 1e-9)
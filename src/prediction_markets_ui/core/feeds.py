@@ -0,0 +1,152 @@
+"""Local stand-in feeds that emit venue-native book messages.
+
+Used to exercise adapters, the book engine and the UI without network
+access. Messages are built as dicts and encoded into the JSON frames the
+venue would send with `frames()`. Output is deterministic for a given seed.
+"""
+
+import json
+import random
+from abc import ABC, abstractmethod
+from typing import Iterator
+
+from prediction_markets_ui.core.orderbook import PRICE_SCALE
+from prediction_markets_ui.core.venues import book_hash
+
+
+class SyntheticFeed(ABC):
+    """Random book generator; subclasses format venue-native messages."""
+
+    # Native price increment in common ticks (1 cent)
+    TICK = PRICE_SCALE // 100
+
+    def __init__(self, market: str, seed: int = 0, mid: float = 0.5, depth: int = 10):
+        self.market = market
+        self.depth = depth
+        self._rng = random.Random(seed)
+        self._mid = round(mid * PRICE_SCALE / self.TICK) * self.TICK
+        self.bids: dict[int, float] = {}
+        self.asks: dict[int, float] = {}
+        # Venue timestamp (ms) of the latest change; one step per millisecond
+        self.timestamp_ms = 1_700_000_000_000
+        self._rebuild()
+
+    def _rebuild(self):
+        """Reset both sides around the current mid."""
+        rng = self._rng
+        self.bids = {
+            self._mid - (i + 1) * self.TICK: float(rng.randint(10, 500))
+            for i in range(self.depth)
+            if self._mid - (i + 1) * self.TICK > 0
+        }
+        self.asks = {
+            self._mid + (i + 1) * self.TICK: float(rng.randint(10, 500))
+            for i in range(self.depth)
+            if self._mid + (i + 1) * self.TICK < PRICE_SCALE
+        }
+
+    def step(self) -> tuple[str, int, float]:
+        """Mutate one level near the mid; returns (side, tick, new absolute size)."""
+        rng = self._rng
+        self.timestamp_ms += 1
+        side = rng.choice(("BUY", "SELL"))
+        offset = rng.randint(1, self.depth) * self.TICK
+        tick = self._mid - offset if side == "BUY" else self._mid + offset
+        levels = self.bids if side == "BUY" else self.asks
+        if not 0 < tick < PRICE_SCALE:
+            return side, tick, 0.0
+        size = 0.0 if rng.random() < 0.2 else float(rng.randint(10, 500))
+        if size:
+            levels[tick] = size
+        else:
+            levels.pop(tick, None)
+        return side, tick, size
+
+    def book_hash(self) -> str:
+        """Hash of the current book, as the venue would publish it."""
+        return book_hash(sorted(self.bids.items(), reverse=True), sorted(self.asks.items()))
+
+    @abstractmethod
+    def snapshot(self) -> dict:
+        """Full-book message for the current state."""
+
+    @abstractmethod
+    def next_message(self) -> dict:
+        """Advance the book by one change and return the venue's message for it."""
+
+    def messages(self, count: int) -> Iterator[dict]:
+        """A snapshot followed by `count - 1` incremental messages."""
+        yield self.snapshot()
+        for _ in range(count - 1):
+            yield self.next_message()
+
+    def frames(self, count: int) -> Iterator[bytes]:
+        """`messages()` encoded as raw frames."""
+        for msg in self.messages(count):
+            yield encode_frame(msg)
+
+
+def encode_frame(msg: dict) -> bytes:
+    """Encode a message the way venues send it (compact JSON)."""
+    return json.dumps(msg, separators=(",", ":")).encode()
+
+
+class SyntheticPolymarketFeed(SyntheticFeed):
+    """Stand-in for the Polymarket market channel (YES token)."""
+
+    def __init__(self, market: str, asset_id: str = "", **kwargs):
+        super().__init__(market, **kwargs)
+        self.asset_id = asset_id or f"{market}-yes"
+
+    def snapshot(self) -> dict:
+        return {
+            "event_type": "book",
+            "market": self.market,
+            "asset_id": self.asset_id,
+            "bids": [{"price": _dollars(t), "size": f"{s:g}"} for t, s in sorted(self.bids.items())],
+            "asks": [{"price": _dollars(t), "size": f"{s:g}"} for t, s in sorted(self.asks.items(), reverse=True)],
+            "hash": self.book_hash(),
+            "timestamp": str(self.timestamp_ms),
+        }
+
+    def next_message(self) -> dict:
+        side, tick, size = self.step()
+        return {
+            "event_type": "price_change",
+            "market": self.market,
+            "price_changes": [
+                {"asset_id": self.asset_id, "price": _dollars(tick), "size": f"{size:g}", "side": side,
+                 "hash": self.book_hash()},
+            ],
+            "timestamp": str(self.timestamp_ms),
+        }
+
+
+class SyntheticKalshiFeed(SyntheticFeed):
+    """Stand-in for the Kalshi orderbook channel (YES and NO bids in cents)."""
+
+    def __init__(self, market: str, **kwargs):
+        super().__init__(market, **kwargs)
+        self._sizes_sent: dict[tuple[str, int], float] = {}
+
+    def snapshot(self) -> dict:
+        yes = [[t * 100 // PRICE_SCALE, int(s)] for t, s in sorted(self.bids.items())]
+        no = [[(PRICE_SCALE - t) * 100 // PRICE_SCALE, int(s)] for t, s in sorted(self.asks.items(), reverse=True)]
+        self._sizes_sent = {("BUY", t): s for t, s in self.bids.items()}
+        self._sizes_sent.update({("SELL", t): s for t, s in self.asks.items()})
+        return {"type": "orderbook_snapshot", "msg": {"market_ticker": self.market, "yes": yes, "no": no}}
+
+    def next_message(self) -> dict:
+        side, tick, size = self.step()
+        delta = size - self._sizes_sent.get((side, tick), 0.0)
+        self._sizes_sent[(side, tick)] = size
+        if side == "BUY":
+            body = {"side": "yes", "price": tick * 100 // PRICE_SCALE}
+        else:
+            body = {"side": "no", "price": (PRICE_SCALE - tick) * 100 // PRICE_SCALE}
+        body.update(market_ticker=self.market, delta=int(delta))
+        return {"type": "orderbook_delta", "msg": body}
+
+
+def _dollars(tick: int) -> str:
+    return f"{tick / PRICE_SCALE:.2f}"
@@ -0,0 +1,415 @@
+"""Market-data ingestion off the GUI thread, with per-market conflation.
+
+Feed readers hand raw venue frames to `Ingestor.submit()`, which decodes
+them into typed records on the reader's thread. The ingestion thread
+applies them to its own books, and publishes into a
+`MarketDataQueue` that the GUI drains once per tick. The queue holds at most
+one book state and a bounded trade list per market, so a slow consumer
+makes updates coarser instead of making memory grow:
+
+- book messages for a market whose previous state hasn't been drained yet
+  are conflated (only the latest state is handed over);
+- trades beyond `max_trades` per market per tick are dropped (oldest first);
+- raw messages beyond `inbound_limit` are dropped, and the affected market
+  is resynced from a fresh snapshot. A source that can wait, like a
+  replay, submits with `block=True` and is held back instead.
+
+Books are also checked against the checksums venues send with their
+deltas. A mismatch triggers the same resync. The book is published as
+unverified until a fresh snapshot replaces it. With a `fetch_snapshot`,
+the snapshot is fetched through the request scheduler, deltas arriving
+meanwhile are held back and replayed on top of it, and the market keeps
+showing its last state until the new one replaces it in a single
+publish. Without one, deltas keep being applied and the feed's next
+snapshot restores the book.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from prediction_markets_ui.core.orderbook import BookEngine, Level
+from prediction_markets_ui.core.recording import FrameRecorder
+from prediction_markets_ui.core.scheduler import RequestScheduler
+from prediction_markets_ui.core.venues import Trade, VenueAdapter
+
+# Returns a raw venue-native snapshot frame for (venue, venue market)
+SnapshotFetcher = Callable[[str, str], bytes | str]
+
+
+class MarketUpdate:
+    """Everything that happened to one market since the last drain."""
+
+    __slots__ = ("bids", "asks", "verified", "trades", "published_at")
+
+    def __init__(self):
+        self.bids: list[Level] | None = None  # None = book unchanged
+        self.asks: list[Level] | None = None
+        self.verified = True  # False while the book awaits a resync
+        self.trades: list[Trade] = []
+        # time.perf_counter() of the first publish since the last drain;
+        # the drain time minus this is how long the oldest change waited
+        self.published_at = time.perf_counter()
+
+
+class MarketDataQueue:
+    """Single-producer, single-consumer handoff holding one slot per market."""
+
+    def __init__(self, max_trades: int = 1000):
+        self.max_trades = max_trades
+        self._lock = threading.Lock()
+        self._pending: dict[str, MarketUpdate] = {}
+        self.dropped_trades = 0
+
+    def __len__(self) -> int:
+        """Markets with an update waiting to be drained."""
+        return len(self._pending)
+
+    def discard(self, market_id: str):
+        """Drop anything pending for a market."""
+        with self._lock:
+            self._pending.pop(market_id, None)
+
+    def has_book(self, market_id: str) -> bool:
+        """True while a published book state is waiting to be drained."""
+        update = self._pending.get(market_id)
+        return update is not None and update.bids is not None
+
+    def publish_book(self, market_id: str, bids: list[Level], asks: list[Level], verified: bool = True):
+        with self._lock:
+            update = self._pending.get(market_id)
+            if update is None:
+                update = self._pending[market_id] = MarketUpdate()
+            update.bids, update.asks, update.verified = bids, asks, verified
+
+    def publish_trades(self, market_id: str, trades: list[Trade]):
+        with self._lock:
+            update = self._pending.get(market_id)
+            if update is None:
+                update = self._pending[market_id] = MarketUpdate()
+            update.trades.extend(trades)
+            excess = len(update.trades) - self.max_trades
+            if excess > 0:
+                del update.trades[:excess]
+                self.dropped_trades += excess
+
+    def drain(self) -> dict[str, MarketUpdate]:
+        """Take everything pending (called from the consumer's thread)."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+
+
+class Ingestor:
+    """
+    Applies venue messages to private books on a background thread.
+
+    Books are published as level copies only when the consumer has taken
+    the previous state, so the copy cost is paid once per GUI tick per
+    market, not once per message.
+
+    Without `fetch_snapshot`, a market that needs a resync keeps applying
+    deltas, flagged unverified, until the feed itself sends a snapshot.
+    """
+
+    def __init__(self, adapters: list[VenueAdapter], queue: MarketDataQueue | None = None,
+                 inbound_limit: int = 50_000, fetch_snapshot: SnapshotFetcher | None = None,
+                 scheduler: RequestScheduler | None = None, max_held: int = 10_000,
+                 recorder: FrameRecorder | None = None):
+        self.adapters = {adapter.name: adapter for adapter in adapters}
+        self.queue = queue if queue is not None else MarketDataQueue()
+        self.books = BookEngine()
+        self.inbound_limit = inbound_limit
+        self._links: dict[tuple[str, str], str] = {}
+        self._inbound: deque[tuple[str, Any]] = deque()
+        lock = threading.RLock()
+        self._cond = threading.Condition(lock)
+        # Blocking producers wait here for the ingest thread to take a batch
+        self._room = threading.Condition(lock)
+        self._dirty: set[str] = set()
+        self._thread: threading.Thread | None = None
+        self._stop = False
+        self.fetch_snapshot = fetch_snapshot
+        # Raw frames are recorded as received, before decoding
+        self.recorder = recorder
+        self._scheduler = scheduler
+        self._executor: ThreadPoolExecutor | None = None
+        self.max_held = max_held
+        # Market id -> deltas held back while its snapshot is on the way
+        self._resyncing: dict[str, deque[tuple[str, Any]]] = {}
+        # Fetched resync snapshots, applied ahead of the inbound messages.
+        # Kept apart so a full inbound queue never drops one, which would
+        # leave its market holding deltas forever
+        self._snapshots: deque[tuple[str, Any]] = deque()
+        self._failed: list[str] = []
+        # Markets resynced but not yet restored by a snapshot
+        self._unverified: set[str] = set()
+        # Markets whose state is dropped on the next pass
+        self._unlinked: list[str] = []
+
+        # Counters
+        self.received = 0
+        self.applied = 0
+        self.conflated = 0
+        self.dropped = 0
+        self.max_inbound = 0
+        self.malformed = 0
+        self.checksum_failures = 0
+        self.resync_failures = 0
+        # Market id -> number of resyncs
+        self.resyncs: dict[str, int] = {}
+        # Market id -> messages applied (written by the ingest thread only)
+        self._messages: dict[str, int] = {}
+        # (venue, market id) of books that may be wrong after dropped messages
+        self._needs_snapshot: set[tuple[str, str]] = set()
+
+    def link(self, market_id: str, venue: str, venue_market: str):
+        """Route a venue-native market onto a market id."""
+        with self._cond:
+            self._links[(venue, venue_market)] = market_id
+
+    def unlink(self, market_id: str):
+        """Stop routing messages to a market and drop its book and pending state."""
+        with self._cond:
+            self._links = {key: mid for key, mid in self._links.items() if mid != market_id}
+            # The rest of its state belongs to the ingest thread, which drops it
+            self._unlinked.append(market_id)
+            self._cond.notify()
+        self.queue.discard(market_id)
+
+    # ---- Producer side (feed reader threads) ----
+
+    def submit(self, venue: str, frame: bytes | str, block: bool = False):
+        """
+        Decode one raw frame and queue its messages. Drops the oldest
+        messages when full, or with `block` waits for the ingest thread to
+        make room (while it runs). Malformed frames are counted and skipped.
+        """
+        adapter = self.adapters.get(venue)
+        if adapter is None:
+            return
+        if self.recorder is not None:
+            self.recorder.record(venue, frame)
+        try:
+            messages = adapter.decode(frame)
+        except ValueError:
+            with self._cond:
+                self.malformed += 1
+            return
+        with self._cond:
+            for msg in messages:
+                self.received += 1
+                while block and len(self._inbound) >= self.inbound_limit and self._running():
+                    self._cond.notify()
+                    self._room.wait(0.1)
+                if len(self._inbound) >= self.inbound_limit:
+                    old_venue, old_msg = self._inbound.popleft()
+                    self.dropped += 1
+                    market_id = self._market_of(old_venue, old_msg)
+                    if market_id is not None:
+                        self._needs_snapshot.add((old_venue, market_id))
+                self._inbound.append((venue, msg))
+            self.max_inbound = max(self.max_inbound, len(self._inbound))
+            self._cond.notify()
+
+    def _running(self) -> bool:
+        return self._thread is not None and not self._stop
+
+    def _market_of(self, venue: str, msg: Any) -> str | None:
+        adapter = self.adapters.get(venue)
+        if adapter is None:
+            return None
+        return self._links.get((venue, adapter.market_key(msg)))
+
+    # ---- Ingestion thread ----
+
+    def start(self):
+        if self._thread is None:
+            self._stop = False
+            self._thread = threading.Thread(target=self._run, name="ingest", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._stop = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                # Wake up for new messages, or periodically while states are
+                # waiting for the consumer to drain
+                if (not self._inbound and not self._snapshots and not self._failed
+                        and not self._unlinked and not self._stop):
+                    self._cond.wait(0.01 if self._dirty else None)
+                if self._stop:
+                    return
+                batch = list(self._snapshots)
+                self._snapshots.clear()
+                batch.extend(self._inbound)
+                self._inbound.clear()
+                self._room.notify_all()
+                stale, self._needs_snapshot = self._needs_snapshot, set()
+                failed, self._failed = self._failed, []
+                unlinked, self._unlinked = self._unlinked, []
+            for market_id in failed:
+                # Carry on from the held deltas, still unverified; the next
+                # mismatch retries
+                for venue, msg in self._resyncing.pop(market_id, ()):
+                    self._apply(venue, msg)
+            for venue, msg in batch:
+                self._apply(venue, msg)
+            for venue, market_id in stale:
+                self._resync(venue, market_id)
+            for market_id in unlinked:
+                self._forget(market_id)
+            self._publish()
+
+    def _forget(self, market_id: str):
+        """Drop an unlinked market's book and bookkeeping, unless it was linked again."""
+        if market_id in self._links.values():
+            return
+        self.books.remove(market_id)
+        self._resyncing.pop(market_id, None)
+        self._unverified.discard(market_id)
+        self._dirty.discard(market_id)
+        self._messages.pop(market_id, None)
+        self.queue.discard(market_id)
+
+    def _apply(self, venue: str, msg: Any):
+        adapter = self.adapters.get(venue)
+        if adapter is None:
+            return
+        market_id = self._links.get((venue, adapter.market_key(msg)))
+        if market_id is None:
+            return
+        self._messages[market_id] = self._messages.get(market_id, 0) + 1
+
+        trades = adapter.trades(msg)
+        if trades:
+            self.queue.publish_trades(market_id, trades)
+            self.applied += 1
+            return
+
+        book = self.books.book(market_id)
+        if adapter.is_snapshot(msg):
+            bids, asks = adapter.snapshot_levels(msg)
+            book.apply_snapshot(bids, asks)
+            self._unverified.discard(market_id)
+            held = self._resyncing.pop(market_id, None)
+            if held:
+                # Replay what arrived while the snapshot was in flight, minus
+                # what the snapshot already includes. Deltas sharing its
+                # timestamp may or may not be in it; their sizes are absolute,
+                # so replaying one that is does no harm.
+                taken = adapter.sequence(msg)
+                for held_venue, held_msg in held:
+                    seq = adapter.sequence(held_msg)
+                    if taken is None or seq is None or seq >= taken:
+                        self._apply(held_venue, held_msg)
+        elif market_id in self._resyncing:
+            held = self._resyncing[market_id]
+            if len(held) >= self.max_held:
+                held.popleft()
+                self.dropped += 1
+            held.append((venue, msg))
+            return
+        else:
+            for side, tick, size in adapter.changes(msg, book):
+                book.apply_change(side, tick, size)
+            if adapter.verify(msg, book) is False:
+                self.checksum_failures += 1
+                self._resync(venue, market_id)
+        self.applied += 1
+
+        if market_id in self._dirty:
+            # The previous state of this market will never be seen
+            self.conflated += 1
+        self._dirty.add(market_id)
+
+    def _resync(self, venue: str, market_id: str):
+        """
+        Flag the book unverified and start fetching a fresh snapshot, holding
+        deltas until it arrives. Without a fetcher, deltas keep being applied
+        until the feed sends a snapshot.
+        """
+        if market_id not in self._unverified:
+            self._unverified.add(market_id)
+            # Publish the flag even if no further message changes the book
+            self._dirty.add(market_id)
+            with self._cond:
+                self.resyncs[market_id] = self.resyncs.get(market_id, 0) + 1
+        if self.fetch_snapshot is None or market_id in self._resyncing:
+            return
+        venue_market = next(
+            (key[1] for key, mid in self._links.items() if mid == market_id and key[0] == venue), None
+        )
+        if venue_market is None:
+            return
+        self._resyncing[market_id] = deque()
+        if self._scheduler is not None:
+            future = self._scheduler.submit("book", self.fetch_snapshot, venue, venue_market)
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(1, thread_name_prefix="resync")
+            future = self._executor.submit(self.fetch_snapshot, venue, venue_market)
+        future.add_done_callback(lambda f: self._on_snapshot(venue, market_id, f))
+
+    def _on_snapshot(self, venue: str, market_id: str, future: Future):
+        try:
+            messages = self.adapters[venue].decode(future.result())
+        except Exception:
+            with self._cond:
+                self.resync_failures += 1
+                self._failed.append(market_id)
+                self._cond.notify()
+            return
+        # Applied on the ingestion thread, ahead of the live messages queued so far
+        with self._cond:
+            self._snapshots.extend((venue, msg) for msg in messages)
+            self._cond.notify()
+
+    def _publish(self):
+        queue = self.queue
+        for market_id in list(self._dirty):
+            if queue.has_book(market_id):
+                continue  # Consumer hasn't taken the last state yet
+            book = self.books.book(market_id)
+            queue.publish_book(market_id, list(book.bids.levels()), list(book.asks.levels()),
+                               market_id not in self._unverified)
+            self._dirty.discard(market_id)
+
+    def message_counts(self) -> dict[str, int]:
+        """Messages per market id since start; diff two calls for rates."""
+        # A plain dict copy is atomic under the GIL, so no lock on the hot path
+        return self._messages.copy()
+
+    def resync_counts(self) -> dict[str, int]:
+        """Resyncs per market id since start."""
+        with self._cond:
+            return dict(self.resyncs)
+
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            resyncs = sum(self.resyncs.values())
+        return {
+            "received": self.received,
+            "applied": self.applied,
+            "conflated": self.conflated,
+            "dropped": self.dropped + self.queue.dropped_trades,
+            "malformed": self.malformed,
+            "resyncs": resyncs,
+            "unverified": len(self._unverified),
+            "checksum_failures": self.checksum_failures,
+            "inbound": len(self._inbound),
+            "pending_markets": len(self.queue),
+            "max_inbound": self.max_inbound,
+        }
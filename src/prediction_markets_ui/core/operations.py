@@ -0,0 +1,258 @@
+"""Batched split / merge / redeem operations.
+
+Conditional-token operations are queued across markets and sent as one
+multicall transaction per batch instead of one transaction per market.
+Gas is estimated per operation kind and cached, so estimating a batch of
+fifty redeems costs no extra RPC round trips.
+
+LocalChain is an in-process stand-in for the chain (balances, gas
+estimates, atomic multicall) used without an RPC endpoint.
+"""
+
+import itertools
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, NamedTuple
+
+KINDS = ("split", "merge", "redeem")
+
+
+class Operation(NamedTuple):
+    kind: str        # "split" / "merge" / "redeem"
+    market_id: str
+    amount: float    # USDC for split, pairs for merge, tokens for redeem
+
+
+class OperationsProgress(NamedTuple):
+    stage: str       # "sending" / "confirmed" / "failed" / "done", or "gas" when estimates refresh
+    done: int        # Batches finished
+    total: int       # Batches in this run
+    message: str
+
+
+class ChainError(Exception):
+    """A call or transaction reverted."""
+
+
+class GasEstimator:
+    """
+    Per-kind gas estimates, cached for `ttl` seconds.
+
+    A batch costs the multicall overhead plus the sum of its calls, which
+    is what the chain reports for a batch within a few percent.
+    """
+
+    def __init__(self, chain: "LocalChain", ttl: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        self._chain = chain
+        self._ttl = ttl
+        self._clock = clock
+        self._cache: dict[str, tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def peek(self, kind: str) -> int | None:
+        """Cached estimate without touching the chain (None if stale or missing)."""
+        with self._lock:
+            cached = self._cache.get(kind)
+        if cached is None or self._clock() - cached[0] >= self._ttl:
+            return None
+        return cached[1]
+
+    def per_call(self, kind: str) -> int:
+        now = self._clock()
+        with self._lock:
+            cached = self._cache.get(kind)
+            if cached is not None and now - cached[0] < self._ttl:
+                return cached[1]
+        gas = self._chain.estimate_gas([Operation(kind, "", 1.0)]) - self._chain.MULTICALL_GAS
+        with self._lock:
+            self._cache[kind] = (now, gas)
+        return gas
+
+    def estimate(self, ops: list[Operation]) -> int:
+        return self._chain.MULTICALL_GAS + sum(self.per_call(op.kind) for op in ops)
+
+
+class OperationsQueue:
+    """
+    Collects operations and submits them in multicall batches.
+
+    `submit()` runs on a worker thread and reports through `on_progress`
+    (from that thread). Batches are atomic: a revert fails the batch and
+    leaves its operations queued for another try. Gas estimates that are
+    missing or stale are fetched on the same thread, followed by a "gas"
+    progress report so the caller can redraw `estimate_gas()`.
+    """
+
+    def __init__(self, chain: "LocalChain", on_progress: Callable[[OperationsProgress], None] | None = None,
+                 max_batch: int = 50, gas_price_gwei: float = 30.0, executor: Executor | None = None):
+        self._chain = chain
+        self.gas = GasEstimator(chain)
+        self.on_progress = on_progress
+        self.max_batch = max_batch
+        self.gas_price_gwei = gas_price_gwei
+        self._executor = executor or ThreadPoolExecutor(1, thread_name_prefix="operations")
+        self._lock = threading.Lock()
+        self._ops: list[Operation] = []
+        self.busy = False
+        # Kinds whose estimate is being fetched
+        self._estimating: set[str] = set()
+        # Fill the gas cache off the caller's thread
+        self._refresh_gas(list(KINDS))
+
+    @property
+    def ops(self) -> list[Operation]:
+        with self._lock:
+            return list(self._ops)
+
+    def add(self, op: Operation):
+        if op.kind not in KINDS:
+            raise ValueError(f"unknown operation: {op.kind}")
+        if op.amount <= 0:
+            raise ValueError("amount must be positive")
+        with self._lock:
+            self._ops.append(op)
+
+    def remove(self, index: int):
+        with self._lock:
+            del self._ops[index]
+
+    def clear(self):
+        with self._lock:
+            self._ops.clear()
+
+    def estimate_gas(self) -> int | None:
+        """
+        Total gas for the queued operations (all batches), from cached
+        per-kind estimates only. None while an estimate is missing or
+        stale; it is fetched in the background and reported as "gas".
+        """
+        ops = self.ops
+        per_kind = {kind: self.gas.peek(kind) for kind in {op.kind for op in ops}}
+        missing = [kind for kind, gas in per_kind.items() if gas is None]
+        if missing:
+            self._refresh_gas(missing)
+            return None
+        batches = -(-len(ops) // self.max_batch)
+        return batches * self._chain.MULTICALL_GAS + sum(per_kind[op.kind] for op in ops)
+
+    def _refresh_gas(self, kinds: list[str]):
+        with self._lock:
+            kinds = [kind for kind in kinds if kind not in self._estimating]
+            self._estimating.update(kinds)
+        if kinds:
+            self._executor.submit(self._estimate_kinds, kinds)
+
+    def _estimate_kinds(self, kinds: list[str]):
+        try:
+            for kind in kinds:
+                self.gas.per_call(kind)
+        finally:
+            with self._lock:
+                self._estimating.difference_update(kinds)
+        self._report("gas", 0, 0, "Gas estimates updated")
+
+    def submit(self) -> bool:
+        """Send everything queued; False if a run is already in progress or nothing is queued."""
+        with self._lock:
+            if self.busy or not self._ops:
+                return False
+            self.busy = True
+            ops = list(self._ops)
+        self._executor.submit(self._run, ops)
+        return True
+
+    def _report(self, stage: str, done: int, total: int, message: str):
+        if self.on_progress is not None:
+            self.on_progress(OperationsProgress(stage, done, total, message))
+
+    def _run(self, ops: list[Operation]):
+        batches = [ops[i:i + self.max_batch] for i in range(0, len(ops), self.max_batch)]
+        total = len(batches)
+        failed = 0
+        try:
+            for done, batch in enumerate(batches):
+                gas = self.gas.estimate(batch)
+                fee = gas * self.gas_price_gwei * 1e-9
+                self._report("sending", done, total,
+                             f"Batch {done + 1}/{total}: {len(batch)} ops, ~{gas:,} gas ({fee:.5f} native)")
+                try:
+                    tx_hash = self._chain.send_multicall(batch, gas_limit=int(gas * 1.2))
+                except ChainError as exc:
+                    failed += 1
+                    self._report("failed", done + 1, total, f"Batch {done + 1}/{total} reverted: {exc}")
+                    continue
+                with self._lock:
+                    for op in batch:
+                        self._ops.remove(op)
+                self._report("confirmed", done + 1, total, f"Batch {done + 1}/{total} confirmed: {tx_hash}")
+        finally:
+            with self._lock:
+                self.busy = False
+        self._report("done", total, total,
+                     f"{total - failed}/{total} batches confirmed" + (f", {failed} failed" if failed else ""))
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class LocalChain:
+    """
+    In-process chain stand-in holding USDC and outcome-token balances.
+
+    `resolved` maps market id -> winning outcome for redeem. Multicalls are
+    applied atomically and `latency` simulates block inclusion.
+    """
+
+    MULTICALL_GAS = 40_000
+    CALL_GAS = {"split": 120_000, "merge": 110_000, "redeem": 90_000}
+
+    def __init__(self, usdc: float = 10_000.0, latency: float = 0.05):
+        self.latency = latency
+        self.usdc = usdc
+        # market id -> {"YES": amount, "NO": amount}
+        self.tokens: dict[str, dict[str, float]] = {}
+        self.resolved: dict[str, str] = {}
+        self.estimate_calls = 0
+        self._tx_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def estimate_gas(self, ops: list[Operation]) -> int:
+        time.sleep(self.latency / 5)
+        with self._lock:
+            self.estimate_calls += 1
+        return self.MULTICALL_GAS + sum(self.CALL_GAS[op.kind] for op in ops)
+
+    def send_multicall(self, ops: list[Operation], gas_limit: int) -> str:
+        time.sleep(self.latency)
+        with self._lock:
+            if gas_limit < self.MULTICALL_GAS + sum(self.CALL_GAS[op.kind] for op in ops):
+                raise ChainError("out of gas")
+            # Apply to copies so a revert leaves state untouched
+            usdc = self.usdc
+            tokens = {market: dict(balance) for market, balance in self.tokens.items()}
+            for op in ops:
+                balance = tokens.setdefault(op.market_id, {"YES": 0.0, "NO": 0.0})
+                if op.kind == "split":
+                    if usdc < op.amount:
+                        raise ChainError(f"split {op.market_id}: insufficient USDC")
+                    usdc -= op.amount
+                    balance["YES"] += op.amount
+                    balance["NO"] += op.amount
+                elif op.kind == "merge":
+                    if min(balance["YES"], balance["NO"]) < op.amount:
+                        raise ChainError(f"merge {op.market_id}: insufficient pairs")
+                    balance["YES"] -= op.amount
+                    balance["NO"] -= op.amount
+                    usdc += op.amount
+                else:
+                    winner = self.resolved.get(op.market_id)
+                    if winner is None:
+                        raise ChainError(f"redeem {op.market_id}: market not resolved")
+                    if balance[winner] < op.amount:
+                        raise ChainError(f"redeem {op.market_id}: insufficient tokens")
+                    balance[winner] -= op.amount
+                    usdc += op.amount
+            self.usdc = usdc
+            self.tokens = tokens
+            return f"0x{next(self._tx_ids):064x}"
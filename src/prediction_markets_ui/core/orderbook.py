@@ -0,0 +1,240 @@
+"""Order book engine - one canonical book per market plus derived views."""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from typing import Iterable, Iterator
+
+# Prices are stored as integer ticks of 1/PRICE_SCALE so that mirroring
+# (1 - p) and cross-venue merging are exact.
+PRICE_SCALE = 10_000
+
+Level = tuple[int, float]  # (price ticks, size in shares)
+
+
+def to_ticks(price: float) -> int:
+    """Convert a probability price (0..1) to integer ticks."""
+    return round(price * PRICE_SCALE)
+
+
+def from_ticks(ticks: int) -> float:
+    """Convert integer ticks back to a probability price."""
+    return ticks / PRICE_SCALE
+
+
+class BookSide:
+    """One side of a book: size per price tick, iterated best-first."""
+
+    __slots__ = ("descending", "_sizes", "_ticks")
+
+    def __init__(self, descending: bool):
+        self.descending = descending  # True for bids (highest price is best)
+        self._sizes: dict[int, float] = {}
+        self._ticks: list[int] = []  # always ascending
+
+    def __len__(self) -> int:
+        return len(self._ticks)
+
+    def set(self, tick: int, size: float):
+        """Set the resting size at a tick (size <= 0 removes the level)."""
+        if size <= 0:
+            if self._sizes.pop(tick, None) is not None:
+                del self._ticks[bisect_left(self._ticks, tick)]
+            return
+        if tick not in self._sizes:
+            insort(self._ticks, tick)
+        self._sizes[tick] = size
+
+    def replace(self, levels: Iterable[Level]):
+        """Replace all levels at once."""
+        self._sizes = {tick: size for tick, size in levels if size > 0}
+        self._ticks = sorted(self._sizes)
+
+    def size_at(self, tick: int) -> float:
+        return self._sizes.get(tick, 0.0)
+
+    def best(self) -> int | None:
+        """Best price tick, or None if the side is empty."""
+        if not self._ticks:
+            return None
+        return self._ticks[-1] if self.descending else self._ticks[0]
+
+    def levels(self) -> Iterator[Level]:
+        """Iterate (tick, size) from best to worst."""
+        sizes = self._sizes
+        ticks = reversed(self._ticks) if self.descending else self._ticks
+        for tick in ticks:
+            yield tick, sizes[tick]
+
+
+class MirroredSide:
+    """Read-only view of a BookSide with every price mapped to 1 - p."""
+
+    __slots__ = ("_side",)
+
+    def __init__(self, side: BookSide):
+        self._side = side
+
+    @property
+    def descending(self) -> bool:
+        return not self._side.descending
+
+    def __len__(self) -> int:
+        return len(self._side)
+
+    def size_at(self, tick: int) -> float:
+        return self._side.size_at(PRICE_SCALE - tick)
+
+    def best(self) -> int | None:
+        tick = self._side.best()
+        return None if tick is None else PRICE_SCALE - tick
+
+    def levels(self) -> Iterator[Level]:
+        # Mirroring flips price order, so the source's best-first order is
+        # still best-first here.
+        for tick, size in self._side.levels():
+            yield PRICE_SCALE - tick, size
+
+
+class BookView(ABC):
+    """Read API shared by canonical books and their complementary views."""
+
+    __slots__ = ()
+
+    market_id: str
+    bids: BookSide | MirroredSide
+    asks: BookSide | MirroredSide
+
+    @property
+    @abstractmethod
+    def version(self) -> int:
+        """Incremented on every change; used by views to skip redundant redraws."""
+
+    def best_bid(self) -> float | None:
+        tick = self.bids.best()
+        return None if tick is None else from_ticks(tick)
+
+    def best_ask(self) -> float | None:
+        tick = self.asks.best()
+        return None if tick is None else from_ticks(tick)
+
+    def spread(self) -> float | None:
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return from_ticks(ask - bid)
+
+    def mid(self) -> float | None:
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return from_ticks(bid + ask) / 2
+
+
+class OrderBook(BookView):
+    """
+    Canonical book for one market, quoted in the YES outcome.
+
+    The NO book is never stored; `complement()` returns a view that mirrors
+    this book on the fly.
+    """
+
+    __slots__ = ("market_id", "bids", "asks", "_version", "_complement", "verified", "placeholder")
+
+    def __init__(self, market_id: str):
+        self.market_id = market_id
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        self._version = 0
+        self._complement: ComplementView | None = None
+        # False while the book may have drifted from the venue's (failed
+        # checksum or dropped messages) and no fresh snapshot has arrived yet
+        self.verified = True
+        # True while the book holds made-up levels shown until real data
+        # arrives; the next snapshot clears it
+        self.placeholder = False
+
+    @property
+    def version(self) -> int:
+        """Incremented on every change; used by views to skip redundant redraws."""
+        return self._version
+
+    def is_empty(self) -> bool:
+        return not self.bids and not self.asks
+
+    def apply_snapshot(self, bids: Iterable[Level], asks: Iterable[Level]):
+        """Replace the whole book."""
+        self.bids.replace(bids)
+        self.asks.replace(asks)
+        self.placeholder = False
+        self._version += 1
+
+    def apply_change(self, side: str, tick: int, size: float):
+        """Apply a single level update. `side` is "BUY" (bids) or "SELL" (asks)."""
+        book_side = self.bids if side == "BUY" else self.asks
+        book_side.set(tick, size)
+        self._version += 1
+
+    def complement(self) -> "ComplementView":
+        """The NO-outcome view of this book (no copy, always up to date)."""
+        if self._complement is None:
+            self._complement = ComplementView(self)
+        return self._complement
+
+    def view(self, outcome: str) -> BookView:
+        """Book as seen from the given outcome ("YES" or "NO")."""
+        return self if outcome == "YES" else self.complement()
+
+
+class ComplementView(BookView):
+    """
+    NO-outcome book derived from the YES book.
+
+    Buying NO at 1 - p is selling YES at p, so NO bids are the mirrored YES
+    asks and NO asks are the mirrored YES bids.
+    """
+
+    __slots__ = ("_book", "market_id", "bids", "asks")
+
+    def __init__(self, book: OrderBook):
+        self._book = book
+        self.market_id = book.market_id
+        self.bids = MirroredSide(book.asks)
+        self.asks = MirroredSide(book.bids)
+
+    @property
+    def version(self) -> int:
+        return self._book.version
+
+
+class BookEngine:
+    """Owns the canonical book of every subscribed market."""
+
+    def __init__(self):
+        self._books: dict[str, OrderBook] = {}
+
+    def __len__(self) -> int:
+        return len(self._books)
+
+    def __contains__(self, market_id: str) -> bool:
+        return market_id in self._books
+
+    def book(self, market_id: str) -> OrderBook:
+        """Get the canonical book for a market, creating an empty one if needed."""
+        book = self._books.get(market_id)
+        if book is None:
+            book = self._books[market_id] = OrderBook(market_id)
+        return book
+
+    def view(self, market_id: str, outcome: str = "YES") -> BookView:
+        """Book for a market as seen from the given outcome."""
+        return self.book(market_id).view(outcome)
+
+    def apply_snapshot(self, market_id: str, bids: Iterable[Level], asks: Iterable[Level]):
+        self.book(market_id).apply_snapshot(bids, asks)
+
+    def apply_change(self, market_id: str, side: str, tick: int, size: float):
+        self.book(market_id).apply_change(side, tick, size)
+
+    def remove(self, market_id: str):
+        """Forget a market's book (e.g. after unsubscribing)."""
+        self._books.pop(market_id, None)
@@ -0,0 +1,336 @@
+"""Order submission pipeline: sign and send off the caller's thread.
+
+The pipeline is venue-agnostic. A signer turns an OrderRequest into the
+venue payload (EIP-712 for Polymarket) and a transport posts it, ideally
+over one keep-alive session shared by all workers. Results come back
+through a callback on a worker thread; UI code must marshal them to its
+own thread (MainWindow does so through a Qt signal).
+
+LocalSigner and LocalExchange are stand-ins for running without keys or
+network access.
+"""
+
+import hashlib
+import hmac
+import itertools
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from statistics import median
+from typing import Callable, NamedTuple
+
+from prediction_markets_ui.core.scheduler import RateLimited, RequestScheduler
+
+
+class OrderRequest(NamedTuple):
+    market_id: str
+    side: str           # "BUY" / "SELL"
+    outcome: str        # "YES" / "NO"
+    order_type: str     # "LIMIT" / "MARKET"
+    size: float         # Shares
+    price: float | None  # None for MARKET orders
+    client_id: str = ""
+
+
+class CancelRequest(NamedTuple):
+    """
+    One batched cancel call.
+
+    `order_ids` are the orders the caller expects to be affected. With
+    `market_id` or `cancel_all` the venue's market-wide / account-wide
+    endpoint is used instead of listing ids.
+    """
+
+    order_ids: tuple[str, ...] = ()
+    market_id: str | None = None
+    cancel_all: bool = False
+    request_id: str = ""
+
+
+class CancelResult(NamedTuple):
+    request_id: str
+    canceled: list[str]
+    not_canceled: dict[str, str]  # order id -> reason
+    error: str                    # Whole call failed (nothing canceled)
+    latency_ms: float
+
+
+class OrderAck(NamedTuple):
+    client_id: str
+    accepted: bool
+    order_id: str
+    reason: str
+    sign_ms: float
+    latency_ms: float   # submit() to ack, including queueing and signing
+
+
+Signer = Callable[[OrderRequest], dict]
+Transport = Callable[[dict], dict]
+# Called as canceler(order_ids=..., market_id=..., cancel_all=...)
+Canceler = Callable[..., dict]
+
+
+class OrderPipeline:
+    """
+    Signs and submits orders on a pre-warmed worker pool.
+
+    `submit()` returns at once with the request's client id filled in; the
+    ack (or reject) arrives later through `on_result`. Any exception from
+    the signer or transport becomes a reject rather than being lost in the
+    pool. With a `scheduler`, the transport call is queued as an "order"
+    request so it shares the venue's rate limits with everything else;
+    workers only sign and never wait on the scheduler.
+
+    Cancels go out as one call per CancelRequest, however many orders it
+    covers, and are queued at cancel priority.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, signer: Signer, transport: Transport,
+                 on_result: Callable[[OrderAck], None] | None = None,
+                 workers: int = 2, executor: Executor | None = None,
+                 history: int = 500, scheduler: RequestScheduler | None = None,
+                 canceler: Canceler | None = None,
+                 on_cancel: Callable[[CancelResult], None] | None = None):
+        self._signer = signer
+        self._transport = transport
+        self._scheduler = scheduler
+        self._canceler = canceler
+        self.on_result = on_result
+        self.on_cancel = on_cancel
+        self._executor = executor or ThreadPoolExecutor(workers, thread_name_prefix="order")
+        # Cancels without a scheduler; built on first use
+        self._cancel_executor: ThreadPoolExecutor | None = None
+        self._latencies: deque[float] = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+
+        # Start the workers (and any signer setup) before the first order
+        warm = getattr(signer, "warm", None)
+        for _ in range(workers):
+            self._executor.submit(warm or (lambda: None))
+
+    def submit(self, request: OrderRequest) -> OrderRequest:
+        if not request.client_id:
+            request = request._replace(client_id=f"c{next(self._ids)}")
+        with self._lock:
+            self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            task = self._executor.submit(self._run, request, started)
+        except RuntimeError as exc:  # Submitted after close()
+            self._ack(request, started, 0.0, exc=exc)
+            return request
+        # Orders still queued when close() cancels them are rejected, not lost
+        task.add_done_callback(
+            lambda t: t.cancelled() and self._ack(request, started, 0.0, exc=RuntimeError("order pipeline closed"))
+        )
+        return request
+
+    def _run(self, request: OrderRequest, started: float):
+        """Sign on the worker; the send is queued on the scheduler, never waited on."""
+        sign_ms = 0.0
+        try:
+            t0 = time.perf_counter()
+            payload = self._signer(request)
+            sign_ms = (time.perf_counter() - t0) * 1000
+            if self._scheduler is not None:
+                future = self._scheduler.submit("order", self._transport, payload)
+                future.add_done_callback(lambda f: self._finish(request, started, sign_ms, f))
+                return
+            response = self._transport(payload)
+        except Exception as exc:
+            self._ack(request, started, sign_ms, exc=exc)
+            return
+        self._ack(request, started, sign_ms, response)
+
+    def _finish(self, request: OrderRequest, started: float, sign_ms: float, future: Future):
+        try:
+            response = future.result()
+        except BaseException as exc:  # Includes CancelledError
+            self._ack(request, started, sign_ms, exc=exc)
+            return
+        self._ack(request, started, sign_ms, response)
+
+    def _ack(self, request: OrderRequest, started: float, sign_ms: float,
+             response: dict | None = None, exc: BaseException | None = None):
+        if exc is None:
+            accepted = bool(response.get("success"))
+            order_id = response.get("orderID", "")
+            reason = response.get("errorMsg", "")
+        else:
+            accepted, order_id, reason = False, "", str(exc) or type(exc).__name__
+
+        latency_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self.in_flight -= 1
+            self._latencies.append(latency_ms)
+        if self.on_result is not None:
+            self.on_result(OrderAck(request.client_id, accepted, order_id, reason, sign_ms, latency_ms))
+
+    def cancel(self, request: CancelRequest) -> CancelRequest:
+        """
+        Send one batched cancel; the result arrives through `on_cancel`.
+
+        Cancels skip the order workers: with a scheduler they are queued at
+        cancel priority straight away, otherwise they run on their own
+        worker, so they never wait behind placements.
+        """
+        if not request.request_id:
+            request = request._replace(request_id=f"x{next(self._ids)}")
+        started = time.perf_counter()
+        kwargs = {"cancel_all": True} if request.cancel_all else (
+            {"market_id": request.market_id} if request.market_id else {"order_ids": list(request.order_ids)}
+        )
+        if self._canceler is None:
+            self._cancel_done(request, started, exc=RuntimeError("cancels are not supported by this venue"))
+        elif self._scheduler is not None:
+            try:
+                future = self._scheduler.submit("cancel", self._canceler, **kwargs)
+            except Exception as exc:
+                self._cancel_done(request, started, exc=exc)
+            else:
+                future.add_done_callback(lambda f: self._finish_cancel(request, started, f))
+        else:
+            if self._cancel_executor is None:
+                self._cancel_executor = ThreadPoolExecutor(1, thread_name_prefix="cancel")
+            try:
+                task = self._cancel_executor.submit(self._run_cancel, request, started, kwargs)
+            except RuntimeError as exc:  # Submitted after close()
+                self._cancel_done(request, started, exc=exc)
+            else:
+                task.add_done_callback(
+                    lambda t: t.cancelled() and self._cancel_done(
+                        request, started, exc=RuntimeError("order pipeline closed"))
+                )
+        return request
+
+    def _run_cancel(self, request: CancelRequest, started: float, kwargs: dict):
+        try:
+            response = self._canceler(**kwargs)
+        except Exception as exc:
+            self._cancel_done(request, started, exc=exc)
+            return
+        self._cancel_done(request, started, response)
+
+    def _finish_cancel(self, request: CancelRequest, started: float, future: Future):
+        try:
+            response = future.result()
+        except BaseException as exc:  # Includes CancelledError
+            self._cancel_done(request, started, exc=exc)
+            return
+        self._cancel_done(request, started, response)
+
+    def _cancel_done(self, request: CancelRequest, started: float,
+                     response: dict | None = None, exc: BaseException | None = None):
+        canceled, not_canceled, error = [], {}, ""
+        if exc is None:
+            canceled = list(response.get("canceled", []))
+            not_canceled = dict(response.get("not_canceled", {}))
+        else:
+            error = str(exc) or type(exc).__name__
+        if self.on_cancel is not None:
+            latency_ms = (time.perf_counter() - started) * 1000
+            self.on_cancel(CancelResult(request.request_id, canceled, not_canceled, error, latency_ms))
+
+    def latency_stats(self) -> dict[str, float]:
+        """p50/p95/max submit-to-ack latency (ms) over recent orders."""
+        with self._lock:
+            samples = sorted(self._latencies)
+        if not samples:
+            return {}
+        return {
+            "p50": median(samples),
+            "p95": samples[min(int(len(samples) * 0.95), len(samples) - 1)],
+            "max": samples[-1],
+        }
+
+    def close(self):
+        """Stop the workers; orders and cancels that haven't started fail through the callbacks."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._cancel_executor is not None:
+            self._cancel_executor.shutdown(wait=False, cancel_futures=True)
+
+
+class LocalSigner:
+    """Deterministic stand-in for EIP-712 order signing (HMAC over the order)."""
+
+    def __init__(self, key: bytes = b"local-dev-key"):
+        self._key = key
+
+    def warm(self):
+        self(OrderRequest("", "BUY", "YES", "LIMIT", 1.0, 0.5))
+
+    def __call__(self, request: OrderRequest) -> dict:
+        order = request._asdict()
+        digest = hashlib.sha3_256(json.dumps(order, sort_keys=True).encode()).digest()
+        order["signature"] = "0x" + hmac.new(self._key, digest, hashlib.sha256).hexdigest()
+        return order
+
+
+class LocalExchange:
+    """
+    In-process exchange stand-in that accepts well-formed orders.
+
+    Responses follow the CLOB shape ({"success", "orderID", "errorMsg"}).
+    `latency` simulates the network round trip; with `max_per_second`,
+    requests beyond that rate fail with RateLimited like a 429.
+    """
+
+    def __init__(self, latency: float = 0.02, max_per_second: int | None = None):
+        self.latency = latency
+        self.max_per_second = max_per_second
+        self.orders: dict[str, dict] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._window: deque[float] = deque()
+
+    def _throttle(self):
+        if self.max_per_second is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            window = self._window
+            while window and window[0] <= now - 1.0:
+                window.popleft()
+            if len(window) >= self.max_per_second:
+                raise RateLimited(retry_after=window[0] + 1.0 - now)
+            window.append(now)
+
+    def __call__(self, payload: dict) -> dict:
+        time.sleep(self.latency)
+        self._throttle()
+        if not payload.get("signature"):
+            return {"success": False, "errorMsg": "missing signature"}
+        if payload["size"] <= 0:
+            return {"success": False, "errorMsg": "invalid size"}
+        price = payload["price"]
+        if price is not None and not 0 < price < 1:
+            return {"success": False, "errorMsg": "price out of range"}
+        with self._lock:
+            order_id = f"0x{next(self._ids):064x}"
+            self.orders[order_id] = payload
+        return {"success": True, "orderID": order_id}
+
+    def cancel(self, order_ids: list[str] | None = None, market_id: str | None = None,
+               cancel_all: bool = False) -> dict:
+        """Cancel listed orders, a market's orders or all orders in one round trip."""
+        time.sleep(self.latency)
+        self._throttle()
+        with self._lock:
+            if cancel_all:
+                targets = list(self.orders)
+            elif market_id is not None:
+                targets = [oid for oid, order in self.orders.items() if order["market_id"] == market_id]
+            else:
+                targets = order_ids or []
+            canceled, not_canceled = [], {}
+            for order_id in targets:
+                if self.orders.pop(order_id, None) is None:
+                    not_canceled[order_id] = "order not found"
+                else:
+                    canceled.append(order_id)
+        return {"canceled": canceled, "not_canceled": not_canceled}
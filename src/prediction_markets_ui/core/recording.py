@@ -0,0 +1,201 @@
+"""Recording and replay of raw market-data frames.
+
+`FrameRecorder` appends every raw frame handed to the ingestor, with its
+receive time, to an append-only file. `Replayer` reads a recording back
+and feeds the frames through the same `Ingestor.submit()` path at the
+recorded pace, N times faster, or as fast as possible, so a bad day on
+the feeds can be reproduced deterministically.
+
+Layout (little-endian):
+    magic "PMRF", u16 version
+    records: u8 kind, u8 venue, u32 length, f8 receive time, payload[length]
+Kind 0 is a frame. Kind 1 declares a venue: `venue` is its index and the
+payload its name, and it precedes the first frame using that index. Each
+recorder declares its venues again, so recordings can be appended to.
+A truncated last record (crash mid-write) is ignored on read.
+"""
+
+import os
+import struct
+import threading
+import time
+from typing import BinaryIO, Callable, Iterator, NamedTuple
+
+from prediction_markets_ui.core.venues import VenueAdapter
+
+MAGIC = b"PMRF"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sH")
+_RECORD = struct.Struct("<BBId")
+_FRAME, _VENUE = 0, 1
+
+
+class RecordedFrame(NamedTuple):
+    received_at: float  # Seconds since the epoch
+    venue: str
+    frame: bytes
+
+
+class FrameRecorder:
+    """
+    Appends raw frames to a recording. Thread-safe; `record()` only packs a
+    header and writes into a buffer, so it is cheap enough to call from the
+    feed reader threads.
+    """
+
+    def __init__(self, path: str, buffer_size: int = 1 << 16):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._file: BinaryIO | None = open(path, "ab", buffering=buffer_size)
+        if self._file.tell() == 0:
+            self._file.write(_HEADER.pack(MAGIC, VERSION))
+        self._venues: dict[str, int] = {}
+        self.frames = 0
+        self.bytes = 0
+
+    def record(self, venue: str, frame: bytes | str, received_at: float | None = None):
+        if isinstance(frame, str):
+            frame = frame.encode()
+        if received_at is None:
+            received_at = time.time()
+        with self._lock:
+            f = self._file
+            if f is None:
+                return
+            index = self._venues.get(venue)
+            if index is None:
+                index = self._venues[venue] = len(self._venues)
+                name = venue.encode()
+                f.write(_RECORD.pack(_VENUE, index, len(name), received_at))
+                f.write(name)
+            f.write(_RECORD.pack(_FRAME, index, len(frame), received_at))
+            f.write(frame)
+            self.frames += 1
+            self.bytes += _RECORD.size + len(frame)
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def read_frames(path: str) -> Iterator[RecordedFrame]:
+    """Frames of a recording in order; raises ValueError if it isn't one."""
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size or header[:4] != MAGIC:
+            raise ValueError("not a frame recording")
+        (version,) = struct.unpack_from("<H", header, 4)
+        if version != VERSION:
+            raise ValueError(f"unsupported recording version {version}")
+        venues: dict[int, str] = {}
+        while True:
+            head = f.read(_RECORD.size)
+            if len(head) < _RECORD.size:
+                return
+            kind, index, length, received_at = _RECORD.unpack(head)
+            payload = f.read(length)
+            if len(payload) < length:
+                return
+            if kind == _VENUE:
+                venues[index] = payload.decode()
+            elif kind == _FRAME:
+                yield RecordedFrame(received_at, venues[index], payload)
+
+
+def recorded_markets(path: str, adapters: dict[str, VenueAdapter]) -> dict[tuple[str, str], int]:
+    """Message count per (venue, venue market) in a recording, in first-seen order."""
+    counts: dict[tuple[str, str], int] = {}
+    for record in read_frames(path):
+        adapter = adapters.get(record.venue)
+        if adapter is None:
+            continue
+        try:
+            messages = adapter.decode(record.frame)
+        except ValueError:
+            continue
+        for msg in messages:
+            key = (record.venue, adapter.market_key(msg))
+            counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+class Replayer:
+    """
+    Feeds a recording into `submit` (normally `Ingestor.submit`).
+
+    `speed` scales the recorded gaps between frames: 1 replays in real
+    time, 10 ten times faster, and None (or 0) as fast as possible.
+    """
+
+    def __init__(self, path: str, submit: Callable[[str, bytes], None], speed: float | None = 1.0,
+                 on_done: Callable[[], None] | None = None):
+        self.path = path
+        self.submit = submit
+        self.speed = speed or None
+        self.on_done = on_done
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        # Progress
+        self.frames = 0
+        self.bytes = 0
+        self.elapsed = 0.0
+        self.max_behind_ms = 0.0  # Worst lag behind the scaled schedule
+        self.done = False
+
+    def run(self):
+        """Replay on the calling thread until the end or `stop()`."""
+        start = time.perf_counter()
+        first: float | None = None
+        for record in read_frames(self.path):
+            if self._stop.is_set():
+                break
+            if self.speed is not None:
+                if first is None:
+                    first = record.received_at
+                due = start + (record.received_at - first) / self.speed
+                wait = due - time.perf_counter()
+                if wait > 0:
+                    if self._stop.wait(wait):
+                        break
+                else:
+                    self.max_behind_ms = max(self.max_behind_ms, -wait * 1000)
+            self.submit(record.venue, record.frame)
+            self.frames += 1
+            self.bytes += len(record.frame)
+        self.elapsed = time.perf_counter() - start
+        self.done = True
+        if self.on_done is not None:
+            self.on_done()
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.run, name="replay", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def stats(self) -> dict:
+        elapsed = self.elapsed if self.done else 0.0
+        return {
+            "frames": self.frames,
+            "bytes": self.bytes,
+            "elapsed_s": elapsed,
+            "frames_per_s": self.frames / elapsed if elapsed else 0.0,
+            "max_behind_ms": self.max_behind_ms,
+        }
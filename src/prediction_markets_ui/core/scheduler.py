@@ -0,0 +1,271 @@
+"""Priority request scheduler with per-endpoint rate limits.
+
+Every REST call goes through one scheduler. Each endpoint class has its
+own token bucket, and queued calls are dispatched in strict priority order
+(cancels first, catalog last). A call only waits behind higher-priority
+calls of the same endpoint, so a catalog refresh never delays a cancel.
+Calls that fail with RateLimited (HTTP 429) are requeued at the front of
+their queue after an exponential backoff, during which the endpoint is
+paused.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import IntEnum
+from typing import Callable
+
+
+class Priority(IntEnum):
+    CANCEL = 0
+    PLACE = 1
+    POSITIONS = 2
+    MARKET_DATA = 3
+    CATALOG = 4
+
+
+class RateLimited(Exception):
+    """Raised by a transport when the venue answers 429."""
+
+    def __init__(self, retry_after: float | None = None):
+        super().__init__(f"rate limited (retry after {retry_after}s)" if retry_after else "rate limited")
+        self.retry_after = retry_after
+
+
+# Endpoint class -> (requests per second, burst)
+DEFAULT_LIMITS = {
+    "cancel": (50.0, 100),
+    "order": (50.0, 100),
+    "positions": (10.0, 20),
+    "book": (20.0, 40),
+    "catalog": (5.0, 10),
+}
+
+DEFAULT_PRIORITIES = {
+    "cancel": Priority.CANCEL,
+    "order": Priority.PLACE,
+    "positions": Priority.POSITIONS,
+    "book": Priority.MARKET_DATA,
+    "catalog": Priority.CATALOG,
+}
+
+
+class TokenBucket:
+    """Classic token bucket that can also be paused (after a 429)."""
+
+    __slots__ = ("rate", "burst", "tokens", "updated", "paused_until")
+
+    def __init__(self, rate: float, burst: int, now: float = 0.0):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = now
+        self.paused_until = 0.0
+
+    def ready_in(self, now: float) -> float:
+        """Seconds until a token is available (0 if one is now)."""
+        if now < self.paused_until:
+            return self.paused_until - now
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self):
+        self.tokens -= 1
+
+    def pause(self, until: float):
+        self.paused_until = max(self.paused_until, until)
+
+
+class _Call:
+    __slots__ = ("endpoint", "priority", "fn", "args", "kwargs", "future", "attempts")
+
+    def __init__(self, endpoint, priority, fn, args, kwargs):
+        self.endpoint = endpoint
+        self.priority = priority
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Future = Future()
+        self.attempts = 0
+
+
+class RequestScheduler:
+    """
+    Runs calls on a worker pool, respecting per-endpoint rate limits and
+    strict priorities.
+
+    `submit()` is thread-safe and returns a Future. `metrics()` reports
+    queue depths and retry counters.
+    """
+
+    def __init__(self, limits: dict[str, tuple[float, int]] = DEFAULT_LIMITS,
+                 priorities: dict[str, Priority] = DEFAULT_PRIORITIES,
+                 workers: int = 4, max_retries: int = 3, backoff: float = 0.5,
+                 clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        now = clock()
+        self._buckets = {name: TokenBucket(rate, burst, now) for name, (rate, burst) in limits.items()}
+        self._priorities = priorities
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+        # priority -> endpoint -> FIFO of calls
+        self._queues: list[dict[str, deque[_Call]]] = [{} for _ in Priority]
+        self._cond = threading.Condition()
+        self._closed = False
+        self._workers = workers
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="request")
+
+        # Metrics
+        self._queued = 0
+        self.max_queued = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.failed = 0
+
+        self._thread = threading.Thread(target=self._dispatch_loop, name="scheduler", daemon=True)
+        self._thread.start()
+
+    def submit(self, endpoint: str, fn: Callable, *args,
+               priority: Priority | None = None, **kwargs) -> Future:
+        """Queue `fn(*args, **kwargs)` as a call to `endpoint`."""
+        if endpoint not in self._buckets:
+            raise KeyError(f"unknown endpoint class: {endpoint}")
+        if priority is None:
+            priority = self._priorities.get(endpoint, Priority.CATALOG)
+        call = _Call(endpoint, priority, fn, args, kwargs)
+        with self._cond:
+            if self._closed:
+                call.future.set_exception(RuntimeError("scheduler closed"))
+                return call.future
+            self._enqueue(call)
+            self._cond.notify()
+        return call.future
+
+    def _enqueue(self, call: _Call, front: bool = False):
+        queue = self._queues[call.priority].setdefault(call.endpoint, deque())
+        if front:
+            queue.appendleft(call)
+        else:
+            queue.append(call)
+        self._queued += 1
+        self.max_queued = max(self.max_queued, self._queued)
+
+    # ---- Dispatch ----
+
+    def _next_call(self, now: float) -> tuple[_Call | None, float | None]:
+        """Highest-priority call whose endpoint has a token, else how long to wait."""
+        wait = None
+        blocked: set[str] = set()
+        for by_endpoint in self._queues:
+            for endpoint, queue in by_endpoint.items():
+                if not queue or endpoint in blocked:
+                    continue
+                delay = self._buckets[endpoint].ready_in(now)
+                if delay == 0.0:
+                    self._buckets[endpoint].take()
+                    self._queued -= 1
+                    return queue.popleft(), None
+                # Lower priorities must not overtake on this endpoint
+                blocked.add(endpoint)
+                wait = delay if wait is None else min(wait, delay)
+        return None, wait
+
+    def _dispatch_loop(self):
+        with self._cond:
+            while not self._closed:
+                if self.in_flight >= self._workers:
+                    # Keep calls here (in priority order) until a worker frees up
+                    self._cond.wait()
+                    continue
+                call, wait = self._next_call(self._clock())
+                if call is None:
+                    self._cond.wait(wait)
+                    continue
+                self.in_flight += 1
+                task = self._executor.submit(self._execute, call)
+                # A task cancelled by close() never runs; fail its call instead
+                task.add_done_callback(lambda task, call=call: task.cancelled() and self._abandon([call]))
+
+    def _execute(self, call: _Call):
+        try:
+            result = call.fn(*call.args, **call.kwargs)
+        except RateLimited as exc:
+            self._on_rate_limited(call, exc)
+            return
+        except Exception as exc:
+            with self._cond:
+                self.in_flight -= 1
+                self.failed += 1
+                self._cond.notify()
+            call.future.set_exception(exc)
+            return
+        with self._cond:
+            self.in_flight -= 1
+            self.completed += 1
+            self._cond.notify()
+        call.future.set_result(result)
+
+    def _on_rate_limited(self, call: _Call, exc: RateLimited):
+        call.attempts += 1
+        with self._cond:
+            self.in_flight -= 1
+            self.rate_limited += 1
+            self._cond.notify()
+            if self._closed:
+                self.failed += 1
+                exc = RuntimeError("scheduler closed")
+            elif call.attempts > self.max_retries:
+                self.failed += 1
+            else:
+                self.retries += 1
+                delay = self.backoff * 2 ** (call.attempts - 1) * (1 + random.random() * 0.25)
+                delay = max(delay, exc.retry_after or 0.0)
+                self._buckets[call.endpoint].pause(self._clock() + delay)
+                self._enqueue(call, front=True)
+                return
+        call.future.set_exception(exc)
+
+    # ---- Metrics ----
+
+    def metrics(self) -> dict:
+        with self._cond:
+            return {
+                "queued": {
+                    priority.name.lower(): sum(len(q) for q in self._queues[priority].values())
+                    for priority in Priority
+                },
+                "max_queued": self.max_queued,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "retries": self.retries,
+                "rate_limited": self.rate_limited,
+                "failed": self.failed,
+            }
+
+    def close(self):
+        """Stop dispatching; every call not yet run fails with RuntimeError."""
+        with self._cond:
+            self._closed = True
+            pending = [call for by_endpoint in self._queues for queue in by_endpoint.values() for call in queue]
+            for by_endpoint in self._queues:
+                by_endpoint.clear()
+            self._queued = 0
+            self._cond.notify()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._abandon(pending, dispatched=False)
+
+    def _abandon(self, calls: list[_Call], dispatched: bool = True):
+        """Fail calls that will never run because the scheduler closed."""
+        with self._cond:
+            if dispatched:
+                self.in_flight -= len(calls)
+            self.failed += len(calls)
+        for call in calls:
+            if not call.future.done():
+                call.future.set_exception(RuntimeError("scheduler closed"))
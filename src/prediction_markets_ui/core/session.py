@@ -0,0 +1,203 @@
+"""Workspace session persistence in a compact binary file.
+
+The session holds the open market tabs (with their selected outcome and
+last-seen book), the splitter sizes and the current tab. Saving is
+asynchronous and coalesced: `SessionStore.save()` only records the latest
+state, and a background thread encodes and writes it. The file is
+replaced atomically, so a crash mid-write leaves the previous session.
+
+Layout (little-endian):
+    magic "PMUS", u16 version, f8 saved_at, i4 current tab
+    u8 splitter count, per splitter: str name, u8 count, i4 sizes
+    u32 tab count, per tab: str market id, str title, u8 outcome (0 YES, 1 NO),
+        bids and asks as u32 count, i4 ticks[count], f8 sizes[count]
+    u32 CRC-32 of everything before it
+Strings are u16 length + UTF-8.
+"""
+
+import os
+import struct
+import threading
+import time
+import zlib
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+from prediction_markets_ui.core.orderbook import Level
+
+MAGIC = b"PMUS"
+VERSION = 1
+
+
+class TabState(NamedTuple):
+    market_id: str
+    title: str
+    outcome: str         # "YES" / "NO"
+    bids: list[Level]    # Last-seen book (YES-quoted), empty if none
+    asks: list[Level]
+
+
+class SessionState(NamedTuple):
+    tabs: list[TabState]
+    current: int                     # Index of the selected tab (-1 for none)
+    splitters: dict[str, list[int]]  # Splitter name -> sizes
+    saved_at: float = 0.0
+
+
+def encode(state: SessionState) -> bytes:
+    out = bytearray(MAGIC)
+    out += struct.pack("<Hdi", VERSION, state.saved_at or time.time(), state.current)
+    out += struct.pack("<B", len(state.splitters))
+    for name, sizes in state.splitters.items():
+        _put_str(out, name)
+        out += struct.pack("<B", len(sizes))
+        out += array("i", sizes).tobytes()
+    out += struct.pack("<I", len(state.tabs))
+    for tab in state.tabs:
+        _put_str(out, tab.market_id)
+        _put_str(out, tab.title)
+        out += struct.pack("<B", tab.outcome == "NO")
+        _put_levels(out, tab.bids)
+        _put_levels(out, tab.asks)
+    out += struct.pack("<I", zlib.crc32(out))
+    return bytes(out)
+
+
+def decode(data: bytes) -> SessionState:
+    """Parse a session file; raises ValueError if it is corrupt or from another version."""
+    if len(data) < 8 or data[:4] != MAGIC:
+        raise ValueError("not a session file")
+    body, (crc,) = data[:-4], struct.unpack_from("<I", data, len(data) - 4)
+    if zlib.crc32(body) != crc:
+        raise ValueError("session file is corrupt")
+    try:
+        reader = _Reader(body, 4)
+        version, saved_at, current = reader.unpack("<Hdi")
+        if version != VERSION:
+            raise ValueError(f"unsupported session version {version}")
+        splitters = {}
+        for _ in range(reader.unpack("<B")[0]):
+            name = reader.string()
+            splitters[name] = list(reader.array("i", reader.unpack("<B")[0]))
+        tabs = []
+        for _ in range(reader.unpack("<I")[0]):
+            market_id, title = reader.string(), reader.string()
+            outcome = "NO" if reader.unpack("<B")[0] else "YES"
+            tabs.append(TabState(market_id, title, outcome, reader.levels(), reader.levels()))
+    except struct.error as exc:
+        raise ValueError("session file is truncated") from exc
+    return SessionState(tabs, current, splitters, saved_at)
+
+
+def _put_str(out: bytearray, text: str):
+    raw = text.encode()
+    out += struct.pack("<H", len(raw))
+    out += raw
+
+
+def _put_levels(out: bytearray, levels: list[Level]):
+    out += struct.pack("<I", len(levels))
+    out += array("i", [tick for tick, _ in levels]).tobytes()
+    out += array("d", [size for _, size in levels]).tobytes()
+
+
+class _Reader:
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data: bytes, pos: int = 0):
+        self.data = data
+        self.pos = pos
+
+    def unpack(self, fmt: str) -> tuple:
+        values = struct.unpack_from(fmt, self.data, self.pos)
+        self.pos += struct.calcsize(fmt)
+        return values
+
+    def string(self) -> str:
+        (length,) = self.unpack("<H")
+        end = self.pos + length
+        if end > len(self.data):
+            raise struct.error("string past end of data")
+        text = self.data[self.pos:end].decode()
+        self.pos = end
+        return text
+
+    def array(self, typecode: str, count: int) -> array:
+        values = array(typecode)
+        end = self.pos + count * values.itemsize
+        if end > len(self.data):
+            raise struct.error("array past end of data")
+        values.frombytes(self.data[self.pos:end])
+        self.pos = end
+        return values
+
+    def levels(self) -> list[Level]:
+        (count,) = self.unpack("<I")
+        return list(zip(self.array("i", count), self.array("d", count)))
+
+
+class SessionStore:
+    """
+    Loads and saves the session file.
+
+    `save()` returns at once; the latest state is written by a background
+    thread and intermediate states are skipped. `flush()` writes
+    synchronously (on exit).
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._pending: SessionState | None = None
+        self._scheduled = False
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="session")
+        self.writes = 0
+        self.last_error: OSError | None = None
+
+    def load(self) -> SessionState | None:
+        """The saved session, or None if there is none or it can't be read."""
+        try:
+            with open(self.path, "rb") as f:
+                return decode(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def save(self, state: SessionState):
+        with self._lock:
+            self._pending = state
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._executor.submit(self._write_pending)
+
+    def _write_pending(self):
+        with self._lock:
+            state, self._pending = self._pending, None
+            self._scheduled = False
+        if state is not None:
+            self._write(state)
+
+    def _write(self, state: SessionState):
+        data = encode(state)
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self.path)
+        except OSError as exc:
+            # Losing the session isn't worth interrupting the user for
+            self.last_error = exc
+            return
+        self.writes += 1
+
+    def flush(self, state: SessionState | None = None):
+        """Write `state` (or whatever is pending) now and stop the writer."""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            state, self._pending = state or self._pending, None
+        if state is not None:
+            self._write(state)
@@ -0,0 +1,89 @@
+"""Recent trades per market in fixed-size ring buffers."""
+
+import numpy as np
+
+from prediction_markets_ui.core.orderbook import PRICE_SCALE, to_ticks
+
+# One compact record per trade (17 bytes)
+TRADE_DTYPE = np.dtype([("time", "f8"), ("tick", "i4"), ("size", "f4"), ("side", "i1")])
+
+# Side codes stored in the "side" field
+BUY = 1
+SELL = -1
+
+
+class TradeBuffer:
+    """
+    Last `capacity` trades of one market.
+
+    Storage is allocated once; new trades overwrite the oldest. Trades are
+    addressed by sequence number (0 = first trade ever seen), so readers can
+    pin a consistent window even while writes continue.
+    """
+
+    __slots__ = ("capacity", "_records", "total")
+
+    def __init__(self, capacity: int = 10_000):
+        self.capacity = capacity
+        self._records = np.zeros(capacity, dtype=TRADE_DTYPE)
+        self.total = 0  # Trades ever appended; next sequence number
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    def append(self, ts: float, price: float, size: float, side: str):
+        self._records[self.total % self.capacity] = (
+            ts, to_ticks(price), size, BUY if side == "BUY" else SELL
+        )
+        self.total += 1
+
+    def extend(self, times, prices, sizes, sides):
+        """Append a burst of trades (array-likes of equal length) at once."""
+        count = len(times)
+        if count == 0:
+            return
+        block = np.empty(count, dtype=TRADE_DTYPE)
+        block["time"] = times
+        block["tick"] = np.rint(np.asarray(prices, dtype=np.float64) * PRICE_SCALE)
+        block["size"] = sizes
+        block["side"] = [BUY if side == "BUY" else SELL for side in sides]
+        if count > self.capacity:
+            # Only the newest trades survive anyway
+            self.total += count - self.capacity
+            block = block[-self.capacity:]
+            count = self.capacity
+
+        start = self.total % self.capacity
+        first = min(count, self.capacity - start)
+        self._records[start:start + first] = block[:first]
+        self._records[:count - first] = block[first:]
+        self.total += count
+
+    def get(self, seq: int):
+        """Record with sequence number `seq`, or None if overwritten or not yet written."""
+        if seq < 0 or seq >= self.total or seq < self.total - self.capacity:
+            return None
+        return self._records[seq % self.capacity]
+
+    def clear(self):
+        self.total = 0
+
+
+class TradeEngine:
+    """Owns the trade buffer of every market that has traded."""
+
+    def __init__(self, capacity: int = 10_000):
+        self._capacity = capacity
+        self._buffers: dict[str, TradeBuffer] = {}
+
+    def trades(self, market_id: str) -> TradeBuffer:
+        buffer = self._buffers.get(market_id)
+        if buffer is None:
+            buffer = self._buffers[market_id] = TradeBuffer(self._capacity)
+        return buffer
+
+    def on_trade(self, market_id: str, ts: float, price: float, size: float, side: str):
+        self.trades(market_id).append(ts, price, size, side)
+
+    def remove(self, market_id: str):
+        self._buffers.pop(market_id, None)
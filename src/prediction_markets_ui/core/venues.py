@@ -0,0 +1,346 @@
+"""Venue adapters and the consolidated cross-venue book.
+
+Each adapter decodes one venue's raw frames into typed records (see
+`core.decoding`) and translates its book messages onto the common scale
+used by `core.orderbook`: YES-outcome probability in integer ticks of
+1/PRICE_SCALE and sizes in shares (contracts).
+"""
+
+import hashlib
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Iterator
+
+from prediction_markets_ui.core.decoding import (
+    FrameDecoder,
+    KalshiEvent,
+    PolyEvent,
+    kalshi_decoder,
+    polymarket_decoder,
+)
+
+from prediction_markets_ui.core.orderbook import (
+    PRICE_SCALE,
+    BookSide,
+    BookView,
+    Level,
+    OrderBook,
+    to_ticks,
+)
+
+Change = tuple[str, int, float]  # (side "BUY"/"SELL", tick, absolute size)
+Trade = tuple[float, float, float, str]  # (timestamp, YES price, size, taker side)
+
+
+class VenueAdapter(ABC):
+    """Maps a venue's native book messages onto the common tick scale."""
+
+    name = ""
+    # Native price increment, in common ticks
+    tick_size = 0
+    decoder: FrameDecoder
+
+    def decode(self, frame: bytes | str) -> list[Any]:
+        """Decode a raw frame into message records (ValueError if malformed)."""
+        return self.decoder.decode(frame)
+
+    @abstractmethod
+    def market_key(self, msg: Any) -> str:
+        """Venue-native market identifier of a message."""
+
+    @abstractmethod
+    def is_snapshot(self, msg: Any) -> bool:
+        """Whether a message replaces the whole book."""
+
+    @abstractmethod
+    def snapshot_levels(self, msg: Any) -> tuple[list[Level], list[Level]]:
+        """(bids, asks) of a snapshot message, YES-quoted."""
+
+    @abstractmethod
+    def changes(self, msg: Any, book: OrderBook) -> Iterator[Change]:
+        """Absolute level changes of an incremental message, YES-quoted."""
+
+    def trades(self, msg: Any) -> list[Trade]:
+        """Trades carried by a message, YES-quoted (most messages carry none)."""
+        return []
+
+    def verify(self, msg: Any, book: OrderBook) -> bool | None:
+        """
+        Check `book` (with `msg` applied) against the checksum the message
+        carries; None if the message carries none.
+        """
+        return None
+
+    def sequence(self, msg: Any) -> float | None:
+        """
+        Position of a message in the venue's stream (a timestamp or sequence
+        number), comparable between snapshots and deltas; None if unknown.
+
+        Deltas held during a resync are replayed from the snapshot's own
+        position on, since a timestamp can be shared by messages on both
+        sides of the snapshot. Venues whose deltas are relative must use
+        strictly increasing numbers here.
+        """
+        return None
+
+
+class PolymarketAdapter(VenueAdapter):
+    """
+    Polymarket CLOB market channel.
+
+    Prices are decimal strings in dollars (already 0..1), sizes are share
+    strings. Books are per outcome token; NO-token books are mirrored onto
+    the YES scale.
+    """
+
+    name = "Polymarket"
+    tick_size = PRICE_SCALE // 100
+
+    def __init__(self, no_tokens: Iterable[str] = ()):
+        self._no_tokens = set(no_tokens)
+        self.decoder = polymarket_decoder()
+
+    def market_key(self, msg: PolyEvent) -> str:
+        return msg.market
+
+    def is_snapshot(self, msg: PolyEvent) -> bool:
+        return msg.event_type == "book"
+
+    def snapshot_levels(self, msg: PolyEvent) -> tuple[list[Level], list[Level]]:
+        bids = [(to_ticks(float(lv.price)), float(lv.size)) for lv in msg.bids]
+        asks = [(to_ticks(float(lv.price)), float(lv.size)) for lv in msg.asks]
+        if msg.asset_id in self._no_tokens:
+            # NO bids are YES asks at 1 - p and vice versa
+            return _mirror(asks), _mirror(bids)
+        return bids, asks
+
+    def changes(self, msg: PolyEvent, book: OrderBook) -> Iterator[Change]:
+        for change in msg.price_changes:
+            side = change.side
+            tick = to_ticks(float(change.price))
+            if change.asset_id in self._no_tokens:
+                side = "SELL" if side == "BUY" else "BUY"
+                tick = PRICE_SCALE - tick
+            yield side, tick, float(change.size)
+
+    def trades(self, msg: PolyEvent) -> list[Trade]:
+        if msg.event_type != "last_trade_price":
+            return []
+        price, side = float(msg.price), msg.side
+        if msg.asset_id in self._no_tokens:
+            price, side = 1 - price, "SELL" if side == "BUY" else "BUY"
+        return [(int(msg.timestamp) / 1000, price, float(msg.size), side)]
+
+    def verify(self, msg: PolyEvent, book: OrderBook) -> bool | None:
+        # Each change carries the hash of its token's book after the change;
+        # the last one per token describes the book after the whole message
+        expected = {}
+        for change in msg.price_changes:
+            if change.hash:
+                expected[change.asset_id] = change.hash
+        if not expected:
+            return None
+        for asset_id, digest in expected.items():
+            view = book.complement() if asset_id in self._no_tokens else book
+            if book_hash(view.bids.levels(), view.asks.levels()) != digest:
+                return False
+        return True
+
+    def sequence(self, msg: PolyEvent) -> float | None:
+        return int(msg.timestamp) / 1000 if msg.timestamp else None
+
+
+class KalshiAdapter(VenueAdapter):
+    """
+    Kalshi orderbook channel.
+
+    Kalshi only publishes resting bids for each side, in cents. A NO bid at
+    c cents is a YES ask at 100 - c. Deltas carry a quantity change rather
+    than the new size, so they are resolved against the current book.
+    """
+
+    name = "Kalshi"
+    tick_size = PRICE_SCALE // 100
+
+    def __init__(self):
+        self.decoder = kalshi_decoder()
+
+    def market_key(self, msg: KalshiEvent) -> str:
+        return msg.msg.market_ticker
+
+    def is_snapshot(self, msg: KalshiEvent) -> bool:
+        return msg.type == "orderbook_snapshot"
+
+    def snapshot_levels(self, msg: KalshiEvent) -> tuple[list[Level], list[Level]]:
+        body = msg.msg
+        bids = [(self._cents(price), float(qty)) for price, qty in body.yes]
+        asks = [(PRICE_SCALE - self._cents(price), float(qty)) for price, qty in body.no]
+        return bids, asks
+
+    def changes(self, msg: KalshiEvent, book: OrderBook) -> Iterator[Change]:
+        body = msg.msg
+        if body.side == "yes":
+            side, tick = "BUY", self._cents(body.price)
+            current = book.bids.size_at(tick)
+        else:
+            side, tick = "SELL", PRICE_SCALE - self._cents(body.price)
+            current = book.asks.size_at(tick)
+        yield side, tick, max(current + float(body.delta), 0.0)
+
+    def trades(self, msg: KalshiEvent) -> list[Trade]:
+        if msg.type != "trade":
+            return []
+        body = msg.msg
+        side = "BUY" if body.taker_side == "yes" else "SELL"
+        return [(float(body.ts), body.yes_price / 100, float(body.count), side)]
+
+    @staticmethod
+    def _cents(price) -> int:
+        return round(float(price) * PRICE_SCALE / 100)
+
+
+def book_hash(bids: Iterable[Level], asks: Iterable[Level]) -> str:
+    """
+    SHA-1 of a book's levels ("price:size" best-first, bids then asks), as
+    compared against the hashes in Polymarket book messages.
+    """
+    bids = ",".join(f"{tick / PRICE_SCALE:g}:{size:g}" for tick, size in bids)
+    asks = ",".join(f"{tick / PRICE_SCALE:g}:{size:g}" for tick, size in asks)
+    return hashlib.sha1(f"{bids}|{asks}".encode()).hexdigest()
+
+
+def _mirror(levels: list[Level]) -> list[Level]:
+    return [(PRICE_SCALE - tick, size) for tick, size in levels]
+
+
+class ConsolidatedBook(BookView):
+    """
+    Merged depth of one market across venues.
+
+    Every venue keeps its own OrderBook. The merged sides are updated per
+    touched tick from the venues' sizes at that tick, so a single change
+    costs O(number of venues) rather than a rebuild.
+    """
+
+    __slots__ = ("market_id", "bids", "asks", "venues", "_version")
+
+    def __init__(self, market_id: str):
+        self.market_id = market_id
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        self.venues: dict[str, OrderBook] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def venue_book(self, venue: str) -> OrderBook:
+        book = self.venues.get(venue)
+        if book is None:
+            book = self.venues[venue] = OrderBook(f"{self.market_id}@{venue}")
+        return book
+
+    def apply_snapshot(self, venue: str, bids: Iterable[Level], asks: Iterable[Level]):
+        """Replace one venue's book and re-merge the ticks it touched."""
+        book = self.venue_book(venue)
+        touched_bids = {tick for tick, _ in book.bids.levels()}
+        touched_asks = {tick for tick, _ in book.asks.levels()}
+        book.apply_snapshot(bids, asks)
+        touched_bids.update(tick for tick, _ in book.bids.levels())
+        touched_asks.update(tick for tick, _ in book.asks.levels())
+        for tick in touched_bids:
+            self._merge("BUY", tick)
+        for tick in touched_asks:
+            self._merge("SELL", tick)
+        self._version += 1
+
+    def apply_change(self, venue: str, side: str, tick: int, size: float):
+        """Apply one venue's level change and re-merge that tick."""
+        self.venue_book(venue).apply_change(side, tick, size)
+        self._merge(side, tick)
+        self._version += 1
+
+    def _merge(self, side: str, tick: int):
+        if side == "BUY":
+            total = sum(book.bids.size_at(tick) for book in self.venues.values())
+            self.bids.set(tick, total)
+        else:
+            total = sum(book.asks.size_at(tick) for book in self.venues.values())
+            self.asks.set(tick, total)
+
+    def bbo(self) -> tuple[tuple[int, float, list[str]] | None, tuple[int, float, list[str]] | None]:
+        """Best bid and offer as (tick, total size, venues quoting it)."""
+        return self._top("BUY"), self._top("SELL")
+
+    def _top(self, side: str) -> tuple[int, float, list[str]] | None:
+        merged = self.bids if side == "BUY" else self.asks
+        tick = merged.best()
+        if tick is None:
+            return None
+        venues = [
+            name for name, book in self.venues.items()
+            if (book.bids if side == "BUY" else book.asks).size_at(tick) > 0
+        ]
+        return tick, merged.size_at(tick), venues
+
+    def depth(self, side: str, levels: int = 10) -> list[tuple[int, float, dict[str, float]]]:
+        """Best-first merged levels with the per-venue breakdown."""
+        merged = self.bids if side == "BUY" else self.asks
+        rows = []
+        for tick, total in merged.levels():
+            if len(rows) == levels:
+                break
+            breakdown = {}
+            for name, book in self.venues.items():
+                size = (book.bids if side == "BUY" else book.asks).size_at(tick)
+                if size > 0:
+                    breakdown[name] = size
+            rows.append((tick, total, breakdown))
+        return rows
+
+
+class VenueRouter:
+    """
+    Routes native venue messages into consolidated books.
+
+    Venue markets are linked to a shared market id with `link()`; messages
+    for unlinked markets are ignored.
+    """
+
+    def __init__(self, adapters: Iterable[VenueAdapter]):
+        self.adapters = {adapter.name: adapter for adapter in adapters}
+        self._links: dict[tuple[str, str], str] = {}
+        self._books: dict[str, ConsolidatedBook] = {}
+
+    def link(self, market_id: str, venue: str, venue_market: str) -> ConsolidatedBook:
+        """Map a venue-native market onto a consolidated market id."""
+        self._links[(venue, venue_market)] = market_id
+        return self.book(market_id)
+
+    def book(self, market_id: str) -> ConsolidatedBook:
+        book = self._books.get(market_id)
+        if book is None:
+            book = self._books[market_id] = ConsolidatedBook(market_id)
+        return book
+
+    def on_frame(self, venue: str, frame: bytes | str) -> list[ConsolidatedBook]:
+        """Decode and apply a raw frame; returns the books it updated."""
+        books = (self.on_message(venue, msg) for msg in self.adapters[venue].decode(frame))
+        return [book for book in books if book is not None]
+
+    def on_message(self, venue: str, msg: Any) -> ConsolidatedBook | None:
+        """Apply one decoded message; returns the updated book, if any."""
+        adapter = self.adapters[venue]
+        market_id = self._links.get((venue, adapter.market_key(msg)))
+        if market_id is None:
+            return None
+
+        book = self._books[market_id]
+        if adapter.is_snapshot(msg):
+            bids, asks = adapter.snapshot_levels(msg)
+            book.apply_snapshot(venue, bids, asks)
+        else:
+            venue_book = book.venue_book(venue)
+            for side, tick, size in adapter.changes(msg, venue_book):
+                book.apply_change(venue, side, tick, size)
+        return book
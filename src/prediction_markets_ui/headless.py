@@ -0,0 +1,157 @@
+"""Headless entry point: the trading engine without Qt.
+
+Feeds a market-data recording (or a synthetic one) through the engine,
+drains it on a fixed tick like the GUI does, optionally sends orders, and
+prints throughput and latency. Nothing here imports PySide6, so it starts
+quickly and runs without a display (CI, servers, scripts).
+
+Usage:
+    python -m prediction_markets_ui.headless [--file recording.bin] [--speed 1|10|max]
+        [--markets 20] [--frames 5000] [--rate 10000] [--drain-ms 100] [--orders 0]
+"""
+
+import time
+
+# Taken before the engine imports so the report can show them
+_START = time.perf_counter()
+
+import argparse
+import functools
+import os
+import queue
+import sys
+import tempfile
+import threading
+from statistics import median
+
+from prediction_markets_ui.core.engine import Engine
+from prediction_markets_ui.core.feeds import SyntheticPolymarketFeed
+from prediction_markets_ui.core.orders import OrderAck, OrderRequest
+from prediction_markets_ui.core.recording import FrameRecorder, Replayer, recorded_markets
+from prediction_markets_ui.core.venues import KalshiAdapter, PolymarketAdapter
+
+_IMPORTS_DONE = time.perf_counter()
+
+
+def synthetic_recording(path: str, markets: int, frames: int, rate: float):
+    """Record interleaved synthetic Polymarket feeds, `rate` frames per second overall."""
+    recorder = FrameRecorder(path)
+    streams = [SyntheticPolymarketFeed(f"0x{i:040x}", seed=i).frames(frames) for i in range(markets)]
+    t = time.time()
+    for batch in zip(*streams):
+        for frame in batch:
+            t += 1 / rate
+            recorder.record("Polymarket", frame, t)
+    recorder.close()
+
+
+def _percentiles(samples: list[float]) -> str:
+    if not samples:
+        return "n/a"
+    samples = sorted(samples)
+    p95 = samples[min(int(len(samples) * 0.95), len(samples) - 1)]
+    return f"p50 {median(samples):.2f} / p95 {p95:.2f} / max {samples[-1]:.2f} ms"
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the trading engine without a UI")
+    parser.add_argument("--file", help="recording made with PM_UI_RECORD_FILE (default: synthetic)")
+    parser.add_argument("--speed", default="max", help="replay speed: 1, 10, ... or max")
+    parser.add_argument("--markets", type=int, default=20, help="synthetic markets")
+    parser.add_argument("--frames", type=int, default=5_000, help="synthetic frames per market")
+    parser.add_argument("--rate", type=float, default=10_000, help="synthetic frames per second, at speed 1")
+    parser.add_argument("--drain-ms", type=float, default=100, help="consumer tick, like the GUI's drain timer")
+    parser.add_argument("--orders", type=int, default=0, help="orders sent per tick while the feed runs")
+    parser.add_argument("--timeout", type=float, default=600, help="give up after this many seconds")
+    return parser.parse_args(argv[1:])
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the engine over a feed and print throughput and latency."""
+    args = _parse_args(sys.argv if argv is None else argv)
+
+    path = args.file
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(), "synthetic.bin")
+        synthetic_recording(path, args.markets, args.frames, args.rate)
+
+    # Scanned before the engine exists, so a bad file leaves no threads behind
+    adapters = [PolymarketAdapter(), KalshiAdapter()]
+    try:
+        markets = recorded_markets(path, {adapter.name: adapter for adapter in adapters})
+    except (OSError, ValueError) as exc:
+        print(f"{path}: {exc}", file=sys.stderr)
+        return 1
+    acks: queue.SimpleQueue[OrderAck] = queue.SimpleQueue()
+    engine = Engine(adapters, on_order_result=acks.put)
+    market_ids = []
+    for venue, venue_market in markets:
+        market_id = f"{venue}:{venue_market}"
+        engine.open_market(market_id, venue, venue_market)
+        market_ids.append(market_id)
+    print(f"imports {(_IMPORTS_DONE - _START) * 1000:.0f} ms "
+          f"(PySide6 {'loaded' if 'PySide6' in sys.modules else 'not loaded'})")
+    print(f"{path}: {os.path.getsize(path) / 1e6:.1f} MB, {len(markets)} markets")
+
+    done = threading.Event()
+    # Held back by the ingest thread instead of dropping frames when it falls behind
+    replayer = Replayer(path, functools.partial(engine.ingestor.submit, block=True),
+                        None if args.speed == "max" else float(args.speed), on_done=done.set)
+    tick_ms: list[float] = []
+    age_ms: list[float] = []
+    trades = sent = acked = 0
+    engine.start()
+    start = last_progress = time.perf_counter()
+    replayer.start()
+    try:
+        while time.perf_counter() - start < args.timeout:
+            time.sleep(args.drain_ms / 1000)
+            drained_at = time.perf_counter()
+            updates = engine.drain()
+            tick_ms.append((time.perf_counter() - drained_at) * 1000)
+            for update in updates.values():
+                age_ms.append((drained_at - update.published_at) * 1000)
+                trades += len(update.trades)
+
+            while not acks.empty():
+                engine.apply_ack(acks.get())
+                acked += 1
+            if args.orders and market_ids and not done.is_set():
+                for _ in range(args.orders):
+                    engine.submit_order(OrderRequest(market_ids[sent % len(market_ids)], "BUY", "YES",
+                                                     "LIMIT", 10, 0.5))
+                    sent += 1
+
+            stats = engine.ingestor.stats()
+            caught_up = stats["applied"] + stats["dropped"] >= stats["received"] and not stats["pending_markets"]
+            if done.is_set() and caught_up and acked >= sent:
+                break
+            if drained_at - last_progress >= 1.0:
+                last_progress = drained_at
+                print(f"  {drained_at - start:5.1f}s  {replayer.frames:9,d} frames  "
+                      f"{stats['applied']:10,d} applied  {stats['inbound']:6,d} queued")
+        elapsed = time.perf_counter() - start
+    finally:
+        replayer.stop()
+        engine.close()
+
+    replay = replayer.stats()
+    stats = engine.ingestor.stats()
+    print(f"replayed {replay['frames']:,} frames in {replay['elapsed_s']:.2f}s "
+          f"({replay['frames_per_s']:,.0f}/s, up to {replay['max_behind_ms']:.0f} ms behind schedule)")
+    print(f"ingested in {elapsed:.2f}s: {stats['applied'] / elapsed:,.0f} messages/s applied; "
+          + ", ".join(f"{key} {value}" for key, value in stats.items()))
+    print(f"drain every {args.drain_ms:g} ms, {len(tick_ms)} ticks: apply {_percentiles(tick_ms)}")
+    print(f"update age at drain: {_percentiles(age_ms)}")
+    orders = engine.orders.orders.values()
+    print(f"state: {len(engine.book_engine)} books, {trades:,} trades, {len(engine.orders)} orders "
+          f"({sum(order.status == 'OPEN' for order in orders)} open), {len(engine.positions)} positions")
+    if acked:
+        latency = engine.order_pipeline.latency_stats()
+        print(f"orders: {sent} sent, {acked} acked, ack p50 {latency['p50']:.1f} / "
+              f"p95 {latency['p95']:.1f} / max {latency['max']:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,37 @@
 """Main entry point for the trading UI."""
 
+import time
+
+# Taken before the heavy imports so --profile-startup can report them
+_START = time.perf_counter()
+
+import argparse
 import os
 import sys
+
+# Memory diagnostics trace allocations from the start, imports included
+if os.getenv("PM_UI_MEMORY_DIAGNOSTICS", "") == "1":
+    import tracemalloc
+    tracemalloc.start(10)
+
 from PySide6 import QtWidgets
 
-from prediction_markets_ui.app import apply_app_style, position_window
+from prediction_markets_ui.app import (
+    UI_PAINT_TIMING,
+    UI_RECORD_FILE,
+    UI_REPLAY_FILE,
+    UI_REPLAY_SPEED,
+    UI_SESSION_FILE,
+    UI_STALL_LOG,
+    UI_STALL_MS,
+    apply_app_style,
+    position_window,
+)
 from prediction_markets_ui.main_window import MainWindow
+from prediction_markets_ui.profiling import StartupProfiler, profile_section
+from prediction_markets_ui.widgets.perf_hud import PaintTimingApplication
+
+_IMPORTS_DONE = time.perf_counter()
 
 
 def _setup_wsl_platform():
@@ -18,19 +44,62 @@ def _setup_wsl_platform():
         pass
 
 
+def _parse_args(argv: list[str]) -> tuple[argparse.Namespace, list[str]]:
+    """Parse our options; unknown arguments are left for Qt."""
+    parser = argparse.ArgumentParser(description="Prediction markets trading UI")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="report import, panel construction and time-to-first-paint timings",
+    )
+    return parser.parse_known_args(argv[1:])
+
+
 def main():
     """Run the trading UI application."""
+    args, qt_args = _parse_args(sys.argv)
+
+    profiler = None
+    if args.profile_startup:
+        profiler = StartupProfiler(t0=_START)
+        profiler.record("imports", (_IMPORTS_DONE - _START) * 1000)
+
     _setup_wsl_platform()
-    app = QtWidgets.QApplication(sys.argv)
+    with profile_section(profiler, "QApplication"):
+        # Timing paints costs a Python call per event, HUD shown or not, so
+        # it is opt-in; without it the HUD counts frames only
+        app_type = PaintTimingApplication if UI_PAINT_TIMING else QtWidgets.QApplication
+        app = app_type(sys.argv[:1] + qt_args)
 
     # Apply styling
-    apply_app_style(app)
+    with profile_section(profiler, "app style"):
+        apply_app_style(app)
 
     # Create and show main window
-    window = MainWindow()
+    with profile_section(profiler, "MainWindow"):
+        window = MainWindow(
+            profiler,
+            session_path=UI_SESSION_FILE or None,
+            record_path=UI_RECORD_FILE or None,
+            replay_path=UI_REPLAY_FILE or None,
+            replay_speed=UI_REPLAY_SPEED,
+            stall_ms=UI_STALL_MS,
+            stall_log=UI_STALL_LOG or None,
+        )
     position_window(app, window)
     window.show()
 
+    if profiler:
+        profiler.mark("window shown")
+
+        def report():
+            text = profiler.report()
+            # stdout is redirected into the Debug Console
+            print(text, file=sys.stderr)
+            window.log_panel.log_debug(text)
+
+        window.first_painted.connect(report)
+
     # Run event loop
     sys.exit(app.exec())
 
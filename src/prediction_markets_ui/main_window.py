@@ -1,12 +1,24 @@
 """Main window for the trading UI."""
 
+import functools
+import threading
+
 from PySide6 import QtWidgets, QtCore, QtGui
 
-from prediction_markets_ui.theme.colors import CLR_LONG, CLR_SHORT, CLR_MUTED, CLR_ACCENT, BG_HOVER
+from prediction_markets_ui.core.engine import Engine
+from prediction_markets_ui.core.operations import LocalChain, Operation, OperationsProgress, OperationsQueue
+from prediction_markets_ui.core.orders import CancelRequest, CancelResult, OrderAck, OrderRequest
+from prediction_markets_ui.core.recording import FrameRecorder, Replayer, recorded_markets
+from prediction_markets_ui.core.session import SessionState, SessionStore, TabState
+from prediction_markets_ui.memory import MemoryProbe
+from prediction_markets_ui.profiling import StartupProfiler, profile_section
+from prediction_markets_ui.theme.colors import CLR_LONG, CLR_SHORT
+from prediction_markets_ui.watchdog import Stall, StallWatchdog
 from prediction_markets_ui.widgets.market_browser import MarketBrowser
 from prediction_markets_ui.widgets.trading_panel import TradingPanel
 from prediction_markets_ui.widgets.bottom_tabs import BottomTabs
 from prediction_markets_ui.widgets.log_panel import LogPanel
+from prediction_markets_ui.widgets.perf_hud import PerfHud
 
 
 class ConnectionIndicator(QtWidgets.QWidget):
@@ -41,14 +53,107 @@ class MainWindow(QtWidgets.QMainWindow):
     - Right top: Trading panel (orderbook + order entry)
     - Right bottom: Orders/Positions/Portfolio/Operations tabs
     - Status bar: Status messages, latency, WS status
+
+    Non-critical parts (non-default bottom tabs, Debug Console) are built
+    right after the first paint.
     """
 
-    def __init__(self):
+    # Emitted once, after the first paint has been processed
+    first_painted = QtCore.Signal()
+    # Order acks from the pipeline's worker threads (OrderAck)
+    order_result = QtCore.Signal(object)
+    # Batched cancel results from the pipeline's worker threads (CancelResult)
+    cancel_result = QtCore.Signal(object)
+    # Progress of batched split/merge/redeem runs (OperationsProgress)
+    operations_progress = QtCore.Signal(object)
+    # A replay's recording was scanned: message count per (venue, venue market),
+    # or None and the reason it couldn't be read
+    replay_scanned = QtCore.Signal(object, str)
+    # A market-data replay reached the end of its recording
+    replay_finished = QtCore.Signal()
+    # A GUI-thread stall ended, reported from the watchdog thread (Stall)
+    stall_detected = QtCore.Signal(object)
+
+    # How often conflated market data is handed from the ingest thread to the widgets
+    DRAIN_MS = 100
+    # Quiet period after a workspace change before the session is saved
+    SESSION_SAVE_MS = 1000
+    # Market tabs opened for a replay (busiest recorded markets first)
+    REPLAY_TABS = 8
+    # Event-loop heartbeat for the stall watchdog
+    HEARTBEAT_MS = 50
+
+    def __init__(self, profiler: StartupProfiler | None = None, session_path: str | None = None,
+                 record_path: str | None = None, replay_path: str | None = None, replay_speed: float | None = 1.0,
+                 stall_ms: float = 0, stall_log: str | None = None):
         super().__init__()
+        self._profiler = profiler
+        self._painted = False
         self.setWindowTitle("Prediction Markets Trading")
         self.setMinimumSize(1200, 800)
+        # Raw frames can be recorded for later replay; a replay is never re-recorded
+        recorder = FrameRecorder(record_path) if record_path and not replay_path else None
+        # Market data, books, orders and positions; acks and cancel results come
+        # back from worker threads through signals
+        self.engine = Engine(on_order_result=self.order_result.emit, on_cancel=self.cancel_result.emit,
+                             recorder=recorder)
+        # The engine's parts, as the widgets and handlers below use them
+        self.book_engine = self.engine.book_engine
+        self.candle_engine = self.engine.candle_engine
+        self.trade_engine = self.engine.trade_engine
+        self.catalog = self.engine.catalog
+        self.orders = self.engine.orders
+        self.positions = self.engine.positions
+        self.scheduler = self.engine.scheduler
+        self.order_pipeline = self.engine.order_pipeline
+        self.ingestor = self.engine.ingestor
+        self._cancels: dict[str, CancelRequest] = {}
+        # Market id -> (venue, venue market) of markets fed outside the catalog (replays)
+        self._venue_markets: dict[str, tuple[str, str]] = {}
+        self.operations_queue = OperationsQueue(LocalChain(), on_progress=self.operations_progress.emit)
+        self._operation_titles: dict[str, str] = {}
+        self.replayer: Replayer | None = None
+        # (path, speed) of a replay whose recording is being scanned
+        self._replay_args: tuple[str, float | None] | None = None
+        # Built on first use (Settings > Performance HUD)
+        self.perf_hud: PerfHud | None = None
+        # Settings > Memory Snapshot; each report shows growth since the previous one
+        self.memory_probe = MemoryProbe()
+        # Stall watchdog: started after the first paint, so startup isn't a stall
+        self.watchdog = None
+        if stall_ms > 0:
+            self.watchdog = StallWatchdog(stall_ms, on_stall=self.stall_detected.emit, log_path=stall_log)
+        self._resyncs_seen: dict[str, int] = {}
+        self.engine.start()
         self._setup_ui()
 
+        # Workspace persistence: restore the last session, then save on change.
+        # Replays run in a throwaway workspace.
+        self.session = SessionStore(session_path) if session_path and not replay_path else None
+        self._session_timer = QtCore.QTimer(self)
+        self._session_timer.setSingleShot(True)
+        self._session_timer.setInterval(self.SESSION_SAVE_MS)
+        self._session_timer.timeout.connect(self._save_session)
+        if self.session is not None:
+            with profile_section(self._profiler, "session restore"):
+                self._restore_session()
+            self.trading_panel.workspace_changed.connect(self._schedule_session_save)
+            self.main_splitter.splitterMoved.connect(self._schedule_session_save)
+            self.right_splitter.splitterMoved.connect(self._schedule_session_save)
+
+        self._drain_timer = QtCore.QTimer(self)
+        self._drain_timer.timeout.connect(self._drain_market_data)
+        self._drain_timer.start(self.DRAIN_MS)
+
+        if self.watchdog is not None:
+            self._heartbeat_timer = QtCore.QTimer(self)
+            self._heartbeat_timer.timeout.connect(self.watchdog.beat)
+            self._heartbeat_timer.start(self.HEARTBEAT_MS)
+            self.stall_detected.connect(self._on_stall)
+
+        if replay_path:
+            self._start_replay(replay_path, replay_speed)
+
     def _setup_ui(self):
         # Central widget
         central = QtWidgets.QWidget()
@@ -63,51 +168,85 @@ class MainWindow(QtWidgets.QMainWindow):
         main_layout.addWidget(toolbar)
 
         # Main content (horizontal splitter)
-        main_splitter = QtWidgets.QSplitter(QtCore.Qt.Orientation.Horizontal)
+        self.main_splitter = QtWidgets.QSplitter(QtCore.Qt.Orientation.Horizontal)
 
         # Left panel: Market browser
-        self.market_browser = MarketBrowser()
+        with profile_section(self._profiler, "MarketBrowser"):
+            self.market_browser = MarketBrowser(self.catalog)
         self.market_browser.setMinimumWidth(250)
         self.market_browser.setMaximumWidth(400)
-        main_splitter.addWidget(self.market_browser)
+        self.main_splitter.addWidget(self.market_browser)
 
         # Right panel (vertical splitter)
-        right_splitter = QtWidgets.QSplitter(QtCore.Qt.Orientation.Vertical)
+        self.right_splitter = QtWidgets.QSplitter(QtCore.Qt.Orientation.Vertical)
 
         # Right top: Trading panel
-        self.trading_panel = TradingPanel()
-        right_splitter.addWidget(self.trading_panel)
+        with profile_section(self._profiler, "TradingPanel"):
+            self.trading_panel = TradingPanel(self.book_engine, self.candle_engine, self.trade_engine)
+        self.right_splitter.addWidget(self.trading_panel)
 
         # Right middle: Bottom tabs
-        self.bottom_tabs = BottomTabs()
+        with profile_section(self._profiler, "BottomTabs"):
+            self.bottom_tabs = BottomTabs(self.orders, self.positions)
         self.bottom_tabs.setMinimumHeight(150)
-        right_splitter.addWidget(self.bottom_tabs)
+        self.right_splitter.addWidget(self.bottom_tabs)
 
         # Right bottom: Log panel
-        self.log_panel = LogPanel()
+        with profile_section(self._profiler, "LogPanel"):
+            self.log_panel = LogPanel()
         self.log_panel.setMinimumHeight(100)
-        right_splitter.addWidget(self.log_panel)
+        self.right_splitter.addWidget(self.log_panel)
 
         # Set initial sizes (50% trading, 30% tabs, 20% logs)
-        right_splitter.setSizes([350, 200, 150])
+        self.right_splitter.setSizes([350, 200, 150])
 
-        main_splitter.addWidget(right_splitter)
+        self.main_splitter.addWidget(self.right_splitter)
 
         # Set initial sizes (left panel: 280px)
-        main_splitter.setSizes([280, 920])
+        self.main_splitter.setSizes([280, 920])
 
-        main_layout.addWidget(main_splitter, 1)
+        main_layout.addWidget(self.main_splitter, 1)
 
         # Status bar
         self._create_statusbar()
 
         # Connect signals
         self.market_browser.market_selected.connect(self._on_market_selected)
+        self.trading_panel.order_requested.connect(self._on_order_requested)
+        self.order_result.connect(self._on_order_result)
+        self.bottom_tabs.cancel_requested.connect(self._on_cancel_requested)
+        self.cancel_result.connect(self._on_cancel_result)
+        self.trading_panel.operation_requested.connect(self._on_operation_requested)
+        self.trading_panel.market_closed.connect(self._on_market_closed)
+        self.bottom_tabs.operations_submit_requested.connect(self._on_operations_submit)
+        self.bottom_tabs.operations_remove_requested.connect(self._on_operations_remove)
+        self.bottom_tabs.operations_clear_requested.connect(self._on_operations_clear)
+        self.operations_progress.connect(self._on_operations_progress)
+
+    def event(self, event: QtCore.QEvent) -> bool:
+        result = super().event(event)
+        if not self._painted and event.type() == QtCore.QEvent.Type.Paint:
+            self._painted = True
+            # Run once the current paint pass has finished
+            QtCore.QTimer.singleShot(0, self._on_first_paint)
+        return result
+
+    def _on_first_paint(self):
+        """Build deferred panels now that the window is on screen."""
+        if self._profiler:
+            self._profiler.mark("first paint")
+        with profile_section(self._profiler, "deferred panels"):
+            self.bottom_tabs.build_deferred()
+            self.log_panel.build_deferred()
+        if self.watchdog is not None:
+            self.watchdog.start()
+        self.first_painted.emit()
 
     def _create_toolbar(self) -> QtWidgets.QWidget:
         """Create the top toolbar."""
         toolbar = QtWidgets.QWidget()
-        toolbar.setStyleSheet(f"background-color: {BG_HOVER}; border-bottom: 1px solid #555;")
+        toolbar.setObjectName("toolbar")
+        toolbar.setAttribute(QtCore.Qt.WidgetAttribute.WA_StyledBackground)
         toolbar.setFixedHeight(44)
 
         layout = QtWidgets.QHBoxLayout(toolbar)
@@ -132,39 +271,31 @@ class MainWindow(QtWidgets.QMainWindow):
         layout.addWidget(self.conn_indicator)
 
         self.conn_text = QtWidgets.QLabel("Connected")
-        self.conn_text.setStyleSheet(f"color: {CLR_LONG};")
+        self.conn_text.setProperty("tone", "long")
         layout.addWidget(self.conn_text)
 
         layout.addStretch()
 
         # Settings button
         self.settings_btn = QtWidgets.QPushButton("Settings")
-        self.settings_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 4px 12px;
-            }}
-            QPushButton:hover {{
-                background-color: #4a4a4a;
-            }}
-        """)
+        self.settings_btn.setProperty("variant", "flat")
+        settings_menu = QtWidgets.QMenu(self.settings_btn)
+        self.perf_hud_action = settings_menu.addAction("Performance HUD")
+        self.perf_hud_action.setCheckable(True)
+        self.perf_hud_action.setShortcut(QtGui.QKeySequence("F12"))
+        self.perf_hud_action.toggled.connect(self._on_perf_hud_toggled)
+        # Keep the shortcut working while the menu is closed
+        self.addAction(self.perf_hud_action)
+        self.stall_report_action = settings_menu.addAction("Stall Report")
+        self.stall_report_action.triggered.connect(self._on_stall_report)
+        self.memory_action = settings_menu.addAction("Memory Snapshot")
+        self.memory_action.triggered.connect(self._on_memory_snapshot)
+        self.settings_btn.setMenu(settings_menu)
         layout.addWidget(self.settings_btn)
 
         # Help button
         self.help_btn = QtWidgets.QPushButton("Help")
-        self.help_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 4px 12px;
-            }}
-            QPushButton:hover {{
-                background-color: #4a4a4a;
-            }}
-        """)
+        self.help_btn.setProperty("variant", "flat")
         layout.addWidget(self.help_btn)
 
         return toolbar
@@ -179,16 +310,258 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # REST latency
         self.rest_label = QtWidgets.QLabel("REST: --ms")
-        self.rest_label.setStyleSheet(f"color: {CLR_MUTED};")
+        self.rest_label.setProperty("tone", "muted")
         statusbar.addPermanentWidget(self.rest_label)
 
+        # Order submit-to-ack latency
+        self.order_latency_label = QtWidgets.QLabel("Orders: --ms")
+        self.order_latency_label.setProperty("tone", "muted")
+        statusbar.addPermanentWidget(self.order_latency_label)
+
         # WebSocket status
         self.ws_label = QtWidgets.QLabel("WS: Disconnected")
-        self.ws_label.setStyleSheet(f"color: {CLR_MUTED};")
+        self.ws_label.setProperty("tone", "muted")
         statusbar.addPermanentWidget(self.ws_label)
 
+        # Market data backpressure and integrity (conflated / dropped / resyncs since start)
+        self.md_label = QtWidgets.QLabel("MD: 0 conflated / 0 dropped / 0 resyncs")
+        self.md_label.setProperty("tone", "muted")
+        statusbar.addPermanentWidget(self.md_label)
+
+    def _on_perf_hud_toggled(self, checked: bool):
+        if self.perf_hud is None:
+            self.perf_hud = PerfHud(self.ingestor, self)
+        self.perf_hud.set_active(checked)
+
+    def _on_stall(self, stall: Stall):
+        """Show a stall that just ended (the stack goes to the Debug Console)."""
+        self.log_panel.log_debug(stall.format())
+        self.log_panel.log_event(f"GUI stalled for {stall.duration_ms:.0f}ms (stack in Debug Console)")
+
+    def _on_stall_report(self):
+        if self.watchdog is None:
+            self.log_panel.log_debug("Stall watchdog is off (PM_UI_STALL_MS=0)")
+        else:
+            self.log_panel.log_debug(self.watchdog.report())
+
+    def _on_memory_snapshot(self):
+        self.memory_probe.snapshot()
+        self.log_panel.log_debug(self.memory_probe.report())
+
     def _on_market_selected(self, event_id: str, market_id: str):
         """Handle market selection from browser."""
+        self._link_market(market_id)
         self.trading_panel.open_market(market_id)
         self.status_label.setText(f"Loaded: {market_id}")
         self.log_panel.log_event(f"Market opened: {market_id} (Event: {event_id})")
+
+    def _on_market_closed(self, market_id: str):
+        """Release everything held for a closed market; reopening starts from a fresh snapshot."""
+        self.engine.close_market(market_id)
+
+    def _link_market(self, market_id: str):
+        """Route a market's feed messages to it (again, after a close), if its venue is known."""
+        market = self.catalog.market(market_id)
+        if market is not None and market.venue:
+            self.engine.open_market(market_id, market.venue, market.venue_market)
+        elif market_id in self._venue_markets:
+            self.engine.open_market(market_id, *self._venue_markets[market_id])
+
+    def _on_order_requested(self, request: OrderRequest, title: str):
+        """Hand an order to the pipeline and show it as pending."""
+        request = self.engine.submit_order(request)
+        self.bottom_tabs.orders_tab.add_pending(request, title)
+        price = "MKT" if request.price is None else f"{request.price:.2f}"
+        self.log_panel.log_event(
+            f"Order submitted: {request.side} {request.size:g} {request.outcome} @ {price} ({title})"
+        )
+
+    def _on_order_result(self, ack: OrderAck):
+        """Reconcile a pending order with its ack (runs on the GUI thread)."""
+        self.engine.apply_ack(ack)
+        self.bottom_tabs.orders_tab.reconcile(ack)
+        stats = self.order_pipeline.latency_stats()
+        self.order_latency_label.setText(f"Orders: p50 {stats['p50']:.0f}ms / p95 {stats['p95']:.0f}ms")
+        if ack.accepted:
+            self.log_panel.log_event(f"Order accepted: {ack.client_id} in {ack.latency_ms:.0f}ms")
+        else:
+            self.log_panel.log_event(f"Order rejected: {ack.client_id} ({ack.reason})")
+
+    def _on_cancel_requested(self, request: CancelRequest):
+        """Send a batched cancel (one API call for any number of orders)."""
+        request = self.engine.cancel(request)
+        self._cancels[request.request_id] = request
+        scope = "all" if request.cancel_all else (request.market_id or f"{len(request.order_ids)} selected")
+        self.log_panel.log_event(f"Cancel requested: {scope}")
+
+    def _on_cancel_result(self, result: CancelResult):
+        request = self._cancels.pop(result.request_id, None)
+        if request is None:
+            return
+        self.engine.apply_cancel_result(request, result)
+        self.bottom_tabs.orders_tab.apply_cancel_result(request, result)
+        if result.error:
+            self.log_panel.log_event(f"Cancel failed: {result.error}")
+        else:
+            self.log_panel.log_event(
+                f"Canceled {len(result.canceled)} order(s) in {result.latency_ms:.0f}ms"
+                + (f", {len(result.not_canceled)} not canceled" if result.not_canceled else "")
+            )
+
+    def _on_operation_requested(self, op: Operation, title: str):
+        """Queue a split/merge/redeem for the next batch."""
+        self.operations_queue.add(op)
+        self._operation_titles[op.market_id] = title
+        self._refresh_operations()
+        self.log_panel.log_event(f"Queued {op.kind} {op.amount:g} ({title})")
+
+    def _refresh_operations(self):
+        queue = self.operations_queue
+        rows = [(op.kind, self._operation_titles.get(op.market_id, op.market_id), op.amount) for op in queue.ops]
+        self.bottom_tabs.operations_tab.set_operations(rows, queue.estimate_gas(), queue.busy)
+
+    def _on_operations_submit(self):
+        if self.operations_queue.submit():
+            self._refresh_operations()
+
+    def _on_operations_remove(self, rows: list):
+        for row in reversed(rows):
+            self.operations_queue.remove(row)
+        self._refresh_operations()
+
+    def _on_operations_clear(self):
+        self.operations_queue.clear()
+        self._refresh_operations()
+
+    def _on_operations_progress(self, progress: OperationsProgress):
+        if progress.stage == "gas":
+            # A missing or stale estimate came back; redraw the total only
+            self._refresh_operations()
+            return
+        if progress.stage in ("confirmed", "done"):
+            self._refresh_operations()
+        # After the refresh, so the progress message stays visible
+        self.bottom_tabs.operations_tab.set_progress(progress)
+        self.log_panel.log_event(progress.message)
+
+    def _drain_market_data(self):
+        """Apply the latest book state and pending trades of every updated market."""
+        self.engine.drain()
+        stats = self.ingestor.stats()
+        self.md_label.setText(
+            f"MD: {stats['conflated']} conflated / {stats['dropped']} dropped / {stats['resyncs']} resyncs"
+            + (f" / {stats['unverified']} unverified" if stats["unverified"] else "")
+        )
+        if stats["resyncs"] != sum(self._resyncs_seen.values()):
+            counts = self.ingestor.resync_counts()
+            for market_id, count in counts.items():
+                if count != self._resyncs_seen.get(market_id, 0):
+                    self.log_panel.log_event(f"Book resync: {market_id} (#{count})")
+            self._resyncs_seen = counts
+            self.md_label.setToolTip(
+                "Resyncs per market:\n" + "\n".join(f"{mid}: {n}" for mid, n in sorted(counts.items()))
+            )
+
+    def _start_replay(self, path: str, speed: float | None):
+        """Scan a recording off the GUI thread; the replay starts once its busiest markets are open."""
+        self._replay_args = (path, speed)
+        self.replay_scanned.connect(self._on_replay_scanned)
+        self.replay_finished.connect(self._on_replay_finished)
+        threading.Thread(target=self._scan_replay, args=(path,), name="replay-scan", daemon=True).start()
+        self.log_panel.log_event(f"Scanning {path} for replay")
+
+    def _scan_replay(self, path: str):
+        """Runs on the scan thread."""
+        try:
+            markets = recorded_markets(path, self.ingestor.adapters)
+        except (OSError, ValueError) as exc:
+            self.replay_scanned.emit(None, str(exc))
+            return
+        self.replay_scanned.emit(markets, "")
+
+    def _on_replay_scanned(self, markets: dict[tuple[str, str], int] | None, error: str):
+        if markets is None:
+            self.log_panel.log_event(f"Replay failed: {error}")
+            return
+        # Linked before the first frame is replayed, so none are ignored
+        busiest = sorted(markets, key=markets.get, reverse=True)[:self.REPLAY_TABS]
+        for venue, venue_market in busiest:
+            market_id = f"{venue}:{venue_market}"
+            self._venue_markets[market_id] = (venue, venue_market)
+            self._link_market(market_id)
+            self.trading_panel.open_market(market_id, venue_market)
+        path, speed = self._replay_args
+        # A replay waits for the ingest thread rather than dropping frames
+        self.replayer = Replayer(path, functools.partial(self.ingestor.submit, block=True), speed,
+                                 on_done=self.replay_finished.emit)
+        self.replayer.start()
+        pace = f"{speed:g}x" if speed else "max speed"
+        self.log_panel.log_event(f"Replaying {path} at {pace} ({len(markets)} markets)")
+
+    def _on_replay_finished(self):
+        stats = self.replayer.stats()
+        self.log_panel.log_event(
+            f"Replay done: {stats['frames']} frames in {stats['elapsed_s']:.1f}s "
+            f"({stats['frames_per_s']:,.0f}/s, up to {stats['max_behind_ms']:.0f}ms behind schedule)"
+        )
+
+    def _capture_session(self) -> SessionState:
+        """Current workspace, including each open market's last-seen book."""
+        tabs = []
+        for market_id, title, outcome in self.trading_panel.tab_states():
+            book = self.book_engine.book(market_id)
+            if book.placeholder:
+                # Made-up levels aren't a last-seen book; the tab reopens without one
+                tabs.append(TabState(market_id, title, outcome, [], []))
+            else:
+                tabs.append(TabState(market_id, title, outcome, list(book.bids.levels()), list(book.asks.levels())))
+        return SessionState(
+            tabs,
+            self.trading_panel.market_tabs.currentIndex(),
+            {"main": self.main_splitter.sizes(), "right": self.right_splitter.sizes()},
+        )
+
+    def _schedule_session_save(self, *_):
+        self._session_timer.start()
+
+    def _save_session(self):
+        # Only the capture runs here; encoding and writing happen off-thread
+        self.session.save(self._capture_session())
+
+    def _restore_session(self):
+        state = self.session.load()
+        if state is None:
+            return
+        for name, splitter in (("main", self.main_splitter), ("right", self.right_splitter)):
+            sizes = state.splitters.get(name)
+            if sizes and len(sizes) == splitter.count():
+                splitter.setSizes(sizes)
+        # Cached books render at once and are flagged stale until live data replaces them
+        for tab in state.tabs:
+            if tab.bids or tab.asks:
+                self.book_engine.apply_snapshot(tab.market_id, tab.bids, tab.asks)
+            self._link_market(tab.market_id)
+        self.trading_panel.restore(state.tabs, state.current)
+        self.log_panel.log_event(f"Session restored: {len(state.tabs)} market(s)")
+
+    def closeEvent(self, event: QtGui.QCloseEvent):
+        if self.session is not None:
+            self._session_timer.stop()
+            self.session.flush(self._capture_session())
+        self.trading_panel.close_book_windows()
+        self._drain_timer.stop()
+        if self.watchdog is not None:
+            self.watchdog.stop()
+            self.watchdog.log_report()
+        if self.perf_hud is not None:
+            self.perf_hud.set_active(False)
+        if self.replayer is not None:
+            self.replayer.stop()
+        self.engine.close()
+        self.log_panel.restore_stdout()
+        self.operations_queue.close()
+        super().closeEvent(event)
+
+    def on_trade(self, market_id: str, ts: float, price: float, size: float, side: str):
+        """Record a trade for the market's tape and candles."""
+        self.engine.on_trade(market_id, ts, price, size, side)
@@ -0,0 +1,118 @@
+"""Memory diagnostics: tracemalloc snapshots plus live Qt object counts.
+
+`MemoryProbe.snapshot()` records the traced Python allocations (when
+tracemalloc is running) and counts the live QObjects in the application's
+object trees by class. `MemoryProbe.report()` compares the latest snapshot
+with the previous one: total growth, the allocation sites that grew most,
+and the Qt classes whose instance counts changed.
+
+tracemalloc slows allocation down noticeably, so it only runs in
+diagnostics mode (PM_UI_MEMORY_DIAGNOSTICS=1) or when started explicitly.
+"""
+
+import gc
+import time
+import tracemalloc
+from collections import Counter
+from typing import NamedTuple
+
+from PySide6 import QtWidgets, QtCore
+
+
+class MemorySnapshot(NamedTuple):
+    taken_at: float
+    traced: tracemalloc.Snapshot | None  # None when tracemalloc isn't running
+    traced_bytes: int
+    qt_objects: Counter  # Qt class name -> live instances
+
+
+def qt_object_counts() -> Counter:
+    """Live QObjects by class, across the application and all top-level widgets."""
+    app = QtWidgets.QApplication.instance()
+    counts: Counter = Counter()
+    if app is None:
+        return counts
+    # Top-level widgets aren't children of the application, so the trees don't overlap
+    for root in [app] + app.topLevelWidgets():
+        for obj in [root] + root.findChildren(QtCore.QObject):
+            counts[obj.metaObject().className()] += 1
+    return counts
+
+
+class MemoryProbe:
+    """Takes snapshots and reports growth between consecutive ones."""
+
+    def __init__(self, frames: int = 10, top: int = 10):
+        self.frames = frames
+        self.top = top
+        self.baseline: MemorySnapshot | None = None
+        self.previous: MemorySnapshot | None = None
+        self.latest: MemorySnapshot | None = None
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start_tracing(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+    def snapshot(self) -> MemorySnapshot:
+        """Collect garbage, then record allocations and Qt object counts."""
+        # Let deleteLater() run and unreachable cycles go first, so the
+        # snapshot shows what is actually retained
+        QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.Type.DeferredDelete)
+        gc.collect()
+        traced = None
+        traced_bytes = 0
+        if tracemalloc.is_tracing():
+            traced = tracemalloc.take_snapshot().filter_traces(
+                (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+            )
+            # Excludes the probe's own allocations (Qt wrappers made while counting)
+            traced_bytes = sum(trace.size for trace in traced.traces)
+        snap = MemorySnapshot(time.time(), traced, traced_bytes, qt_object_counts())
+        # Only the first, previous and latest snapshots are kept
+        self.previous, self.latest = self.latest, snap
+        if self.baseline is None:
+            self.baseline = snap
+        return snap
+
+    def growth(self, since: MemorySnapshot | None = None) -> tuple[int, Counter]:
+        """(traced bytes, Qt object counts) grown from `since` (default: previous) to the latest snapshot."""
+        latest = self.latest
+        since = since or self.previous or latest
+        qt = Counter(latest.qt_objects)
+        qt.subtract(since.qt_objects)
+        return latest.traced_bytes - since.traced_bytes, Counter({k: v for k, v in qt.items() if v})
+
+    def report(self, since: MemorySnapshot | None = None) -> str:
+        latest = self.latest
+        if latest is None:
+            return "No memory snapshots"
+        since = since or self.previous
+        lines = [
+            f"Memory: {sum(latest.qt_objects.values()):,} Qt objects"
+            + (f", {latest.traced_bytes / 2**20:,.1f} MB traced" if latest.traced is not None else
+               " (tracemalloc off: set PM_UI_MEMORY_DIAGNOSTICS=1)")
+        ]
+        if since is None:
+            lines += [f"  {count:6d}  {name}" for name, count in latest.qt_objects.most_common(self.top)]
+            return "\n".join(lines)
+
+        traced_growth, qt_growth = self.growth(since)
+        lines.append(f"Since {time.strftime('%H:%M:%S', time.localtime(since.taken_at))}:")
+        if latest.traced is not None and since.traced is not None:
+            lines.append(f"  traced {traced_growth / 1024:+,.1f} KB, top allocation sites:")
+            for stat in latest.traced.compare_to(since.traced, "lineno")[:self.top]:
+                if stat.size_diff:
+                    frame = stat.traceback[0]
+                    lines.append(f"    {stat.size_diff / 1024:+9,.1f} KB {stat.count_diff:+7d}  "
+                                 f"{frame.filename}:{frame.lineno}")
+        if qt_growth:
+            lines.append("  Qt objects:")
+            lines += [f"    {count:+6d}  {name}" for name, count in
+                      sorted(qt_growth.items(), key=lambda item: abs(item[1]), reverse=True)[:self.top]]
+        else:
+            lines.append("  Qt objects: unchanged")
+        return "\n".join(lines)
@@ -0,0 +1,49 @@
+"""Startup profiling for `--profile-startup`."""
+
+import time
+from contextlib import contextmanager, nullcontext
+
+
+class StartupProfiler:
+    """
+    Collects startup timings.
+
+    - Sections: durations of named steps (imports, panel construction, ...)
+    - Marks: milestones relative to process start (window shown, first paint)
+    """
+
+    def __init__(self, t0: float | None = None):
+        self._t0 = time.perf_counter() if t0 is None else t0
+        self.sections: list[tuple[str, float]] = []
+        self.marks: list[tuple[str, float]] = []
+
+    @contextmanager
+    def section(self, name: str):
+        """Time a block of startup work."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def record(self, name: str, ms: float):
+        """Record a section timed elsewhere."""
+        self.sections.append((name, ms))
+
+    def mark(self, name: str):
+        """Record a milestone relative to process start."""
+        self.marks.append((name, (time.perf_counter() - self._t0) * 1000))
+
+    def report(self) -> str:
+        """Human-readable timing report."""
+        width = max((len(name) for name, _ in self.sections + self.marks), default=0)
+        lines = ["Startup profile", "  Sections:"]
+        lines += [f"    {name:<{width}}  {ms:8.1f} ms" for name, ms in self.sections]
+        lines.append("  Milestones (since start):")
+        lines += [f"    {name:<{width}}  {ms:8.1f} ms" for name, ms in self.marks]
+        return "\n".join(lines)
+
+
+def profile_section(profiler: StartupProfiler | None, name: str):
+    """`profiler.section(name)`, or a no-op when profiling is off."""
+    return nullcontext() if profiler is None else profiler.section(name)
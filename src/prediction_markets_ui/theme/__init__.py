@@ -1,10 +1,11 @@
 """Theme system for the trading UI."""
 
 from prediction_markets_ui.theme.colors import *
-from prediction_markets_ui.theme.styles import get_global_stylesheet
+from prediction_markets_ui.theme.styles import get_global_stylesheet, set_style_property
 from prediction_markets_ui.theme.palette import apply_dark_palette
 
 __all__ = [
     "apply_dark_palette",
     "get_global_stylesheet",
+    "set_style_property",
 ]
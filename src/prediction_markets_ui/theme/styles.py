@@ -1,9 +1,21 @@
-"""Global stylesheet for the dark theme."""
+"""Global stylesheet for the dark theme.
+
+All widget styling lives in this one stylesheet, applied once to the
+QApplication. Widgets opt into variants through object names (singletons
+such as `#toolbar`) and dynamic properties (`variant`, `role`, `tone`,
+`bold`) instead of calling setStyleSheet on individual instances, which
+would re-parse QSS and re-polish every time a widget is created.
+"""
+
+from functools import lru_cache
+
+from PySide6 import QtWidgets
 
 from prediction_markets_ui.theme.colors import (
     CLR_LONG,
     CLR_SHORT,
     CLR_ACCENT,
+    CLR_MUTED,
     BG_BASE,
     BG_DARKEST,
     BG_HOVER,
@@ -15,8 +27,19 @@ from prediction_markets_ui.theme.colors import (
 )
 
 
+def set_style_property(widget: QtWidgets.QWidget, name: str, value) -> None:
+    """Change a dynamic style property and re-polish only this widget."""
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+@lru_cache(maxsize=None)
 def get_global_stylesheet(font_size: int = 12, font_family: str = "") -> str:
-    """Generate global stylesheet."""
+    """Generate global stylesheet (cached per font settings)."""
 
     # Font fallback chain (Korean + emoji support)
     font_families = []
@@ -174,122 +197,246 @@ def get_global_stylesheet(font_size: int = 12, font_family: str = "") -> str:
     QSplitter::handle:vertical {{
         height: 3px;
     }}
-    """
 
+    /* ---- Labels: role = typography, tone = color ---- */
+    QLabel[role="title"] {{
+        font-weight: bold;
+        color: {CLR_ACCENT};
+    }}
+    QLabel[role="value"] {{
+        font-weight: bold;
+        color: {CLR_ACCENT};
+    }}
+    QLabel[role="hint"] {{
+        color: {CLR_MUTED};
+        font-style: italic;
+    }}
+    QLabel[bold="true"] {{
+        font-weight: bold;
+    }}
+    QLabel[tone="long"] {{
+        color: {CLR_LONG};
+    }}
+    QLabel[tone="short"] {{
+        color: {CLR_SHORT};
+    }}
+    QLabel[tone="muted"] {{
+        color: {CLR_MUTED};
+    }}
 
-# Button style templates
-BTN_BASE = f"""
-    QPushButton {{
+    /* ---- Frames ---- */
+    QFrame[role="panel"] {{
+        background-color: {BG_HOVER};
+        border: 1px solid {BORDER_DEFAULT};
+        border-radius: 4px;
+    }}
+    QFrame[role="card"] {{
+        background-color: {BG_HOVER};
+        border-radius: 4px;
+    }}
+    QFrame[role="separator"] {{
+        background-color: {BORDER_DEFAULT};
+    }}
+
+    /* ---- Toolbar ---- */
+    QWidget#toolbar {{
+        background-color: {BG_HOVER};
+        border-bottom: 1px solid {BORDER_DEFAULT};
+    }}
+
+    /* ---- Buttons: variant ---- */
+    QPushButton[variant="flat"] {{
+        background-color: transparent;
+        border: 1px solid {BORDER_DEFAULT};
+        border-radius: 4px;
+        padding: 4px 12px;
+    }}
+    QPushButton[variant="flat"]:hover {{
+        background-color: {BG_ACTIVE};
+    }}
+
+    QPushButton[variant="toggle"] {{
         background-color: {BG_HOVER};
         color: #e0e0e0;
         border: 1px solid {BORDER_DEFAULT};
         border-radius: 3px;
-        padding: 6px 12px;
+        padding: 4px 12px;
     }}
-    QPushButton:hover {{
+    QPushButton[variant="toggle"]:hover {{
         background-color: {BG_ACTIVE};
         border-color: {BORDER_HOVER};
     }}
-    QPushButton:pressed {{
-        background-color: {BG_PRESSED};
-    }}
-    QPushButton:disabled {{
-        background-color: {BG_PRESSED};
-        color: {BORDER_DEFAULT};
-        border-color: #333;
+    QPushButton[variant="toggle"]:checked {{
+        background-color: #1b3146;
+        border: 2px solid #64b5f6;
+        color: #64b5f6;
     }}
-"""
 
-# Small button for table cells
-BTN_TABLE = f"""
-    QPushButton {{
+    QPushButton[variant="table"] {{
         background-color: {BG_HOVER};
         color: #e0e0e0;
         border: 1px solid {BORDER_DEFAULT};
         border-radius: 3px;
         padding: 2px 4px;
     }}
-    QPushButton:hover {{
+    QPushButton[variant="table"]:hover {{
         background-color: {BG_ACTIVE};
         border-color: {BORDER_HOVER};
     }}
-    QPushButton:pressed {{
+    QPushButton[variant="table"]:pressed {{
         background-color: {BG_PRESSED};
     }}
-"""
 
-BTN_LONG = f"""
-    QPushButton {{
+    QPushButton[variant="long"], QPushButton[variant="short"] {{
         background-color: {BG_HOVER};
-        color: {CLR_LONG};
         border: 1px solid {BORDER_DEFAULT};
         border-radius: 3px;
         padding: 8px 16px;
     }}
-    QPushButton:hover {{
+    QPushButton[variant="long"] {{
+        color: {CLR_LONG};
+    }}
+    QPushButton[variant="short"] {{
+        color: {CLR_SHORT};
+    }}
+    QPushButton[variant="long"]:hover {{
         background-color: {BG_ACTIVE};
         border-color: {CLR_LONG};
     }}
-    QPushButton:pressed {{
+    QPushButton[variant="short"]:hover {{
+        background-color: {BG_ACTIVE};
+        border-color: {CLR_SHORT};
+    }}
+    QPushButton[variant="long"]:pressed, QPushButton[variant="short"]:pressed {{
         background-color: {BG_PRESSED};
     }}
-    QPushButton:checked {{
+    QPushButton[variant="long"]:checked {{
         border: 2px solid {CLR_LONG};
         background-color: #2e3d2e;
     }}
-    QPushButton:disabled {{
+    QPushButton[variant="short"]:checked {{
+        border: 2px solid {CLR_SHORT};
+        background-color: #3d2e2e;
+    }}
+
+    QPushButton[variant="toggle"]:disabled,
+    QPushButton[variant="long"]:disabled,
+    QPushButton[variant="short"]:disabled {{
         background-color: {BG_PRESSED};
         color: {BORDER_DEFAULT};
         border-color: #333;
     }}
-"""
 
-BTN_SHORT = f"""
-    QPushButton {{
-        background-color: {BG_HOVER};
-        color: {CLR_SHORT};
-        border: 1px solid {BORDER_DEFAULT};
-        border-radius: 3px;
-        padding: 8px 16px;
+    /* Orderbook outcome selector */
+    QPushButton[variant="outcome-yes"], QPushButton[variant="outcome-no"] {{
+        background-color: transparent;
+        border-radius: 4px;
+        padding: 4px 16px;
+        font-weight: bold;
     }}
-    QPushButton:hover {{
-        background-color: {BG_ACTIVE};
-        border-color: {CLR_SHORT};
+    QPushButton[variant="outcome-yes"] {{
+        color: {CLR_LONG};
+        border: 2px solid {CLR_LONG};
     }}
-    QPushButton:pressed {{
-        background-color: {BG_PRESSED};
+    QPushButton[variant="outcome-yes"]:checked {{
+        background-color: {CLR_LONG};
+        color: black;
     }}
-    QPushButton:checked {{
+    QPushButton[variant="outcome-no"] {{
+        color: {CLR_SHORT};
         border: 2px solid {CLR_SHORT};
-        background-color: #3d2e2e;
     }}
-    QPushButton:disabled {{
-        background-color: {BG_PRESSED};
-        color: {BORDER_DEFAULT};
-        border-color: #333;
+    QPushButton[variant="outcome-no"]:checked {{
+        background-color: {CLR_SHORT};
+        color: white;
     }}
-"""
 
-BTN_TOGGLE = f"""
-    QPushButton {{
+    /* Inline "X" cancel button in table cells */
+    QPushButton[variant="remove"] {{
+        background-color: transparent;
+        color: {CLR_SHORT};
+        border: none;
+        font-weight: bold;
+    }}
+    QPushButton[variant="remove"]:hover {{
+        color: white;
+    }}
+
+    QPushButton[variant="place"] {{
+        background-color: {CLR_LONG};
+        color: black;
+        font-weight: bold;
+        padding: 12px;
+        border-radius: 4px;
+    }}
+    QPushButton[variant="place"]:hover {{
+        background-color: #9ccc9c;
+    }}
+    QPushButton[variant="place"]:disabled {{
+        background-color: #555;
+        color: #888;
+    }}
+
+    /* ---- Trading panel ---- */
+    QTabWidget#marketTabs QTabBar::tab {{
+        max-width: 150px;
+    }}
+
+    /* ---- Market browser ---- */
+    QTreeWidget#marketTree::item {{
+        padding: 4px;
+        border-bottom: 1px solid #333;
+    }}
+    QTreeWidget#marketTree::item:hover {{
         background-color: {BG_HOVER};
-        color: #e0e0e0;
+    }}
+    QTreeWidget#marketTree::item:selected {{
+        background-color: #1976d2;
+    }}
+    QTreeWidget#marketTree::branch:has-children:!has-siblings:closed,
+    QTreeWidget#marketTree::branch:closed:has-children:has-siblings {{
+        image: none;
+        border-image: none;
+    }}
+    QTreeWidget#marketTree::branch:open:has-children:!has-siblings,
+    QTreeWidget#marketTree::branch:open:has-children:has-siblings {{
+        image: none;
+        border-image: none;
+    }}
+
+    /* ---- Log panel ---- */
+    QGroupBox[role="log"] {{
+        font-weight: bold;
         border: 1px solid {BORDER_DEFAULT};
-        border-radius: 3px;
-        padding: 4px 12px;
+        border-radius: 4px;
+        margin-top: 12px;
+        padding-top: 12px;
     }}
-    QPushButton:hover {{
-        background-color: {BG_ACTIVE};
-        border-color: {BORDER_HOVER};
+    QGroupBox[role="log"]::title {{
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        left: 10px;
+        top: 2px;
+        padding: 0 5px;
     }}
-    QPushButton:checked {{
-        background-color: #1b3146;
-        border: 2px solid #64b5f6;
-        color: #64b5f6;
+    QGroupBox#eventLogGroup {{
+        color: {CLR_ACCENT};
     }}
-    QPushButton:disabled {{
-        background-color: {BG_PRESSED};
-        color: {BORDER_DEFAULT};
-        border-color: #333;
+    QGroupBox#debugConsoleGroup {{
+        color: {CLR_MUTED};
     }}
-"""
+    QGroupBox[role="log"] QPlainTextEdit {{
+        background-color: {BG_DARKEST};
+        border: none;
+    }}
+
+    /* ---- Performance HUD overlay ---- */
+    QFrame#perfHud {{
+        background-color: rgba(20, 20, 20, 200);
+        border: 1px solid {BORDER_DEFAULT};
+        border-radius: 4px;
+    }}
+    QLabel#perfHudText {{
+        background: transparent;
+    }}
+    """
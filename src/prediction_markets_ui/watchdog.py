@@ -0,0 +1,167 @@
+"""GUI-thread stall watchdog.
+
+The GUI thread calls `StallWatchdog.beat()` from a short repeating timer.
+A background thread watches the time since the last beat; once it exceeds
+the threshold, the GUI thread is stalled and the watchdog samples its
+Python stack (`sys._current_frames`) until beats resume. Each stall is
+reported with its duration and the stack seen in most samples, appended
+to a log file, and aggregated by that stack into a recurring-stall report.
+"""
+
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from typing import Callable, NamedTuple
+
+# (filename, line number, function) from innermost to outermost
+Stack = tuple[tuple[str, int, str], ...]
+
+
+class Stall(NamedTuple):
+    started_at: float     # Seconds since the epoch
+    duration_ms: float
+    samples: int
+    stack: Stack          # Most frequently sampled stack
+    share: float          # Fraction of samples showing that stack
+
+    def format(self) -> str:
+        when = time.strftime("%H:%M:%S", time.localtime(self.started_at))
+        lines = [f"GUI stall {self.duration_ms:.0f} ms at {when} "
+                 f"({self.samples} samples, {self.share:.0%} in this stack):"]
+        lines += _format_stack(self.stack)
+        return "\n".join(lines)
+
+
+class StallWatchdog:
+    """
+    Detects GUI-thread stalls from missed heartbeats.
+
+    `on_stall` is called from the watchdog thread once each stall ends;
+    marshal it to the GUI thread (e.g. through a Qt signal) before touching
+    widgets.
+    """
+
+    def __init__(self, threshold_ms: float = 300, sample_ms: float = 20,
+                 on_stall: Callable[[Stall], None] | None = None, log_path: str | None = None,
+                 thread_id: int | None = None):
+        self.threshold = threshold_ms / 1000
+        self.sample_interval = sample_ms / 1000
+        self.on_stall = on_stall
+        self.log_path = log_path
+        # Thread to watch; defaults to the one creating the watchdog
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        # Stack without line numbers -> [count, total ms, max ms, latest stack];
+        # stalls in the same call path group together wherever they stopped
+        self._recurring: dict[tuple, list] = {}
+        self.stalls = 0
+
+    def beat(self):
+        """Heartbeat from the watched thread's event loop."""
+        self._last_beat = time.perf_counter()
+
+    def start(self):
+        if self._thread is None:
+            self.beat()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="stall-watchdog", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.sample_interval):
+            behind = time.perf_counter() - self._last_beat
+            if behind >= self.threshold:
+                self._capture(behind)
+
+    def _capture(self, behind: float):
+        """Sample the stalled thread until it beats again, then report."""
+        started_at = time.time() - behind
+        beat = self._last_beat
+        samples: Counter[Stack] = Counter()
+        while self._last_beat == beat and not self._stop.is_set():
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                return
+            samples[_stack(frame)] += 1
+            del frame
+            self._stop.wait(self.sample_interval)
+        # The beat that ended the stall came after the last missed one
+        duration_ms = (self._last_beat - beat) * 1000
+        total = sum(samples.values())
+        if not total:
+            return
+        stack, count = samples.most_common(1)[0]
+        stall = Stall(started_at, duration_ms, total, stack, count / total)
+        with self._lock:
+            self.stalls += 1
+            key = tuple((filename, name) for filename, _, name in stack)
+            entry = self._recurring.get(key)
+            if entry is None:
+                entry = self._recurring[key] = [0, 0.0, 0.0, stack]
+            entry[0] += 1
+            entry[1] += duration_ms
+            entry[2] = max(entry[2], duration_ms)
+            entry[3] = stack
+        self._log(stall.format())
+        if self.on_stall is not None:
+            self.on_stall(stall)
+
+    def _log(self, text: str):
+        if not self.log_path:
+            return
+        try:
+            directory = os.path.dirname(self.log_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(text + "\n\n")
+        except OSError:
+            # Diagnostics must never take the app down
+            pass
+
+    def log_report(self, top: int = 10):
+        """Append the recurring-stall report to the log file, if there were stalls."""
+        if self.stalls:
+            self._log(self.report(top))
+
+    def report(self, top: int = 10) -> str:
+        """Recurring stalls, worst total time first."""
+        with self._lock:
+            entries = sorted((list(entry) for entry in self._recurring.values()), key=lambda e: e[1], reverse=True)
+        if not entries:
+            return "No GUI stalls recorded"
+        lines = [f"GUI stalls: {self.stalls} total, {len(entries)} distinct stacks"]
+        for rank, (count, total_ms, max_ms, stack) in enumerate(entries[:top], 1):
+            lines.append(f"#{rank}: {count}x, {total_ms:.0f} ms total, {max_ms:.0f} ms max")
+            lines += _format_stack(stack, limit=8)
+        return "\n".join(lines)
+
+
+def _stack(frame) -> Stack:
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append((code.co_filename, frame.f_lineno, code.co_name))
+        frame = frame.f_back
+    return tuple(stack)
+
+
+def _format_stack(stack: Stack, limit: int | None = None) -> list[str]:
+    """Outermost call first, like a traceback."""
+    frames = stack[:limit] if limit else stack
+    summary = traceback.StackSummary.from_list(
+        [traceback.FrameSummary(filename, lineno, name) for filename, lineno, name in reversed(frames)]
+    )
+    return [line.rstrip("\n") for line in summary.format()]
@@ -2,29 +2,60 @@
 
 from PySide6 import QtWidgets, QtCore, QtGui
 
-from prediction_markets_ui.theme.colors import (
-    CLR_LONG,
-    CLR_SHORT,
-    CLR_MUTED,
-    CLR_ACCENT,
-    CLR_COLLATERAL,
-    BG_HOVER,
-    BORDER_DEFAULT,
-)
-from prediction_markets_ui.theme.styles import BTN_TABLE
+from prediction_markets_ui.core.domain import OrderStore, Position, PositionBook
+from prediction_markets_ui.core.orders import CancelRequest, CancelResult, OrderAck, OrderRequest
+from prediction_markets_ui.core.operations import OperationsProgress
+from prediction_markets_ui.theme import set_style_property
+from prediction_markets_ui.theme.colors import CLR_LONG, CLR_SHORT, CLR_MUTED
 
 
 class OrdersTab(QtWidgets.QWidget):
-    """Open orders tab."""
+    """
+    Open orders tab.
 
-    def __init__(self, parent=None):
+    Submitted orders show up at once as PENDING rows and are reconciled
+    when the ack or reject arrives. Rows can be multi-selected; every
+    cancel action goes out as a single batched request and affected rows
+    show CANCELING until the result arrives.
+
+    Order state lives in the engine's OrderStore, which is updated before
+    the tab is told about an order, ack or cancel result; rows hold only
+    the client id.
+    """
+
+    # Signal emitted for a cancel action (CancelRequest)
+    cancel_requested = QtCore.Signal(object)
+
+    # Column holding the status text
+    STATUS_COL = 7
+    ACTIONS_COL = 8
+
+    def __init__(self, orders: OrderStore | None = None, parent=None):
         super().__init__(parent)
+        self.orders = orders if orders is not None else OrderStore()
+        # client id -> status item of the pending row
+        self._pending: dict[str, QtWidgets.QTableWidgetItem] = {}
+        # order id -> status item of the open row
+        self._open: dict[str, QtWidgets.QTableWidgetItem] = {}
         self._setup_ui()
 
     def _setup_ui(self):
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(8, 8, 8, 8)
 
+        # Bulk actions
+        actions_layout = QtWidgets.QHBoxLayout()
+        self.cancel_selected_btn = QtWidgets.QPushButton("Cancel Selected")
+        self.cancel_market_btn = QtWidgets.QPushButton("Cancel Market")
+        self.cancel_market_btn.setToolTip("Cancel all orders in the selected order's market")
+        self.cancel_all_btn = QtWidgets.QPushButton("Cancel All")
+        for btn in (self.cancel_selected_btn, self.cancel_market_btn, self.cancel_all_btn):
+            btn.setProperty("variant", "table")
+            btn.setEnabled(False)
+            actions_layout.addWidget(btn)
+        actions_layout.addStretch()
+        layout.addLayout(actions_layout)
+
         # Orders table
         self.orders_table = QtWidgets.QTableWidget(0, 9)
         self.orders_table.setHorizontalHeaderLabels([
@@ -32,6 +63,9 @@ class OrdersTab(QtWidgets.QWidget):
             "Size", "Filled", "Status", "Actions"
         ])
         self.orders_table.verticalHeader().setVisible(False)
+        self.orders_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
+        self.orders_table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.orders_table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
 
         # Set column resize modes
         header = self.orders_table.horizontalHeader()
@@ -41,34 +75,119 @@ class OrdersTab(QtWidgets.QWidget):
         header.setSectionResizeMode(8, QtWidgets.QHeaderView.ResizeMode.Fixed)  # Actions
         self.orders_table.setColumnWidth(8, 80)  # Fixed width for action buttons
 
-        # Add placeholder orders
-        orders_data = [
-            ("BTC > $100k?", "BUY", "YES", "LIMIT", "0.62", "100", "0", "OPEN"),
-            ("ETH > $5k?", "SELL", "NO", "LIMIT", "0.45", "50", "25", "PARTIAL"),
-        ]
-        self.orders_table.setRowCount(len(orders_data))
+        layout.addWidget(self.orders_table)
 
-        for row, data in enumerate(orders_data):
-            for col, value in enumerate(data):
-                item = QtWidgets.QTableWidgetItem(value)
-                # Color code side
-                if col == 1:  # Side
-                    item.setForeground(QtGui.QColor(CLR_LONG if value == "BUY" else CLR_SHORT))
-                self.orders_table.setItem(row, col, item)
+        self.orders_table.itemSelectionChanged.connect(self._update_actions)
+        self.cancel_selected_btn.clicked.connect(self._cancel_selected)
+        self.cancel_market_btn.clicked.connect(self._cancel_market)
+        self.cancel_all_btn.clicked.connect(self._cancel_all)
+
+    def add_pending(self, request: OrderRequest, title: str):
+        """Insert an optimistic row for a just-submitted order."""
+        table = self.orders_table
+        table.insertRow(0)
+        price = "MKT" if request.price is None else f"{request.price:.2f}"
+        values = (title, request.side, request.outcome, request.order_type, price,
+                  f"{request.size:g}", "0", "PENDING")
+        for col, value in enumerate(values):
+            item = QtWidgets.QTableWidgetItem(value)
+            if col == 1:  # Side
+                item.setForeground(QtGui.QColor(CLR_LONG if value == "BUY" else CLR_SHORT))
+            table.setItem(0, col, item)
+
+        status = table.item(0, self.STATUS_COL)
+        status.setForeground(QtGui.QColor(CLR_MUTED))
+        status.setData(QtCore.Qt.ItemDataRole.UserRole, request.client_id)
+        self._pending[request.client_id] = status
+
+    def reconcile(self, ack: OrderAck):
+        """Resolve a pending row from the venue's ack or reject."""
+        status = self._pending.pop(ack.client_id, None)
+        if status is None:
+            return
+        if ack.accepted:
+            status.setText("OPEN")
+            status.setForeground(QtGui.QBrush())
+            status.setToolTip(f"{ack.order_id}\nAck in {ack.latency_ms:.0f} ms")
+            self._open[ack.order_id] = status
 
-            # Add cancel button
             cancel_btn = QtWidgets.QPushButton("Cancel")
-            cancel_btn.setStyleSheet(BTN_TABLE)
-            self.orders_table.setCellWidget(row, 8, cancel_btn)
-
-        layout.addWidget(self.orders_table)
+            cancel_btn.setProperty("variant", "table")
+            cancel_btn.clicked.connect(lambda: self._request_cancel(CancelRequest((ack.order_id,))))
+            self.orders_table.setCellWidget(status.row(), self.ACTIONS_COL, cancel_btn)
+        else:
+            status.setText("REJECTED")
+            status.setForeground(QtGui.QColor(CLR_SHORT))
+            status.setToolTip(ack.reason)
+        self._update_actions()
+
+    # ---- Cancels ----
+
+    def _selected_order_ids(self) -> list[str]:
+        rows = {index.row() for index in self.orders_table.selectionModel().selectedRows()}
+        return [oid for oid, status in self._open.items() if status.row() in rows]
+
+    def _update_actions(self):
+        selected = bool(self._selected_order_ids())
+        self.cancel_selected_btn.setEnabled(selected)
+        self.cancel_market_btn.setEnabled(selected)
+        self.cancel_all_btn.setEnabled(bool(self._open))
+
+    def _cancel_selected(self):
+        order_ids = self._selected_order_ids()
+        if order_ids:
+            self._request_cancel(CancelRequest(tuple(order_ids)))
+
+    def _cancel_market(self):
+        order_ids = self._selected_order_ids()
+        if not order_ids:
+            return
+        market_id = self.orders.by_order_id(order_ids[0]).market_id
+        in_market = tuple(order.order_id for order in self.orders.open_orders(market_id))
+        self._request_cancel(CancelRequest(in_market, market_id=market_id))
+
+    def _cancel_all(self):
+        if self._open:
+            self._request_cancel(CancelRequest(tuple(self._open), cancel_all=True))
+
+    def _request_cancel(self, request: CancelRequest):
+        for order_id in request.order_ids:
+            status = self._open.get(order_id)
+            if status is not None:
+                status.setText("CANCELING")
+                status.setForeground(QtGui.QColor(CLR_MUTED))
+        self.cancel_requested.emit(request)
+
+    def apply_cancel_result(self, request: CancelRequest, result: CancelResult):
+        """Drop canceled rows and restore the ones the venue kept."""
+        for order_id in result.canceled:
+            status = self._open.pop(order_id, None)
+            if status is not None:
+                self.orders_table.removeRow(status.row())
+
+        # Anything still CANCELING from this request stays open
+        for order_id in request.order_ids:
+            status = self._open.get(order_id)
+            if status is not None and status.text() == "CANCELING":
+                status.setText("OPEN")
+                status.setForeground(QtGui.QBrush())
+                status.setToolTip(result.error or result.not_canceled.get(order_id, "Not canceled"))
+        self._update_actions()
 
 
 class PositionsTab(QtWidgets.QWidget):
-    """Positions tab."""
+    """Positions tab, rendered from the PositionBook."""
 
-    def __init__(self, parent=None):
+    # Shown while the book is empty, until the venue feeds real fills; view
+    # only, so they never reach the book or anything priced off it
+    DEMO_POSITIONS = (
+        Position("BTC > $100k?", "YES", 150, 0.58),
+        Position("Super Bowl Winner", "NO", 80, 0.70),
+    )
+
+    def __init__(self, positions: PositionBook | None = None, parent=None):
         super().__init__(parent)
+        self.positions = positions if positions is not None else PositionBook()
         self._setup_ui()
 
     def _setup_ui(self):
@@ -90,28 +209,42 @@ class PositionsTab(QtWidgets.QWidget):
         header.setSectionResizeMode(6, QtWidgets.QHeaderView.ResizeMode.Fixed)  # Actions
         self.positions_table.setColumnWidth(6, 80)  # Fixed width for action buttons
 
-        # Add placeholder positions
-        positions_data = [
-            ("BTC > $100k?", "YES", "150", "0.58", "0.63", "+$7.50"),
-            ("Super Bowl Winner", "NO", "80", "0.70", "0.65", "-$4.00"),
-        ]
-        self.positions_table.setRowCount(len(positions_data))
+        self.refresh()
 
-        for row, data in enumerate(positions_data):
-            for col, value in enumerate(data):
+        layout.addWidget(self.positions_table)
+
+    def refresh(self, marks: dict[tuple[str, str], float] | None = None):
+        """
+        Redraw from the book; `marks` are current prices by (market id,
+        outcome). Positions without a mark show n/a for price and PnL.
+        """
+        marks = marks or {}
+        positions = list(self.positions) or list(self.DEMO_POSITIONS)
+        table = self.positions_table
+        table.setRowCount(len(positions))
+
+        for row, position in enumerate(positions):
+            mark = marks.get((position.market_id, position.outcome))
+            if mark is None:
+                current, pnl_text = "n/a", "n/a"
+            else:
+                pnl = (mark - position.avg_price) * position.size
+                current, pnl_text = f"{mark:.2f}", f"{'+' if pnl >= 0 else '-'}${abs(pnl):.2f}"
+            values = (position.market_id, position.outcome, f"{position.size:g}",
+                      f"{position.avg_price:.2f}", current, pnl_text)
+            for col, value in enumerate(values):
                 item = QtWidgets.QTableWidgetItem(value)
                 # Color code PnL
-                if col == 5:  # PnL
+                if col == 5 and value != "n/a":  # PnL
                     color = CLR_LONG if value.startswith("+") else CLR_SHORT
                     item.setForeground(QtGui.QColor(color))
-                self.positions_table.setItem(row, col, item)
+                table.setItem(row, col, item)
 
             # Add close button
-            close_btn = QtWidgets.QPushButton("Close")
-            close_btn.setStyleSheet(BTN_TABLE)
-            self.positions_table.setCellWidget(row, 6, close_btn)
-
-        layout.addWidget(self.positions_table)
+            if table.cellWidget(row, 6) is None:
+                close_btn = QtWidgets.QPushButton("Close")
+                close_btn.setProperty("variant", "table")
+                table.setCellWidget(row, 6, close_btn)
 
 
 class PortfolioTab(QtWidgets.QWidget):
@@ -132,7 +265,7 @@ class PortfolioTab(QtWidgets.QWidget):
 
         row1.addWidget(QtWidgets.QLabel("Total Value:"))
         self.total_value = QtWidgets.QLabel("$1,234.56")
-        self.total_value.setStyleSheet("font-weight: bold;")
+        self.total_value.setProperty("bold", True)
         row1.addWidget(self.total_value)
 
         row1.addWidget(QtWidgets.QLabel("Cash (USDC):"))
@@ -152,7 +285,7 @@ class PortfolioTab(QtWidgets.QWidget):
 
         row2.addWidget(QtWidgets.QLabel("Unrealized PnL:"))
         self.unrealized_pnl = QtWidgets.QLabel("+$45.20")
-        self.unrealized_pnl.setStyleSheet(f"color: {CLR_LONG};")
+        self.unrealized_pnl.setProperty("tone", "long")
         row2.addWidget(self.unrealized_pnl)
 
         row2.addWidget(QtWidgets.QLabel("Open Positions:"))
@@ -169,24 +302,190 @@ class PortfolioTab(QtWidgets.QWidget):
         layout.addStretch()
 
 
-class BottomTabs(QtWidgets.QTabWidget):
+class OperationsTab(QtWidgets.QWidget):
     """
-    Bottom panel with tabs for Portfolio, Orders, Positions.
+    Queued split / merge / redeem operations across markets.
+
+    The queue is sent as batched multicall transactions; progress and the
+    cached gas estimate are shown below the table.
     """
 
+    submit_requested = QtCore.Signal()
+    remove_requested = QtCore.Signal(list)  # Row indices
+    clear_requested = QtCore.Signal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._setup_ui()
 
+    def _setup_ui(self):
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(8, 8, 8, 8)
+
+        # Queue table
+        self.ops_table = QtWidgets.QTableWidget(0, 3)
+        self.ops_table.setHorizontalHeaderLabels(["Operation", "Market", "Amount"])
+        self.ops_table.verticalHeader().setVisible(False)
+        self.ops_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
+        self.ops_table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.ops_table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        header = self.ops_table.horizontalHeader()
+        header.setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(1, QtWidgets.QHeaderView.ResizeMode.Stretch)  # Market
+        header.setSectionResizeMode(2, QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
+        layout.addWidget(self.ops_table)
+
+        # Progress
+        self.progress_bar = QtWidgets.QProgressBar()
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setMaximumHeight(6)
+        self.progress_bar.hide()
+        layout.addWidget(self.progress_bar)
+
+        # Gas estimate / status + actions
+        bottom_layout = QtWidgets.QHBoxLayout()
+        self.status_label = QtWidgets.QLabel("No operations queued")
+        self.status_label.setProperty("tone", "muted")
+        bottom_layout.addWidget(self.status_label, 1)
+
+        self.remove_btn = QtWidgets.QPushButton("Remove")
+        self.clear_btn = QtWidgets.QPushButton("Clear")
+        self.submit_btn = QtWidgets.QPushButton("Submit Batch")
+        for btn in (self.remove_btn, self.clear_btn, self.submit_btn):
+            btn.setProperty("variant", "table")
+            bottom_layout.addWidget(btn)
+        layout.addLayout(bottom_layout)
+
+        self.remove_btn.clicked.connect(self._on_remove_clicked)
+        self.clear_btn.clicked.connect(self.clear_requested)
+        self.submit_btn.clicked.connect(self.submit_requested)
+
+    def _on_remove_clicked(self):
+        rows = sorted({index.row() for index in self.ops_table.selectionModel().selectedRows()})
+        if rows:
+            self.remove_requested.emit(rows)
+
+    def set_operations(self, rows: list[tuple[str, str, float]], gas: int | None, busy: bool):
+        """Show the queue as (kind, market title, amount) rows."""
+        table = self.ops_table
+        table.setRowCount(len(rows))
+        for row, (kind, title, amount) in enumerate(rows):
+            for col, value in enumerate((kind.capitalize(), title, f"{amount:,.2f}")):
+                item = table.item(row, col)
+                if item is None:
+                    item = QtWidgets.QTableWidgetItem()
+                    table.setItem(row, col, item)
+                item.setText(value)
+
+        if not busy:
+            if rows:
+                gas_text = "estimating gas..." if gas is None else f"~{gas:,} gas"
+                self.status_label.setText(f"{len(rows)} queued, {gas_text}")
+            else:
+                self.status_label.setText("No operations queued")
+        self.submit_btn.setText(f"Submit Batch ({len(rows)})" if rows else "Submit Batch")
+        self.submit_btn.setEnabled(bool(rows) and not busy)
+        self.remove_btn.setEnabled(not busy)
+        self.clear_btn.setEnabled(not busy)
+
+    def set_progress(self, progress: OperationsProgress):
+        self.progress_bar.setMaximum(max(progress.total, 1))
+        self.progress_bar.setValue(progress.done)
+        self.progress_bar.setVisible(progress.stage != "done")
+        self.status_label.setText(progress.message)
+        set_style_property(self.status_label, "tone", "short" if progress.stage == "failed" else "muted")
+
+
+class BottomTabs(QtWidgets.QTabWidget):
+    """
+    Bottom panel with tabs for Portfolio, Orders, Positions, Operations.
+
+    Only the default (Portfolio) tab is built up front. The others start as
+    empty pages and are filled by `build_deferred()`, or on first access.
+    """
+
+    # Re-emitted from OrdersTab once it exists (CancelRequest)
+    cancel_requested = QtCore.Signal(object)
+    # Re-emitted from OperationsTab once it exists
+    operations_submit_requested = QtCore.Signal()
+    operations_remove_requested = QtCore.Signal(list)
+    operations_clear_requested = QtCore.Signal()
+
+    def __init__(self, orders: OrderStore | None = None, positions: PositionBook | None = None, parent=None):
+        super().__init__(parent)
+        self.orders = orders if orders is not None else OrderStore()
+        self.positions = positions if positions is not None else PositionBook()
+        self._orders_tab: OrdersTab | None = None
+        self._positions_tab: PositionsTab | None = None
+        self._operations_tab: OperationsTab | None = None
+        self._setup_ui()
+
     def _setup_ui(self):
         # Portfolio tab (default)
         self.portfolio_tab = PortfolioTab()
         self.addTab(self.portfolio_tab, "Portfolio")
 
-        # Orders tab
-        self.orders_tab = OrdersTab()
-        self.addTab(self.orders_tab, "Orders")
-
-        # Positions tab
-        self.positions_tab = PositionsTab()
-        self.addTab(self.positions_tab, "Positions")
+        # Orders / Positions / Operations tabs (built lazily)
+        self._orders_page = self._add_lazy_page("Orders")
+        self._positions_page = self._add_lazy_page("Positions")
+        self._operations_page = self._add_lazy_page("Operations")
+
+        self.currentChanged.connect(self._on_current_changed)
+
+    def _add_lazy_page(self, title: str) -> QtWidgets.QWidget:
+        """Add an empty page that a tab is inserted into later."""
+        page = QtWidgets.QWidget()
+        layout = QtWidgets.QVBoxLayout(page)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.addTab(page, title)
+        return page
+
+    @property
+    def orders_tab(self) -> OrdersTab:
+        return self._build_orders_tab()
+
+    @property
+    def positions_tab(self) -> PositionsTab:
+        return self._build_positions_tab()
+
+    @property
+    def operations_tab(self) -> OperationsTab:
+        return self._build_operations_tab()
+
+    def _build_orders_tab(self) -> OrdersTab:
+        if self._orders_tab is None:
+            self._orders_tab = OrdersTab(self.orders)
+            self._orders_tab.cancel_requested.connect(self.cancel_requested)
+            self._orders_page.layout().addWidget(self._orders_tab)
+        return self._orders_tab
+
+    def _build_positions_tab(self) -> PositionsTab:
+        if self._positions_tab is None:
+            self._positions_tab = PositionsTab(self.positions)
+            self._positions_page.layout().addWidget(self._positions_tab)
+        return self._positions_tab
+
+    def _build_operations_tab(self) -> OperationsTab:
+        if self._operations_tab is None:
+            self._operations_tab = OperationsTab()
+            self._operations_tab.submit_requested.connect(self.operations_submit_requested)
+            self._operations_tab.remove_requested.connect(self.operations_remove_requested)
+            self._operations_tab.clear_requested.connect(self.operations_clear_requested)
+            self._operations_page.layout().addWidget(self._operations_tab)
+        return self._operations_tab
+
+    def build_deferred(self):
+        """Build the non-default tabs (called after first paint)."""
+        self._build_orders_tab()
+        self._build_positions_tab()
+        self._build_operations_tab()
+
+    def _on_current_changed(self, index: int):
+        # User got to a tab before build_deferred() ran
+        page = self.widget(index)
+        if page is self._orders_page:
+            self._build_orders_tab()
+        elif page is self._positions_page:
+            self._build_positions_tab()
+        elif page is self._operations_page:
+            self._build_operations_tab()
@@ -0,0 +1,165 @@
+"""Liquidity heatmap widget - resting size per price over time."""
+
+import numpy as np
+from PySide6 import QtWidgets, QtCore, QtGui
+
+from prediction_markets_ui.core.orderbook import PRICE_SCALE, OrderBook
+from prediction_markets_ui.theme.colors import BG_DARKEST, CLR_MUTED
+
+
+def _build_lut() -> np.ndarray:
+    """256-entry ARGB colour map: background -> blue -> cyan -> yellow."""
+    stops = np.array([
+        [0x1e, 0x1e, 0x1e],
+        [0x0d, 0x47, 0xa1],
+        [0x4f, 0xc3, 0xf7],
+        [0xff, 0xeb, 0x3b],
+    ], dtype=np.float32)
+    positions = np.linspace(0.0, 1.0, len(stops))
+    x = np.linspace(0.0, 1.0, 256)
+    rgb = np.stack([np.interp(x, positions, stops[:, c]) for c in range(3)], axis=1).astype(np.uint32)
+    return (0xFF << 24) | (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+
+
+_LUT = _build_lut()
+
+
+class LiquidityHeatmap(QtWidgets.QWidget):
+    """
+    Heatmap of resting book size per price bucket over the last N samples.
+
+    Samples go into a fixed (time x price) NumPy ring buffer and are colour
+    mapped straight into a QImage that shares memory with a pixel array.
+    Each sample only writes one new column, so memory and per-frame cost
+    stay flat however long the session runs. Sampling only runs while the
+    widget is shown, so pooled and background tabs cost nothing.
+    """
+
+    def __init__(self, parent=None, columns: int = 600, bucket_ticks: int = PRICE_SCALE // 100,
+                 interval_ms: int = 1000):
+        super().__init__(parent)
+        self.columns = columns
+        self.bucket_ticks = bucket_ticks
+        self.rows = PRICE_SCALE // bucket_ticks + 1
+
+        # (time, price bucket) sizes and the matching (price row, time) pixels
+        self._sizes = np.zeros((columns, self.rows), dtype=np.float32)
+        self._pixels = np.full((self.rows, columns), _LUT[0], dtype=np.uint32)
+        self._image = QtGui.QImage(
+            self._pixels.data, columns, self.rows, columns * 4, QtGui.QImage.Format.Format_RGB32
+        )
+        self._head = -1  # column of the newest sample
+        self._filled = 0
+        self._scale = 0.0  # log1p of the largest size seen, for colour mapping
+
+        self._book: OrderBook | None = None
+        self._mirrored = False
+
+        self._bg_brush = QtGui.QBrush(QtGui.QColor(BG_DARKEST))
+        self._text_pen = QtGui.QPen(QtGui.QColor(CLR_MUTED))
+
+        self.setMinimumWidth(120)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.setToolTip("Resting size per price over time (newest on the right)")
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.sample)
+
+    def showEvent(self, event: QtGui.QShowEvent):
+        super().showEvent(event)
+        self._timer.start()
+
+    def hideEvent(self, event: QtGui.QHideEvent):
+        super().hideEvent(event)
+        self._timer.stop()
+
+    def set_book(self, book: OrderBook | None):
+        """Track a market's canonical book, discarding previous history."""
+        self._book = book
+        self.clear()
+
+    def set_outcome(self, outcome: str):
+        """Show prices from the YES or NO side (NO flips the price axis)."""
+        self._mirrored = outcome == "NO"
+        self.update()
+
+    def clear(self):
+        self._sizes.fill(0)
+        self._pixels.fill(_LUT[0])
+        self._head = -1
+        self._filled = 0
+        self._scale = 0.0
+        self.update()
+
+    # ---- Sampling ----
+
+    def sample(self):
+        """Append the current book state as the newest column."""
+        if self._book is None:
+            return
+
+        levels = [*self._book.bids.levels(), *self._book.asks.levels()]
+        column = np.zeros(self.rows, dtype=np.float32)
+        if levels:
+            ticks, sizes = np.array(levels, dtype=np.float64).T
+            np.add.at(column, (ticks // self.bucket_ticks).astype(np.intp), sizes)
+
+        self._head = (self._head + 1) % self.columns
+        self._filled = min(self._filled + 1, self.columns)
+        self._sizes[self._head] = column
+
+        peak = float(np.log1p(column.max()))
+        if peak > self._scale * 1.5 or self._scale == 0.0:
+            # Range grew noticeably: recolour the whole history once
+            self._scale = max(peak, 1e-9)
+            self._colorize(slice(None))
+        else:
+            self._colorize(self._head)
+        self.update()
+
+    def _colorize(self, cols):
+        """Map sizes of the given column(s) to pixels through the LUT."""
+        levels = np.log1p(self._sizes[cols]) * (255.0 / self._scale)
+        index = np.clip(levels, 0, 255).astype(np.uint8)
+        # Price rows run bottom-up (high prices at the top of the image)
+        self._pixels[::-1, cols] = _LUT[index].T
+
+    # ---- Painting ----
+
+    def paintEvent(self, event: QtGui.QPaintEvent):
+        painter = QtGui.QPainter(self)
+        rect = self.rect()
+        painter.fillRect(rect, self._bg_brush)
+        if self._filled == 0:
+            painter.setPen(self._text_pen)
+            painter.drawText(rect, QtCore.Qt.AlignmentFlag.AlignCenter, "No data")
+            return
+
+        # Only show the price range that ever had liquidity
+        active = np.flatnonzero(self._sizes.any(axis=0))
+        if active.size:
+            top_row = self.rows - 1 - int(active[-1])
+            bottom_row = self.rows - 1 - int(active[0])
+        else:
+            top_row, bottom_row = 0, self.rows - 1
+        row_span = bottom_row - top_row + 1
+
+        if self._mirrored:
+            # NO price = 1 - YES price: flip vertically
+            painter.translate(0, rect.height())
+            painter.scale(1, -1)
+
+        # Oldest samples on the left: [head+1, columns) then [0, head]
+        col_w = rect.width() / self.columns
+        older = self.columns - self._head - 1 if self._filled == self.columns else 0
+        x = rect.width() - self._filled * col_w
+        if older:
+            source = QtCore.QRectF(self._head + 1, top_row, older, row_span)
+            target = QtCore.QRectF(x, 0, older * col_w, rect.height())
+            painter.drawImage(target, self._image, source)
+            x += older * col_w
+        newer = self._head + 1
+        source = QtCore.QRectF(0, top_row, newer, row_span)
+        target = QtCore.QRectF(x, 0, newer * col_w, rect.height())
+        painter.drawImage(target, self._image, source)
@@ -1,10 +1,9 @@
 """Log panel widget - event log and debug console."""
 
 import sys
+from collections import deque
 from PySide6 import QtWidgets, QtCore
 
-from prediction_markets_ui.theme.colors import CLR_ACCENT, CLR_MUTED, BG_DARKEST, BORDER_DEFAULT
-
 
 class LogPanel(QtWidgets.QWidget):
     """
@@ -12,8 +11,14 @@ class LogPanel(QtWidgets.QWidget):
 
     - Event Log: Main events (orders, trades, connections, etc.)
     - Debug Console: stdout/print output for debugging
+
+    The Debug Console's text view is built by `build_deferred()` after first
+    paint; output written before then is buffered.
     """
 
+    # Limit lines for memory
+    MAX_LINES = 1000
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._original_stdout = sys.stdout
@@ -27,82 +32,51 @@ class LogPanel(QtWidgets.QWidget):
 
         # Event Log (left)
         event_group = QtWidgets.QGroupBox("Event Log")
-        event_group.setStyleSheet(f"""
-            QGroupBox {{
-                font-weight: bold;
-                color: {CLR_ACCENT};
-                border: 1px solid {BORDER_DEFAULT};
-                border-radius: 4px;
-                margin-top: 12px;
-                padding-top: 12px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 10px;
-                top: 2px;
-                padding: 0 5px;
-            }}
-        """)
+        event_group.setObjectName("eventLogGroup")
+        event_group.setProperty("role", "log")
         event_layout = QtWidgets.QVBoxLayout(event_group)
         event_layout.setContentsMargins(4, 4, 4, 4)
 
         self.event_log = QtWidgets.QPlainTextEdit()
         self.event_log.setReadOnly(True)
-        self.event_log.setMaximumBlockCount(1000)  # Limit lines for memory
-        self.event_log.setStyleSheet(f"""
-            QPlainTextEdit {{
-                background-color: {BG_DARKEST};
-                border: none;
-            }}
-        """)
+        self.event_log.setMaximumBlockCount(self.MAX_LINES)
         event_layout.addWidget(self.event_log)
 
         layout.addWidget(event_group)
 
         # Debug Console (right)
         debug_group = QtWidgets.QGroupBox("Debug Console")
-        debug_group.setStyleSheet(f"""
-            QGroupBox {{
-                font-weight: bold;
-                color: {CLR_MUTED};
-                border: 1px solid {BORDER_DEFAULT};
-                border-radius: 4px;
-                margin-top: 12px;
-                padding-top: 12px;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 10px;
-                top: 2px;
-                padding: 0 5px;
-            }}
-        """)
+        debug_group.setObjectName("debugConsoleGroup")
+        debug_group.setProperty("role", "log")
         debug_layout = QtWidgets.QVBoxLayout(debug_group)
         debug_layout.setContentsMargins(4, 4, 4, 4)
+        self._debug_group = debug_group
 
-        self.debug_log = QtWidgets.QPlainTextEdit()
-        self.debug_log.setReadOnly(True)
-        self.debug_log.setMaximumBlockCount(1000)  # Limit lines for memory
-        self.debug_log.setStyleSheet(f"""
-            QPlainTextEdit {{
-                background-color: {BG_DARKEST};
-                border: none;
-            }}
-        """)
-        debug_layout.addWidget(self.debug_log)
+        # Built in build_deferred()
+        self.debug_log: QtWidgets.QPlainTextEdit | None = None
 
         layout.addWidget(debug_group)
 
+    def build_deferred(self):
+        """Build the Debug Console view and flush buffered output into it."""
+        if self.debug_log is not None:
+            return
+        self.debug_log = QtWidgets.QPlainTextEdit()
+        self.debug_log.setReadOnly(True)
+        self.debug_log.setMaximumBlockCount(self.MAX_LINES)
+        self._debug_group.layout().addWidget(self.debug_log)
+        self._stdout_redirector.attach(self.debug_log)
+
     def _redirect_stdout(self):
         """Redirect stdout to debug console."""
-        self._stdout_redirector = StdoutRedirector(self.debug_log)
+        self._stdout_redirector = StdoutRedirector(max_buffered=self.MAX_LINES)
         sys.stdout = self._stdout_redirector
 
     def restore_stdout(self):
-        """Restore original stdout."""
-        sys.stdout = self._original_stdout
+        """Restore original stdout and release the console view."""
+        if sys.stdout is self._stdout_redirector:
+            sys.stdout = self._original_stdout
+        self._stdout_redirector.detach()
 
     def log_event(self, message: str):
         """Add a message to the event log."""
@@ -110,7 +84,7 @@ class LogPanel(QtWidgets.QWidget):
 
     def log_debug(self, message: str):
         """Add a message to the debug console."""
-        self.debug_log.appendPlainText(message)
+        self._stdout_redirector.append(message)
 
     def clear_event_log(self):
         """Clear the event log."""
@@ -118,18 +92,33 @@ class LogPanel(QtWidgets.QWidget):
 
     def clear_debug_log(self):
         """Clear the debug console."""
-        self.debug_log.clear()
+        self._stdout_redirector.clear()
 
 
 class StdoutRedirector(QtCore.QObject):
-    """Redirects stdout to a QPlainTextEdit widget."""
+    """
+    Redirects stdout to a QPlainTextEdit widget.
+
+    Until a widget is attached, the most recent lines are buffered.
+    """
 
     text_written = QtCore.Signal(str)
 
-    def __init__(self, text_edit: QtWidgets.QPlainTextEdit):
+    def __init__(self, text_edit: QtWidgets.QPlainTextEdit | None = None, max_buffered: int = 1000):
         super().__init__()
         self._text_edit = text_edit
-        self.text_written.connect(self._append_text)
+        self._pending: deque[str] = deque(maxlen=max_buffered)
+        self.text_written.connect(self.append)
+
+    def attach(self, text_edit: QtWidgets.QPlainTextEdit):
+        """Start writing to a widget, flushing anything buffered so far."""
+        self._text_edit = text_edit
+        while self._pending:
+            text_edit.appendPlainText(self._pending.popleft())
+
+    def detach(self):
+        """Stop writing to the widget; later output is buffered again."""
+        self._text_edit = None
 
     def write(self, text: str):
         """Write text to the widget (called by print())."""
@@ -140,6 +129,15 @@ class StdoutRedirector(QtCore.QObject):
         """Flush (no-op for compatibility)."""
         pass
 
-    def _append_text(self, text: str):
+    def append(self, text: str):
         """Append text to the widget (runs in main thread)."""
-        self._text_edit.appendPlainText(text)
+        if self._text_edit is None:
+            self._pending.append(text)
+        else:
+            self._text_edit.appendPlainText(text)
+
+    def clear(self):
+        """Clear the widget and any buffered text."""
+        self._pending.clear()
+        if self._text_edit is not None:
+            self._text_edit.clear()
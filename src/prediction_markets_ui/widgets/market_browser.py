@@ -2,7 +2,7 @@
 
 from PySide6 import QtWidgets, QtCore, QtGui
 
-from prediction_markets_ui.theme.colors import CLR_MUTED, CLR_ACCENT, CLR_LONG, BORDER_DEFAULT
+from prediction_markets_ui.core.domain import Event, Market, MarketCatalog
 
 
 class MarketBrowser(QtWidgets.QWidget):
@@ -13,13 +13,17 @@ class MarketBrowser(QtWidgets.QWidget):
     - Search input
     - Category filter
     - Event/Market tree (Events contain Markets)
+
+    Tree items hold only the event or market id; the records live in the
+    catalog.
     """
 
     # Signal emitted when a market is selected
     market_selected = QtCore.Signal(str, str)  # (event_id, market_id)
 
-    def __init__(self, parent=None):
+    def __init__(self, catalog: MarketCatalog | None = None, parent=None):
         super().__init__(parent)
+        self.catalog = catalog if catalog is not None else MarketCatalog()
         self._setup_ui()
 
     def _setup_ui(self):
@@ -29,7 +33,7 @@ class MarketBrowser(QtWidgets.QWidget):
 
         # Title
         title = QtWidgets.QLabel("Markets")
-        title.setStyleSheet(f"font-weight: bold; color: {CLR_ACCENT};")
+        title.setProperty("role", "title")
         layout.addWidget(title)
 
         # Search input
@@ -51,38 +55,19 @@ class MarketBrowser(QtWidgets.QWidget):
 
         # Event/Market tree
         self.market_tree = QtWidgets.QTreeWidget()
+        self.market_tree.setObjectName("marketTree")
         self.market_tree.setHeaderHidden(True)
-        self.market_tree.setStyleSheet(f"""
-            QTreeWidget::item {{
-                padding: 4px;
-                border-bottom: 1px solid #333;
-            }}
-            QTreeWidget::item:hover {{
-                background-color: #3a3a3a;
-            }}
-            QTreeWidget::item:selected {{
-                background-color: #1976d2;
-            }}
-            QTreeWidget::branch:has-children:!has-siblings:closed,
-            QTreeWidget::branch:closed:has-children:has-siblings {{
-                image: none;
-                border-image: none;
-            }}
-            QTreeWidget::branch:open:has-children:!has-siblings,
-            QTreeWidget::branch:open:has-children:has-siblings {{
-                image: none;
-                border-image: none;
-            }}
-        """)
 
         # Add placeholder events and markets
-        self._populate_placeholder_data()
+        if not len(self.catalog):
+            self._populate_placeholder_data()
+        self._populate_tree()
 
         layout.addWidget(self.market_tree, 1)  # stretch=1
 
         # Hint label
         hint = QtWidgets.QLabel("Double-click market to open")
-        hint.setStyleSheet(f"color: {CLR_MUTED}; font-style: italic;")
+        hint.setProperty("role", "hint")
         hint.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(hint)
 
@@ -118,22 +103,27 @@ class MarketBrowser(QtWidgets.QWidget):
         ]
 
         for event_title, markets in events_data:
-            event_item = QtWidgets.QTreeWidgetItem([f"📁 {event_title}"])
-            event_item.setToolTip(0, event_title)
-            event_item.setData(0, QtCore.Qt.ItemDataRole.UserRole, {"type": "event", "id": event_title})
+            self.catalog.add_event(
+                Event(event_title, event_title),
+                [Market(market_title, event_title, market_title) for market_title in markets],
+            )
+
+    def _populate_tree(self):
+        """Build the event/market tree from the catalog."""
+        role = QtCore.Qt.ItemDataRole.UserRole
+        for event in self.catalog.events.values():
+            event_item = QtWidgets.QTreeWidgetItem([f"📁 {event.title}"])
+            event_item.setToolTip(0, event.title)
+            event_item.setData(0, role, event.id)
             # Make event items bold
             font = event_item.font(0)
             font.setBold(True)
             event_item.setFont(0, font)
 
-            for market_title in markets:
-                market_item = QtWidgets.QTreeWidgetItem([f"  {market_title}"])
-                market_item.setToolTip(0, market_title)
-                market_item.setData(0, QtCore.Qt.ItemDataRole.UserRole, {
-                    "type": "market",
-                    "id": market_title,
-                    "event_id": event_title
-                })
+            for market in self.catalog.markets_of(event.id):
+                market_item = QtWidgets.QTreeWidgetItem([f"  {market.title}"])
+                market_item.setToolTip(0, market.title)
+                market_item.setData(0, role, market.id)
                 event_item.addChild(market_item)
 
             self.market_tree.addTopLevelItem(event_item)
@@ -144,7 +134,7 @@ class MarketBrowser(QtWidgets.QWidget):
 
     def _on_item_double_clicked(self, item: QtWidgets.QTreeWidgetItem, column: int):
         """Handle item double-click."""
-        data = item.data(0, QtCore.Qt.ItemDataRole.UserRole)
-        if data and data.get("type") == "market":
+        market = self.catalog.market(item.data(0, QtCore.Qt.ItemDataRole.UserRole))
+        if market is not None and item.parent() is not None:
             # Emit market selection with event context
-            self.market_selected.emit(data["event_id"], data["id"])
+            self.market_selected.emit(market.event_id, market.id)
@@ -0,0 +1,205 @@
+"""Custom-painted orderbook depth view."""
+
+from itertools import accumulate, islice
+
+from PySide6 import QtWidgets, QtCore, QtGui
+
+from prediction_markets_ui.core.orderbook import BookView, from_ticks
+from prediction_markets_ui.theme.colors import (
+    CLR_LONG,
+    CLR_SHORT,
+    CLR_TEXT,
+    CLR_MUTED,
+    BG_BASE,
+    BG_HOVER,
+    BORDER_DEFAULT,
+)
+
+_ALIGN_RIGHT = QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter
+
+
+class DepthView(QtWidgets.QWidget):
+    """
+    Orderbook ladder drawn in a single paintEvent.
+
+    Asks sit above the separator (best ask nearest to it), bids below. Each
+    row shows price, size and cumulative total with a horizontal depth bar.
+    Only rows that fit on screen are touched, so deep books cost the same
+    as shallow ones. Pens, brushes and price labels (QStaticText) are built
+    once and reused across frames.
+    """
+
+    price_clicked = QtCore.Signal(float)
+
+    HEADERS = ("Price", "Size", "Total ($)")
+    SEPARATOR_HEIGHT = 3
+    # Upper bound on cached price labels (one per distinct tick)
+    MAX_CACHED_LABELS = 4096
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._book: BookView | None = None
+        self._painted_version = -1
+        # Row layout of the last paint: row index -> price, for clicks
+        self._row_prices: dict[int, float] = {}
+
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_OpaquePaintEvent)
+        self.setMinimumHeight(120)
+
+        # Cached paint resources
+        self._bg_brush = QtGui.QBrush(QtGui.QColor(BG_BASE))
+        self._header_brush = QtGui.QBrush(QtGui.QColor(BG_HOVER))
+        self._separator_brush = QtGui.QBrush(QtGui.QColor(BORDER_DEFAULT))
+        self._ask_bar_brush = QtGui.QBrush(self._translucent(CLR_SHORT))
+        self._bid_bar_brush = QtGui.QBrush(self._translucent(CLR_LONG))
+        self._ask_pen = QtGui.QPen(QtGui.QColor(CLR_SHORT))
+        self._bid_pen = QtGui.QPen(QtGui.QColor(CLR_LONG))
+        self._text_pen = QtGui.QPen(QtGui.QColor(CLR_TEXT))
+        self._header_pen = QtGui.QPen(QtGui.QColor(CLR_MUTED))
+
+        self._header_texts = [self._static_text(text) for text in self.HEADERS]
+        self._price_texts: dict[int, QtGui.QStaticText] = {}
+        self._update_metrics()
+
+    @staticmethod
+    def _translucent(color: str) -> QtGui.QColor:
+        qcolor = QtGui.QColor(color)
+        qcolor.setAlpha(48)
+        return qcolor
+
+    @staticmethod
+    def _static_text(text: str) -> QtGui.QStaticText:
+        static = QtGui.QStaticText(text)
+        static.setPerformanceHint(QtGui.QStaticText.PerformanceHint.AggressiveCaching)
+        return static
+
+    def _update_metrics(self):
+        metrics = self.fontMetrics()
+        self._row_height = metrics.height() + 6
+        self._text_offset = (self._row_height - metrics.height()) / 2
+        for static in self._header_texts:
+            static.prepare(QtGui.QTransform(), self.font())
+        self._price_texts.clear()
+
+    def changeEvent(self, event: QtCore.QEvent):
+        if event.type() == QtCore.QEvent.Type.FontChange:
+            self._update_metrics()
+        super().changeEvent(event)
+
+    # ---- Data ----
+
+    def set_book(self, book: BookView | None):
+        """Show a book (or outcome view of one)."""
+        self._book = book
+        self._painted_version = -1
+        self.update()
+
+    def refresh(self):
+        """Repaint if the book changed since the last paint."""
+        if self._book is not None and self._book.version != self._painted_version:
+            self.update()
+
+    def _price_text(self, tick: int) -> QtGui.QStaticText:
+        static = self._price_texts.get(tick)
+        if static is None:
+            if len(self._price_texts) >= self.MAX_CACHED_LABELS:
+                self._price_texts.clear()
+            static = self._price_texts[tick] = self._static_text(f"{from_ticks(tick):.2f}")
+            static.prepare(QtGui.QTransform(), self.font())
+        return static
+
+    # ---- Painting ----
+
+    def paintEvent(self, event: QtGui.QPaintEvent):
+        painter = QtGui.QPainter(self)
+        width, height = self.width(), self.height()
+        row_h = self._row_height
+        col_w = width / 3
+
+        painter.fillRect(0, 0, width, height, self._bg_brush)
+
+        # Header
+        painter.fillRect(0, 0, width, row_h, self._header_brush)
+        painter.setPen(self._header_pen)
+        for col, static in enumerate(self._header_texts):
+            x = (col + 1) * col_w - static.size().width() - 8
+            painter.drawStaticText(QtCore.QPointF(x, self._text_offset), static)
+
+        self._row_prices.clear()
+        book = self._book
+        if book is None:
+            return
+
+        # Split the remaining height between asks (top) and bids (bottom)
+        body_top = row_h
+        rows = max((height - body_top - self.SEPARATOR_HEIGHT) // row_h, 0)
+        ask_rows = rows // 2
+        bid_rows = rows - ask_rows
+        separator_y = body_top + ask_rows * row_h
+
+        asks = list(islice(book.asks.levels(), ask_rows))
+        bids = list(islice(book.bids.levels(), bid_rows))
+        ask_totals = list(accumulate(from_ticks(t) * s for t, s in asks))
+        bid_totals = list(accumulate(from_ticks(t) * s for t, s in bids))
+        max_total = max(ask_totals[-1:] + bid_totals[-1:], default=0.0) or 1.0
+
+        painter.fillRect(0, separator_y, width, self.SEPARATOR_HEIGHT, self._separator_brush)
+
+        # Best ask sits just above the separator, worse asks stack upwards
+        for i, ((tick, size), total) in enumerate(zip(asks, ask_totals)):
+            row = ask_rows - 1 - i
+            y = body_top + row * row_h
+            self._paint_row(painter, y, col_w, width, tick, size, total, max_total,
+                            self._ask_pen, self._ask_bar_brush)
+            self._row_prices[row] = from_ticks(tick)
+
+        bids_top = separator_y + self.SEPARATOR_HEIGHT
+        for i, ((tick, size), total) in enumerate(zip(bids, bid_totals)):
+            y = bids_top + i * row_h
+            self._paint_row(painter, y, col_w, width, tick, size, total, max_total,
+                            self._bid_pen, self._bid_bar_brush)
+            self._row_prices[ask_rows + i] = from_ticks(tick)
+
+        self._painted_version = book.version
+
+    def _paint_row(self, painter: QtGui.QPainter, y: float, col_w: float, width: int,
+                   tick: int, size: float, total: float, max_total: float,
+                   price_pen: QtGui.QPen, bar_brush: QtGui.QBrush):
+        row_h = self._row_height
+
+        # Depth bar grows from the right edge
+        bar_w = width * total / max_total
+        painter.fillRect(QtCore.QRectF(width - bar_w, y + 1, bar_w, row_h - 2), bar_brush)
+
+        price_text = self._price_text(tick)
+        painter.setPen(price_pen)
+        painter.drawStaticText(
+            QtCore.QPointF(col_w - price_text.size().width() - 8, y + self._text_offset),
+            price_text,
+        )
+
+        painter.setPen(self._text_pen)
+        painter.drawText(QtCore.QRectF(col_w, y, col_w - 8, row_h), _ALIGN_RIGHT, f"{size:,.0f}")
+        painter.drawText(QtCore.QRectF(2 * col_w, y, col_w - 8, row_h), _ALIGN_RIGHT, f"${total:,.2f}")
+
+    # ---- Input ----
+
+    def _row_at(self, y: float) -> int | None:
+        body_top = self._row_height
+        if y < body_top:
+            return None
+        rows = max((self.height() - body_top - self.SEPARATOR_HEIGHT) // self._row_height, 0)
+        ask_rows = rows // 2
+        separator_y = body_top + ask_rows * self._row_height
+        if y < separator_y:
+            return int((y - body_top) // self._row_height)
+        if y < separator_y + self.SEPARATOR_HEIGHT:
+            return None
+        return ask_rows + int((y - separator_y - self.SEPARATOR_HEIGHT) // self._row_height)
+
+    def mousePressEvent(self, event: QtGui.QMouseEvent):
+        row = self._row_at(event.position().y())
+        price = self._row_prices.get(row)
+        if price is not None:
+            self.price_clicked.emit(price)
+        super().mousePressEvent(event)
@@ -0,0 +1,270 @@
+"""Performance HUD - translucent overlay with live runtime metrics."""
+
+import os
+import sys
+import time
+from collections import deque
+from typing import Callable
+
+from PySide6 import QtWidgets, QtCore, QtGui
+
+from prediction_markets_ui.core.ingest import Ingestor
+
+try:
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    _PAGE_SIZE = 0
+
+
+def _rss_bytes() -> int | None:
+    """Resident set size, where /proc makes it cheap to read (Linux)."""
+    if not _PAGE_SIZE:
+        return None
+    try:
+        with open("/proc/self/statm", "rb") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class PaintTimingApplication(QtWidgets.QApplication):
+    """
+    QApplication that can time the delivery of paint events.
+
+    Events are delivered exactly as usual; while `paint_hook` is set, each
+    paint event sent to a widget is timed around the normal `notify()`, so
+    event filters (e.g. scroll-area viewports) still run.
+    """
+
+    paint_hook: Callable[[QtWidgets.QWidget, float], None] | None = None
+
+    def notify(self, receiver: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        hook = self.paint_hook
+        if hook is None or event.type() != QtCore.QEvent.Type.Paint or not isinstance(receiver, QtWidgets.QWidget):
+            return super().notify(receiver, event)
+        start = time.perf_counter()
+        result = super().notify(receiver, event)
+        hook(receiver, time.perf_counter() - start)
+        return result
+
+
+class PaintMonitor(QtCore.QObject):
+    """
+    Times paint events per widget class and counts frames (repaint passes)
+    of one window.
+
+    Frames are counted by an application event filter that never consumes
+    events. Paint times need the application to be a
+    PaintTimingApplication (`main` creates one with PM_UI_PAINT_TIMING=1);
+    otherwise only frames are counted. Both are only hooked in while
+    running.
+    """
+
+    def __init__(self, window: QtWidgets.QWidget, parent=None):
+        super().__init__(parent)
+        self._window = window
+        self._running = False
+        self.frames = 0
+        # Widget class name -> [paint count, total seconds]
+        self.paints: dict[str, list] = {}
+
+    @property
+    def timing_paints(self) -> bool:
+        return isinstance(QtWidgets.QApplication.instance(), PaintTimingApplication)
+
+    def start(self):
+        if not self._running:
+            app = QtWidgets.QApplication.instance()
+            app.installEventFilter(self)
+            if isinstance(app, PaintTimingApplication):
+                app.paint_hook = self._on_paint
+            self._running = True
+
+    def stop(self):
+        if self._running:
+            app = QtWidgets.QApplication.instance()
+            app.removeEventFilter(self)
+            if isinstance(app, PaintTimingApplication):
+                app.paint_hook = None
+            self._running = False
+
+    def take(self) -> tuple[int, dict[str, list]]:
+        """(frames, paints) since the last call."""
+        frames, paints = self.frames, self.paints
+        self.frames, self.paints = 0, {}
+        return frames, paints
+
+    def _on_paint(self, widget: QtWidgets.QWidget, elapsed: float):
+        # A scroll area's viewport paints on behalf of the view (table, tree, text edit)
+        parent = widget.parentWidget()
+        if isinstance(parent, QtWidgets.QAbstractScrollArea) and parent.viewport() is widget:
+            widget = parent
+        name = type(widget).__name__
+        stat = self.paints.get(name)
+        if stat is None:
+            stat = self.paints[name] = [0, 0.0]
+        stat[0] += 1
+        stat[1] += elapsed
+
+    def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        if obj is self._window and event.type() == QtCore.QEvent.Type.UpdateRequest:
+            self.frames += 1
+        return False
+
+
+class PerfHud(QtWidgets.QFrame):
+    """
+    Overlay in the top-right corner of its parent window showing FPS,
+    event-loop lag, ingest queue depth, messages/sec per market, paint
+    time per widget class and heap size.
+
+    Sampling only runs while the HUD is visible: a 100 ms lag probe timer,
+    a once-a-second refresh, and the paint filter.
+    """
+
+    REFRESH_MS = 1000
+    LAG_PROBE_MS = 100
+    # Rows of the per-market and per-widget tables
+    TOP_N = 5
+
+    def __init__(self, ingestor: Ingestor | None, parent: QtWidgets.QWidget):
+        super().__init__(parent)
+        self.setObjectName("perfHud")
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_StyledBackground)
+        self.ingestor = ingestor
+        self.paint_monitor = PaintMonitor(parent.window(), self)
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(8, 6, 8, 6)
+        self.text = QtWidgets.QLabel()
+        self.text.setObjectName("perfHudText")
+        self.text.setTextFormat(QtCore.Qt.TextFormat.PlainText)
+        font = QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.SystemFont.FixedFont)
+        self.text.setFont(font)
+        layout.addWidget(self.text)
+
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setInterval(self.REFRESH_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+        self._lag_timer = QtCore.QTimer(self)
+        self._lag_timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        self._lag_timer.setInterval(self.LAG_PROBE_MS)
+        self._lag_timer.timeout.connect(self._probe_lag)
+
+        self._last_probe = 0.0
+        self._lags: deque[float] = deque(maxlen=self.REFRESH_MS // self.LAG_PROBE_MS * 5)
+        self._last_refresh = 0.0
+        self._last_counts: dict[str, int] = {}
+        self.last_metrics: dict = {}
+
+        parent.installEventFilter(self)
+        self.hide()
+
+    # ---- Visibility ----
+
+    def set_active(self, active: bool):
+        """Show the overlay and start sampling, or hide it and stop."""
+        if active:
+            self._last_probe = self._last_refresh = time.perf_counter()
+            self._last_counts = self.ingestor.message_counts() if self.ingestor is not None else {}
+            self._lags.clear()
+            self.paint_monitor.take()
+            self.paint_monitor.start()
+            self._lag_timer.start()
+            self._refresh_timer.start()
+            self.text.setText("Sampling...")
+            self._reposition()
+            self.show()
+            self.raise_()
+        else:
+            self._refresh_timer.stop()
+            self._lag_timer.stop()
+            self.paint_monitor.stop()
+            self.hide()
+
+    def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        if obj is self.parent() and event.type() == QtCore.QEvent.Type.Resize and self.isVisible():
+            self._reposition()
+        return False
+
+    def _reposition(self):
+        self.adjustSize()
+        parent = self.parentWidget()
+        self.move(parent.width() - self.width() - 12, 56)
+
+    # ---- Sampling ----
+
+    def _probe_lag(self):
+        now = time.perf_counter()
+        self._lags.append(max(now - self._last_probe - self.LAG_PROBE_MS / 1000, 0.0))
+        self._last_probe = now
+
+    def sample(self) -> dict:
+        """Collect the metrics for the interval since the previous sample."""
+        now = time.perf_counter()
+        interval = max(now - self._last_refresh, 1e-6)
+        self._last_refresh = now
+
+        frames, paints = self.paint_monitor.take()
+        lags = list(self._lags)
+        self._lags.clear()
+        metrics = {
+            "fps": frames / interval,
+            "lag_mean_ms": 1000 * sum(lags) / len(lags) if lags else 0.0,
+            "lag_max_ms": 1000 * max(lags, default=0.0),
+            "paint_ms": {
+                name: (count / interval, 1000 * total / count)
+                for name, (count, total) in paints.items()
+            },
+            "blocks": sys.getallocatedblocks(),
+            "rss": _rss_bytes(),
+            "inbound": 0,
+            "pending_markets": 0,
+            "market_rates": {},
+        }
+        if self.ingestor is not None:
+            stats = self.ingestor.stats()
+            counts = self.ingestor.message_counts()
+            metrics["inbound"] = stats["inbound"]
+            metrics["pending_markets"] = stats["pending_markets"]
+            metrics["market_rates"] = {
+                market_id: (count - self._last_counts.get(market_id, 0)) / interval
+                for market_id, count in counts.items()
+            }
+            self._last_counts = counts
+        self.last_metrics = metrics
+        return metrics
+
+    def refresh(self):
+        m = self.sample()
+        lines = [
+            f"FPS        {m['fps']:6.1f}",
+            f"Loop lag   {m['lag_mean_ms']:6.1f} ms avg  {m['lag_max_ms']:6.1f} ms max",
+            f"Ingest     {m['inbound']:6d} queued  {m['pending_markets']:4d} markets pending",
+        ]
+        heap = f"Heap       {m['blocks']:,} blocks"
+        if m["rss"] is not None:
+            heap += f"  RSS {m['rss'] / 2**20:,.0f} MB"
+        lines.append(heap)
+
+        rates = sorted(m["market_rates"].items(), key=lambda item: item[1], reverse=True)[:self.TOP_N]
+        if rates:
+            lines.append(f"Msgs/s     {sum(m['market_rates'].values()):8,.0f} total")
+            lines += [f"  {rate:8,.0f}  {_clip(market_id, 28)}" for market_id, rate in rates]
+
+        paints = sorted(m["paint_ms"].items(), key=lambda item: item[1][0] * item[1][1], reverse=True)
+        if paints:
+            lines.append("Paint      per s    ms each")
+            lines += [
+                f"  {per_s:6.1f}  {ms:7.2f}  {_clip(name, 22)}"
+                for name, (per_s, ms) in paints[:self.TOP_N]
+            ]
+        elif not self.paint_monitor.timing_paints:
+            lines.append("Paint      not timed (run with PM_UI_PAINT_TIMING=1)")
+        self.text.setText("\n".join(lines))
+        self._reposition()
+
+
+def _clip(text: str, width: int) -> str:
+    return text if len(text) <= width else text[:width - 1] + "…"
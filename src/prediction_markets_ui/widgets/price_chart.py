@@ -0,0 +1,194 @@
+"""Price chart widget - candles with level-of-detail decimation."""
+
+import time
+
+from PySide6 import QtWidgets, QtCore, QtGui
+
+from prediction_markets_ui.core.candles import RESOLUTIONS, CandleSet
+from prediction_markets_ui.theme.colors import (
+    CLR_LONG,
+    CLR_SHORT,
+    CLR_MUTED,
+    CLR_ACCENT,
+    BG_DARKEST,
+    BORDER_DEFAULT,
+)
+
+_RESOLUTION_NAMES = {seconds: name for name, seconds in RESOLUTIONS.items()}
+
+
+class PriceChart(QtWidgets.QWidget):
+    """
+    Candlestick chart for one market, in YES prices or, for the NO
+    outcome, mirrored (1 - p) like the NO book.
+
+    The resolution is picked from the visible time span, and candles are
+    merged further until there is at most one per pixel column, so zooming
+    out over weeks never draws more primitives than the chart is wide.
+
+    - Mouse wheel: zoom time span
+    - Drag: pan back in time
+    - Double-click: return to following the latest trade
+    """
+
+    # Minimum candle width (px) before switching to high/low lines
+    MIN_CANDLE_PX = 3
+    AXIS_WIDTH = 48
+    MIN_SPAN = 60.0
+    MAX_SPAN = 60 * 86400.0
+
+    def __init__(self, parent=None, span: float = 900.0, refresh_ms: int = 500):
+        super().__init__(parent)
+        self._candles: CandleSet | None = None
+        self._span = span
+        self._end: float | None = None  # None = follow latest trade
+        self._drag_x: float | None = None
+        self._seen_time: float | None = None
+        self._mirrored = False
+
+        self.setMinimumHeight(100)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+        # Cached paint resources
+        self._bg_brush = QtGui.QBrush(QtGui.QColor(BG_DARKEST))
+        self._up_brush = QtGui.QBrush(QtGui.QColor(CLR_LONG))
+        self._down_brush = QtGui.QBrush(QtGui.QColor(CLR_SHORT))
+        self._up_pen = QtGui.QPen(QtGui.QColor(CLR_LONG))
+        self._down_pen = QtGui.QPen(QtGui.QColor(CLR_SHORT))
+        self._axis_pen = QtGui.QPen(QtGui.QColor(BORDER_DEFAULT))
+        self._text_pen = QtGui.QPen(QtGui.QColor(CLR_MUTED))
+        last_pen = QtGui.QPen(QtGui.QColor(CLR_ACCENT))
+        last_pen.setStyle(QtCore.Qt.PenStyle.DashLine)
+        self._last_pen = last_pen
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start(refresh_ms)
+
+    def set_candles(self, candles: CandleSet | None):
+        """Show a market's candles and follow the latest trade."""
+        self._candles = candles
+        self._end = None
+        self._seen_time = None
+        self.update()
+
+    def set_outcome(self, outcome: str):
+        """Plot YES prices, or NO prices (1 - p) for the NO outcome."""
+        mirrored = outcome == "NO"
+        if mirrored != self._mirrored:
+            self._mirrored = mirrored
+            self.update()
+
+    def refresh(self):
+        """Repaint when new trades arrived (or when following the clock)."""
+        if self._candles is None or not self.isVisible():
+            return
+        last = self._candles.last_time()
+        if last != self._seen_time or self._end is None:
+            self.update()
+
+    # ---- Painting ----
+
+    def _time_range(self) -> tuple[float, float]:
+        end = self._end
+        if end is None:
+            last = self._candles.last_time() if self._candles else None
+            end = max(time.time(), last or 0.0)
+        return end - self._span, end
+
+    def paintEvent(self, event: QtGui.QPaintEvent):
+        painter = QtGui.QPainter(self)
+        rect = self.rect()
+        painter.fillRect(rect, self._bg_brush)
+
+        plot_w = rect.width() - self.AXIS_WIDTH
+        plot_h = rect.height() - 8
+        candles = self._candles
+        if candles is None or plot_w <= 0 or plot_h <= 0:
+            return
+
+        self._seen_time = candles.last_time()
+        start, end = self._time_range()
+        series = candles.best_series(end - start, plot_w // self.MIN_CANDLE_PX)
+        data = series.decimate(start, end, plot_w)
+        if not data:
+            painter.setPen(self._text_pen)
+            painter.drawText(rect, QtCore.Qt.AlignmentFlag.AlignCenter, "No trades")
+            return
+        if self._mirrored:
+            # A NO candle's high is the YES low, and so on
+            data = [(t, 1 - o, 1 - l, 1 - h, 1 - c, v) for t, o, h, l, c, v in data]
+
+        low = min(c[3] for c in data)
+        high = max(c[2] for c in data)
+        pad = max((high - low) * 0.05, 0.005)
+        low, high = low - pad, high + pad
+        y_scale = plot_h / (high - low)
+        x_scale = plot_w / (end - start)
+
+        def y_of(price: float) -> float:
+            return 4 + (high - price) * y_scale
+
+        lo, hi = series.index_range(start, end)
+        if len(data) < hi - lo:
+            candle_px = 1.0  # Merged into one slice per pixel column
+        else:
+            candle_px = series.seconds * x_scale
+        draw_bodies = candle_px >= self.MIN_CANDLE_PX
+        body_w = max(candle_px * 0.7, 1.0)
+
+        for t, o, h, l, c, _ in data:
+            up = c >= o
+            x = (t - start) * x_scale
+            if x + candle_px < 0:
+                continue
+            painter.setPen(self._up_pen if up else self._down_pen)
+            center = x + candle_px / 2
+            painter.drawLine(QtCore.QPointF(center, y_of(h)), QtCore.QPointF(center, y_of(l)))
+            if draw_bodies:
+                top, bottom = y_of(max(o, c)), y_of(min(o, c))
+                painter.fillRect(
+                    QtCore.QRectF(center - body_w / 2, top, body_w, max(bottom - top, 1.0)),
+                    self._up_brush if up else self._down_brush,
+                )
+
+        # Last price line
+        last_close = data[-1][4]
+        painter.setPen(self._last_pen)
+        painter.drawLine(QtCore.QPointF(0, y_of(last_close)), QtCore.QPointF(plot_w, y_of(last_close)))
+
+        # Price axis
+        painter.setPen(self._axis_pen)
+        painter.drawLine(plot_w, 0, plot_w, rect.height())
+        painter.setPen(self._text_pen)
+        for price in (high - pad, last_close, low + pad):
+            painter.drawText(QtCore.QPointF(plot_w + 4, y_of(price) + 4), f"{price:.3f}")
+        label = _RESOLUTION_NAMES.get(series.seconds, f"{series.seconds}s")
+        painter.drawText(QtCore.QPointF(6, 14), label)
+
+    # ---- Input ----
+
+    def wheelEvent(self, event: QtGui.QWheelEvent):
+        factor = 1 / 1.25 if event.angleDelta().y() > 0 else 1.25
+        self._span = min(max(self._span * factor, self.MIN_SPAN), self.MAX_SPAN)
+        self.update()
+
+    def mousePressEvent(self, event: QtGui.QMouseEvent):
+        self._drag_x = event.position().x()
+
+    def mouseMoveEvent(self, event: QtGui.QMouseEvent):
+        if self._drag_x is None or self.width() <= self.AXIS_WIDTH:
+            return
+        x = event.position().x()
+        start, end = self._time_range()
+        seconds_per_px = (end - start) / (self.width() - self.AXIS_WIDTH)
+        self._end = end - (x - self._drag_x) * seconds_per_px
+        self._drag_x = x
+        self.update()
+
+    def mouseReleaseEvent(self, event: QtGui.QMouseEvent):
+        self._drag_x = None
+
+    def mouseDoubleClickEvent(self, event: QtGui.QMouseEvent):
+        self._end = None
+        self.update()
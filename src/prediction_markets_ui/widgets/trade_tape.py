@@ -0,0 +1,127 @@
+"""Trade tape widget - time & sales for one market."""
+
+import time
+
+from PySide6 import QtWidgets, QtCore, QtGui
+
+from prediction_markets_ui.core.orderbook import from_ticks
+from prediction_markets_ui.core.trades import BUY, TradeBuffer
+from prediction_markets_ui.theme.colors import CLR_LONG, CLR_SHORT
+
+_ALIGN_RIGHT = QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter
+_SIDE_BRUSHES = {
+    True: QtGui.QBrush(QtGui.QColor(CLR_LONG)),
+    False: QtGui.QBrush(QtGui.QColor(CLR_SHORT)),
+}
+
+
+class TradeTapeModel(QtCore.QAbstractTableModel):
+    """
+    Table model over a TradeBuffer, newest trade first.
+
+    Rows are pinned to the buffer's sequence numbers at the last `sync()`,
+    so the view stays consistent between refreshes however many trades
+    arrive. Cells are formatted on demand, i.e. only for visible rows.
+    """
+
+    HEADERS = ("Price", "Size", "Side", "Time")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._buffer: TradeBuffer | None = None
+        self._anchor = 0  # buffer.total at the last sync
+        self._rows = 0
+
+    def set_buffer(self, buffer: TradeBuffer | None):
+        self.beginResetModel()
+        self._buffer = buffer
+        self._anchor = buffer.total if buffer is not None else 0
+        self._rows = len(buffer) if buffer is not None else 0
+        self.endResetModel()
+
+    def sync(self) -> bool:
+        """Catch up with the buffer in one model update. Returns True if anything changed."""
+        buffer = self._buffer
+        if buffer is None or buffer.total == self._anchor:
+            return False
+
+        rows = len(buffer)
+        self._anchor = buffer.total
+        if rows > self._rows:
+            self.beginInsertRows(QtCore.QModelIndex(), 0, rows - self._rows - 1)
+            self._rows = rows
+            self.endInsertRows()
+        if rows:
+            # Every row shifted down: let the view re-query what it shows
+            self.dataChanged.emit(self.index(0, 0), self.index(rows - 1, len(self.HEADERS) - 1))
+        return True
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if orientation == QtCore.Qt.Orientation.Horizontal and role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QtCore.QModelIndex, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if self._buffer is None:
+            return None
+        record = self._buffer.get(self._anchor - 1 - index.row())
+        if record is None:
+            return None
+
+        col = index.column()
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return f"{from_ticks(int(record['tick'])):.2f}"
+            if col == 1:
+                return f"{float(record['size']):,.0f}"
+            if col == 2:
+                return "BUY" if record["side"] == BUY else "SELL"
+            return time.strftime("%H:%M:%S", time.localtime(float(record["time"])))
+        if role == QtCore.Qt.ItemDataRole.ForegroundRole and col in (0, 2):
+            return _SIDE_BRUSHES[bool(record["side"] == BUY)]
+        if role == QtCore.Qt.ItemDataRole.TextAlignmentRole and col < 2:
+            return _ALIGN_RIGHT
+        return None
+
+
+class TradeTape(QtWidgets.QTableView):
+    """
+    Virtualized time & sales list.
+
+    The view asks the model only for visible rows. Incoming trades are
+    conflated: the model syncs at most once per `interval_ms`, so a burst
+    of thousands of trades per second costs one update per tick, and the
+    fixed-size buffer keeps memory flat.
+    """
+
+    def __init__(self, parent=None, interval_ms: int = 100):
+        super().__init__(parent)
+        self._model = TradeTapeModel(self)
+        self.setModel(self._model)
+
+        self.verticalHeader().setVisible(False)
+        self.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 4)
+        self.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Stretch)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start(interval_ms)
+
+    def set_buffer(self, buffer: TradeBuffer | None):
+        """Show a market's trades."""
+        self._model.set_buffer(buffer)
+
+    def refresh(self):
+        if self.isVisible():
+            self._model.sync()
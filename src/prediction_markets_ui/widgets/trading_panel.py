@@ -2,16 +2,25 @@
 
 from PySide6 import QtWidgets, QtCore, QtGui
 
-from prediction_markets_ui.theme.colors import (
-    CLR_LONG,
-    CLR_SHORT,
-    CLR_MUTED,
-    CLR_ACCENT,
-    BG_HOVER,
-    BG_BASE,
-    BORDER_DEFAULT,
-)
-from prediction_markets_ui.theme.styles import BTN_LONG, BTN_SHORT, BTN_TOGGLE
+from prediction_markets_ui.app import UI_BOOK_VIEW
+from prediction_markets_ui.core.candles import CandleEngine, CandleSet
+from prediction_markets_ui.core.execution import BookWalker
+from prediction_markets_ui.core.orderbook import BookEngine, OrderBook, from_ticks, to_ticks
+from prediction_markets_ui.core.operations import Operation
+from prediction_markets_ui.core.orders import OrderRequest
+from prediction_markets_ui.core.session import TabState
+from prediction_markets_ui.core.trades import TradeBuffer, TradeEngine
+from prediction_markets_ui.theme.colors import CLR_LONG, CLR_SHORT, BORDER_DEFAULT
+from prediction_markets_ui.widgets.liquidity_heatmap import LiquidityHeatmap
+from prediction_markets_ui.widgets.orderbook_view import DepthView
+from prediction_markets_ui.widgets.price_chart import PriceChart
+from prediction_markets_ui.widgets.trade_tape import TradeTape
+
+# Shared by every orderbook table cell
+_ALIGN_RIGHT = QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter
+_ROW_FLAGS = QtCore.Qt.ItemFlag.ItemIsSelectable | QtCore.Qt.ItemFlag.ItemIsEnabled
+_TEXT_BRUSHES = {color: QtGui.QBrush(QtGui.QColor(color)) for color in (CLR_LONG, CLR_SHORT)}
+_SEPARATOR_BRUSH = QtGui.QBrush(QtGui.QColor(BORDER_DEFAULT))
 
 
 class OrderbookWidget(QtWidgets.QWidget):
@@ -22,9 +31,18 @@ class OrderbookWidget(QtWidgets.QWidget):
     # Signal emitted when outcome changes
     outcome_changed = QtCore.Signal(str)  # "YES" or "NO"
 
-    def __init__(self, parent=None):
+    # Price levels shown per side
+    DEPTH = 10
+
+    def __init__(self, parent=None, painted: bool | None = None):
         super().__init__(parent)
         self._current_outcome = "YES"
+        self._book: OrderBook | None = None
+        self._rendered_version = -1
+        # Custom-painted ladder instead of QTableWidget (PM_UI_BOOK_VIEW)
+        self._painted = UI_BOOK_VIEW == "painted" if painted is None else painted
+        self.orderbook_table: QtWidgets.QTableWidget | None = None
+        self.depth_view: DepthView | None = None
         self._setup_ui()
 
     def _setup_ui(self):
@@ -34,19 +52,13 @@ class OrderbookWidget(QtWidgets.QWidget):
 
         # Market title
         self.market_title = QtWidgets.QLabel("Select a market")
-        self.market_title.setStyleSheet(f"font-weight: bold; color: {CLR_ACCENT};")
+        self.market_title.setProperty("role", "title")
         self.market_title.setWordWrap(True)
         layout.addWidget(self.market_title)
 
         # Outcome selector - prominent display
         outcome_frame = QtWidgets.QFrame()
-        outcome_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {BG_HOVER};
-                border: 1px solid {BORDER_DEFAULT};
-                border-radius: 4px;
-            }}
-        """)
+        outcome_frame.setProperty("role", "panel")
         outcome_layout = QtWidgets.QHBoxLayout(outcome_frame)
         outcome_layout.setContentsMargins(8, 6, 8, 6)
 
@@ -56,38 +68,12 @@ class OrderbookWidget(QtWidgets.QWidget):
         self.yes_btn = QtWidgets.QPushButton("YES")
         self.yes_btn.setCheckable(True)
         self.yes_btn.setChecked(True)
-        self.yes_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {CLR_LONG};
-                border: 2px solid {CLR_LONG};
-                border-radius: 4px;
-                padding: 4px 16px;
-                font-weight: bold;
-            }}
-            QPushButton:checked {{
-                background-color: {CLR_LONG};
-                color: black;
-            }}
-        """)
+        self.yes_btn.setProperty("variant", "outcome-yes")
         outcome_layout.addWidget(self.yes_btn)
 
         self.no_btn = QtWidgets.QPushButton("NO")
         self.no_btn.setCheckable(True)
-        self.no_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {CLR_SHORT};
-                border: 2px solid {CLR_SHORT};
-                border-radius: 4px;
-                padding: 4px 16px;
-                font-weight: bold;
-            }}
-            QPushButton:checked {{
-                background-color: {CLR_SHORT};
-                color: white;
-            }}
-        """)
+        self.no_btn.setProperty("variant", "outcome-no")
         outcome_layout.addWidget(self.no_btn)
 
         # Make YES/NO mutually exclusive
@@ -98,17 +84,44 @@ class OrderbookWidget(QtWidgets.QWidget):
 
         outcome_layout.addStretch()
 
+        # Shown while the book is a cached copy from the last session
+        self.stale_label = QtWidgets.QLabel("STALE")
+        self.stale_label.setProperty("tone", "muted")
+        self.stale_label.setToolTip("Last-seen book from the previous session; waiting for live data")
+        self.stale_label.hide()
+        outcome_layout.addWidget(self.stale_label)
+
+        # Shown while the book may have drifted from the venue's (failed
+        # checksum or dropped messages) until a fresh snapshot arrives
+        self.unverified_label = QtWidgets.QLabel("UNVERIFIED")
+        self.unverified_label.setProperty("tone", "short")
+        self.unverified_label.setToolTip("Book failed a checksum or lost messages; waiting for a fresh snapshot")
+        self.unverified_label.hide()
+        outcome_layout.addWidget(self.unverified_label)
+
         # Spread display
         spread_label = QtWidgets.QLabel("Spread:")
-        spread_label.setStyleSheet(f"color: {CLR_MUTED};")
+        spread_label.setProperty("tone", "muted")
         outcome_layout.addWidget(spread_label)
 
-        self.spread_value = QtWidgets.QLabel("$0.02 (3.1%)")
-        self.spread_value.setStyleSheet(f"color: {CLR_ACCENT}; font-weight: bold;")
+        self.spread_value = QtWidgets.QLabel("--")
+        self.spread_value.setProperty("role", "value")
         outcome_layout.addWidget(self.spread_value)
 
         layout.addWidget(outcome_frame)
 
+        if self._painted:
+            self.depth_view = DepthView()
+            self.depth_view.price_clicked.connect(self.price_clicked)
+            layout.addWidget(self.depth_view, 1)
+        else:
+            self._setup_orderbook_table(layout)
+
+        # Position display for this market
+        self._setup_position_display(layout)
+
+    def _setup_orderbook_table(self, layout: QtWidgets.QVBoxLayout):
+        """Setup the QTableWidget orderbook."""
         # Unified orderbook table
         self.orderbook_table = QtWidgets.QTableWidget()
         self.orderbook_table.setColumnCount(3)
@@ -123,35 +136,23 @@ class OrderbookWidget(QtWidgets.QWidget):
         header.setSectionResizeMode(1, QtWidgets.QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(2, QtWidgets.QHeaderView.ResizeMode.Stretch)
 
-        # Populate with placeholder data
-        self._populate_orderbook()
-
         # Connect click signal
         self.orderbook_table.cellClicked.connect(self._on_cell_clicked)
 
         layout.addWidget(self.orderbook_table, 1)
 
-        # Position display for this market
-        self._setup_position_display(layout)
-
     def _setup_position_display(self, layout: QtWidgets.QVBoxLayout):
         """Setup the position and orders display section below orderbook."""
         # Container frame
         info_frame = QtWidgets.QFrame()
-        info_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {BG_HOVER};
-                border: 1px solid {BORDER_DEFAULT};
-                border-radius: 4px;
-            }}
-        """)
+        info_frame.setProperty("role", "panel")
         info_layout = QtWidgets.QVBoxLayout(info_frame)
         info_layout.setContentsMargins(8, 8, 8, 8)
         info_layout.setSpacing(6)
 
         # === Position Section ===
         pos_title = QtWidgets.QLabel("My Position")
-        pos_title.setStyleSheet(f"font-weight: bold; color: {CLR_ACCENT};")
+        pos_title.setProperty("role", "title")
         info_layout.addWidget(pos_title)
 
         # Position info grid
@@ -160,34 +161,36 @@ class OrderbookWidget(QtWidgets.QWidget):
 
         # YES position
         yes_label = QtWidgets.QLabel("YES:")
-        yes_label.setStyleSheet(f"color: {CLR_LONG}; font-weight: bold;")
+        yes_label.setProperty("tone", "long")
+        yes_label.setProperty("bold", True)
         pos_grid.addWidget(yes_label, 0, 0)
 
         self.yes_size_label = QtWidgets.QLabel("150 shares")
         pos_grid.addWidget(self.yes_size_label, 0, 1)
 
         self.yes_avg_label = QtWidgets.QLabel("@ $0.58")
-        self.yes_avg_label.setStyleSheet(f"color: {CLR_MUTED};")
+        self.yes_avg_label.setProperty("tone", "muted")
         pos_grid.addWidget(self.yes_avg_label, 0, 2)
 
         self.yes_pnl_label = QtWidgets.QLabel("+$7.50")
-        self.yes_pnl_label.setStyleSheet(f"color: {CLR_LONG};")
+        self.yes_pnl_label.setProperty("tone", "long")
         pos_grid.addWidget(self.yes_pnl_label, 0, 3)
 
         # NO position
         no_label = QtWidgets.QLabel("NO:")
-        no_label.setStyleSheet(f"color: {CLR_SHORT}; font-weight: bold;")
+        no_label.setProperty("tone", "short")
+        no_label.setProperty("bold", True)
         pos_grid.addWidget(no_label, 1, 0)
 
         self.no_size_label = QtWidgets.QLabel("0 shares")
         pos_grid.addWidget(self.no_size_label, 1, 1)
 
         self.no_avg_label = QtWidgets.QLabel("@ --")
-        self.no_avg_label.setStyleSheet(f"color: {CLR_MUTED};")
+        self.no_avg_label.setProperty("tone", "muted")
         pos_grid.addWidget(self.no_avg_label, 1, 2)
 
         self.no_pnl_label = QtWidgets.QLabel("$0.00")
-        self.no_pnl_label.setStyleSheet(f"color: {CLR_MUTED};")
+        self.no_pnl_label.setProperty("tone", "muted")
         pos_grid.addWidget(self.no_pnl_label, 1, 3)
 
         info_layout.addLayout(pos_grid)
@@ -195,12 +198,12 @@ class OrderbookWidget(QtWidgets.QWidget):
         # Separator
         sep1 = QtWidgets.QFrame()
         sep1.setFrameShape(QtWidgets.QFrame.Shape.HLine)
-        sep1.setStyleSheet(f"background-color: {BORDER_DEFAULT};")
+        sep1.setProperty("role", "separator")
         info_layout.addWidget(sep1)
 
         # === Open Orders Section ===
         orders_title = QtWidgets.QLabel("Open Orders")
-        orders_title.setStyleSheet(f"font-weight: bold; color: {CLR_ACCENT};")
+        orders_title.setProperty("role", "title")
         info_layout.addWidget(orders_title)
 
         # Orders table (compact)
@@ -238,17 +241,7 @@ class OrderbookWidget(QtWidgets.QWidget):
 
             # Cancel button
             cancel_btn = QtWidgets.QPushButton("X")
-            cancel_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: transparent;
-                    color: {CLR_SHORT};
-                    border: none;
-                    font-weight: bold;
-                }}
-                QPushButton:hover {{
-                    color: white;
-                }}
-            """)
+            cancel_btn.setProperty("variant", "remove")
             cancel_btn.setFixedWidth(30)
             self.market_orders_table.setCellWidget(row, 4, cancel_btn)
 
@@ -260,7 +253,11 @@ class OrderbookWidget(QtWidgets.QWidget):
         """Handle outcome button click."""
         self._current_outcome = "YES" if button == self.yes_btn else "NO"
         self.outcome_changed.emit(self._current_outcome)
-        # TODO: Reload orderbook for new outcome
+        self.render_book()
+
+    @property
+    def outcome(self) -> str:
+        return self._current_outcome
 
     def set_market_title(self, title: str):
         """Set the market title."""
@@ -277,7 +274,17 @@ class OrderbookWidget(QtWidgets.QWidget):
             self.no_btn.setChecked(True)
         self._current_outcome = outcome
         self.outcome_group.blockSignals(False)
-        # TODO: Reload orderbook for new outcome
+        self.render_book()
+
+    def set_book(self, book: OrderBook | None):
+        """Attach the market's canonical (YES) book and render it."""
+        self._book = book
+        self.unverified_label.setVisible(book is not None and not book.verified)
+        self.render_book()
+
+    def set_stale(self, stale: bool):
+        """Mark the book as cached (not live) data."""
+        self.stale_label.setVisible(stale)
 
     def _on_cell_clicked(self, row: int, column: int):
         """Handle cell click - emit price if valid row."""
@@ -289,25 +296,38 @@ class OrderbookWidget(QtWidgets.QWidget):
             except ValueError:
                 pass  # Separator row or invalid
 
-    def _populate_orderbook(self):
-        """Populate orderbook with placeholder data."""
-        # Asks data (sells) - sorted by price descending (highest at top)
-        asks_data = [
-            (0.68, 120),
-            (0.67, 85),
-            (0.66, 200),
-            (0.65, 150),
-            (0.64, 300),
-        ]
+    def refresh(self):
+        """Re-render if the book changed since the last render."""
+        unverified = self._book is not None and not self._book.verified
+        if unverified != self.unverified_label.isVisibleTo(self):
+            self.unverified_label.setVisible(unverified)
+        if self.depth_view is not None:
+            self.depth_view.refresh()
+        elif self._book is not None and self._book.version != self._rendered_version:
+            self.render_book()
+
+    def render_book(self):
+        """Render the attached book for the selected outcome."""
+        # The NO book is a mirrored view of the YES book - no reload needed
+        view = self._book.view(self._current_outcome) if self._book else None
+        self._rendered_version = view.version if view else -1
+
+        spread = view.spread() if view else None
+        if spread is None:
+            self.spread_value.setText("--")
+        else:
+            self.spread_value.setText(f"${spread:.2f} ({spread / view.mid() * 100:.1f}%)")
 
-        # Bids data (buys) - sorted by price descending (highest at top)
-        bids_data = [
-            (0.62, 250),
-            (0.61, 180),
-            (0.60, 320),
-            (0.59, 100),
-            (0.58, 450),
-        ]
+        if self.depth_view is not None:
+            self.depth_view.set_book(view)
+            return
+
+        if view is None:
+            self.orderbook_table.setRowCount(0)
+            return
+
+        asks_data = [(from_ticks(t), s) for t, s in self._take(view.asks.levels())]
+        bids_data = [(from_ticks(t), s) for t, s in self._take(view.bids.levels())]
 
         # Total rows: asks + separator + bids
         total_rows = len(asks_data) + 1 + len(bids_data)
@@ -317,10 +337,9 @@ class OrderbookWidget(QtWidgets.QWidget):
 
         # Add asks (cumulative sum from bottom to top, displayed top to bottom)
         # Calculate cumulative totals from best ask (lowest) to worst (highest)
-        asks_reversed = list(reversed(asks_data))  # lowest price first
         cumulative = 0
         ask_rows = []
-        for price, size in asks_reversed:
+        for price, size in asks_data:
             cumulative += price * size
             ask_rows.append((price, size, cumulative))
         # Display in reverse (highest price at top, lowest near spread)
@@ -331,10 +350,10 @@ class OrderbookWidget(QtWidgets.QWidget):
         # Separator row
         separator_row = row
         for col in range(3):
-            item = QtWidgets.QTableWidgetItem()
-            item.setBackground(QtGui.QColor(BORDER_DEFAULT))
+            item = self._cell(separator_row, col)
+            item.setText("")
+            item.setBackground(_SEPARATOR_BRUSH)
             item.setFlags(QtCore.Qt.ItemFlag.NoItemFlags)
-            self.orderbook_table.setItem(separator_row, col, item)
         self.orderbook_table.setRowHeight(separator_row, 3)
         row += 1
 
@@ -345,21 +364,33 @@ class OrderbookWidget(QtWidgets.QWidget):
             self._set_row(row, price, size, cumulative, CLR_LONG)
             row += 1
 
-    def _set_row(self, row: int, price: float, size: int, total: float, color: str):
-        """Set a row in the orderbook table."""
-        price_item = QtWidgets.QTableWidgetItem(f"{price:.2f}")
-        price_item.setForeground(QtGui.QColor(color))
-        price_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter)
+    def _take(self, levels):
+        """First DEPTH levels of a best-first iterator."""
+        return [level for level, _ in zip(levels, range(self.DEPTH))]
 
-        size_item = QtWidgets.QTableWidgetItem(f"{size:,}")
-        size_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter)
+    def _cell(self, row: int, col: int) -> QtWidgets.QTableWidgetItem:
+        """Existing item at (row, col), or a new right-aligned one."""
+        item = self.orderbook_table.item(row, col)
+        if item is None:
+            item = QtWidgets.QTableWidgetItem()
+            item.setTextAlignment(_ALIGN_RIGHT)
+            self.orderbook_table.setItem(row, col, item)
+        return item
 
-        total_item = QtWidgets.QTableWidgetItem(f"${total:,.2f}")
-        total_item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignRight | QtCore.Qt.AlignmentFlag.AlignVCenter)
+    def _set_row(self, row: int, price: float, size: int, total: float, color: str):
+        """Set a row in the orderbook table, reusing its items."""
+        items = [self._cell(row, col) for col in range(3)]
+        if items[0].flags() != _ROW_FLAGS:
+            # Row was the separator on a previous render
+            for item in items:
+                item.setFlags(_ROW_FLAGS)
+                item.setBackground(QtGui.QBrush())
+            self.orderbook_table.setRowHeight(row, self.orderbook_table.verticalHeader().defaultSectionSize())
 
-        self.orderbook_table.setItem(row, 0, price_item)
-        self.orderbook_table.setItem(row, 1, size_item)
-        self.orderbook_table.setItem(row, 2, total_item)
+        items[0].setText(f"{price:.2f}")
+        items[0].setForeground(_TEXT_BRUSHES[color])
+        items[1].setText(f"{size:,.0f}")
+        items[2].setText(f"${total:,.2f}")
 
 
 class OrderEntryWidget(QtWidgets.QWidget):
@@ -367,9 +398,17 @@ class OrderEntryWidget(QtWidgets.QWidget):
 
     # Signal emitted when outcome changes
     outcome_changed = QtCore.Signal(str)  # "YES" or "NO"
+    # Signal emitted on Place Order (OrderRequest without market id)
+    order_requested = QtCore.Signal(object)
+    # Signal emitted on Split/Merge/Redeem (kind, amount)
+    operation_requested = QtCore.Signal(str, float)
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._book: OrderBook | None = None
+        self._outcome = "YES"
+        self._walker = BookWalker()
+        self._estimated_version = -1
         self._setup_ui()
         self._connect_signals()
 
@@ -380,7 +419,7 @@ class OrderEntryWidget(QtWidgets.QWidget):
 
         # Title
         title = QtWidgets.QLabel("Place Order")
-        title.setStyleSheet(f"font-weight: bold; color: {CLR_ACCENT};")
+        title.setProperty("role", "title")
         layout.addWidget(title)
 
         # Side selection (BUY / SELL)
@@ -391,12 +430,12 @@ class OrderEntryWidget(QtWidgets.QWidget):
         self.buy_btn = QtWidgets.QPushButton("BUY")
         self.buy_btn.setCheckable(True)
         self.buy_btn.setChecked(True)
-        self.buy_btn.setStyleSheet(BTN_LONG)
+        self.buy_btn.setProperty("variant", "long")
         side_layout.addWidget(self.buy_btn)
 
         self.sell_btn = QtWidgets.QPushButton("SELL")
         self.sell_btn.setCheckable(True)
-        self.sell_btn.setStyleSheet(BTN_SHORT)
+        self.sell_btn.setProperty("variant", "short")
         side_layout.addWidget(self.sell_btn)
 
         # Make BUY/SELL mutually exclusive
@@ -414,12 +453,12 @@ class OrderEntryWidget(QtWidgets.QWidget):
         self.yes_btn = QtWidgets.QPushButton("YES")
         self.yes_btn.setCheckable(True)
         self.yes_btn.setChecked(True)
-        self.yes_btn.setStyleSheet(BTN_TOGGLE)
+        self.yes_btn.setProperty("variant", "toggle")
         outcome_layout.addWidget(self.yes_btn)
 
         self.no_btn = QtWidgets.QPushButton("NO")
         self.no_btn.setCheckable(True)
-        self.no_btn.setStyleSheet(BTN_TOGGLE)
+        self.no_btn.setProperty("variant", "toggle")
         outcome_layout.addWidget(self.no_btn)
 
         # Make YES/NO mutually exclusive
@@ -437,12 +476,12 @@ class OrderEntryWidget(QtWidgets.QWidget):
         self.limit_btn = QtWidgets.QPushButton("LIMIT")
         self.limit_btn.setCheckable(True)
         self.limit_btn.setChecked(True)
-        self.limit_btn.setStyleSheet(BTN_TOGGLE)
+        self.limit_btn.setProperty("variant", "toggle")
         type_layout.addWidget(self.limit_btn)
 
         self.market_btn = QtWidgets.QPushButton("MARKET")
         self.market_btn.setCheckable(True)
-        self.market_btn.setStyleSheet(BTN_TOGGLE)
+        self.market_btn.setProperty("variant", "toggle")
         type_layout.addWidget(self.market_btn)
 
         # Make LIMIT/MARKET mutually exclusive
@@ -480,7 +519,7 @@ class OrderEntryWidget(QtWidgets.QWidget):
 
         # Estimated cost
         estimate_frame = QtWidgets.QFrame()
-        estimate_frame.setStyleSheet(f"background-color: {BG_HOVER}; border-radius: 4px;")
+        estimate_frame.setProperty("role", "card")
         estimate_layout = QtWidgets.QVBoxLayout(estimate_frame)
         estimate_layout.setContentsMargins(8, 8, 8, 8)
 
@@ -488,40 +527,33 @@ class OrderEntryWidget(QtWidgets.QWidget):
         estimate_layout.addWidget(self.est_cost)
 
         self.est_fee = QtWidgets.QLabel("Est. Fee: $0.00")
-        self.est_fee.setStyleSheet(f"color: {CLR_MUTED};")
+        self.est_fee.setProperty("tone", "muted")
         estimate_layout.addWidget(self.est_fee)
 
+        # Book walk result: VWAP, worst fill, slippage vs mid
+        self.est_fill = QtWidgets.QLabel()
+        self.est_fill.setProperty("tone", "muted")
+        self.est_fill.setWordWrap(True)
+        self.est_fill.hide()
+        estimate_layout.addWidget(self.est_fill)
+
         layout.addWidget(estimate_frame)
 
         # Place order button
         self.place_btn = QtWidgets.QPushButton("Place Order")
-        self.place_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {CLR_LONG};
-                color: black;
-                font-weight: bold;
-                padding: 12px;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: #9ccc9c;
-            }}
-            QPushButton:disabled {{
-                background-color: #555;
-                color: #888;
-            }}
-        """)
+        self.place_btn.setProperty("variant", "place")
         layout.addWidget(self.place_btn)
 
         # Separator
         separator = QtWidgets.QFrame()
         separator.setFrameShape(QtWidgets.QFrame.Shape.HLine)
-        separator.setStyleSheet(f"background-color: {BORDER_DEFAULT};")
+        separator.setProperty("role", "separator")
         layout.addWidget(separator)
 
         # Operations section (Split/Merge/Redeem)
+        layout.addSpacing(8)
         ops_title = QtWidgets.QLabel("Operations")
-        ops_title.setStyleSheet(f"font-weight: bold; color: {CLR_ACCENT}; margin-top: 8px;")
+        ops_title.setProperty("role", "title")
         layout.addWidget(ops_title)
 
         # Split section
@@ -531,7 +563,7 @@ class OrderEntryWidget(QtWidgets.QWidget):
         split_layout.addWidget(self.split_amount)
 
         self.split_btn = QtWidgets.QPushButton("Split")
-        self.split_btn.setStyleSheet(BTN_TOGGLE)
+        self.split_btn.setProperty("variant", "toggle")
         self.split_btn.setToolTip("USDC → YES + NO")
         split_layout.addWidget(self.split_btn)
         layout.addLayout(split_layout)
@@ -543,7 +575,7 @@ class OrderEntryWidget(QtWidgets.QWidget):
         merge_layout.addWidget(self.merge_amount)
 
         self.merge_btn = QtWidgets.QPushButton("Merge")
-        self.merge_btn.setStyleSheet(BTN_TOGGLE)
+        self.merge_btn.setProperty("variant", "toggle")
         self.merge_btn.setToolTip("YES + NO → USDC")
         merge_layout.addWidget(self.merge_btn)
         layout.addLayout(merge_layout)
@@ -555,7 +587,7 @@ class OrderEntryWidget(QtWidgets.QWidget):
         redeem_layout.addWidget(self.redeem_amount)
 
         self.redeem_btn = QtWidgets.QPushButton("Redeem")
-        self.redeem_btn.setStyleSheet(BTN_TOGGLE)
+        self.redeem_btn.setProperty("variant", "toggle")
         self.redeem_btn.setToolTip("Redeem winning tokens")
         redeem_layout.addWidget(self.redeem_btn)
         layout.addLayout(redeem_layout)
@@ -568,6 +600,20 @@ class OrderEntryWidget(QtWidgets.QWidget):
         self.market_btn.toggled.connect(self._on_order_type_changed)
         self.outcome_group.buttonClicked.connect(self._on_outcome_clicked)
 
+        # Live estimate
+        self.size_input.textChanged.connect(self.update_estimate)
+        self.price_input.textChanged.connect(self.update_estimate)
+        self.size_type_combo.currentIndexChanged.connect(self.update_estimate)
+        self.side_group.buttonClicked.connect(self.update_estimate)
+        self.market_btn.toggled.connect(self.update_estimate)
+
+        self.place_btn.clicked.connect(self._on_place_clicked)
+
+        # Operations are queued and sent in batches (see Operations tab)
+        self.split_btn.clicked.connect(lambda: self._on_operation_clicked("split", self.split_amount))
+        self.merge_btn.clicked.connect(lambda: self._on_operation_clicked("merge", self.merge_amount))
+        self.redeem_btn.clicked.connect(lambda: self._on_operation_clicked("redeem", self.redeem_amount))
+
     def _on_order_type_changed(self):
         """Enable/disable price input based on order type."""
         is_limit = self.limit_btn.isChecked()
@@ -581,8 +627,13 @@ class OrderEntryWidget(QtWidgets.QWidget):
     def _on_outcome_clicked(self, button: QtWidgets.QPushButton):
         """Handle outcome button click and emit signal."""
         outcome = "YES" if button == self.yes_btn else "NO"
+        self._set_view(outcome)
         self.outcome_changed.emit(outcome)
 
+    @property
+    def outcome(self) -> str:
+        return self._outcome
+
     def set_price(self, price: float):
         """Set price from orderbook click and switch to LIMIT."""
         self.limit_btn.setChecked(True)
@@ -597,6 +648,295 @@ class OrderEntryWidget(QtWidgets.QWidget):
         else:
             self.no_btn.setChecked(True)
         self.outcome_group.blockSignals(False)
+        self._set_view(outcome)
+
+    def set_book(self, book: OrderBook | None):
+        """Attach the market's canonical (YES) book used for estimates."""
+        self._book = book
+        self._set_view(self._outcome)
+
+    def _set_view(self, outcome: str):
+        self._outcome = outcome
+        self._walker.set_view(self._book.view(outcome) if self._book else None)
+        self.update_estimate()
+
+    def refresh(self):
+        """Recompute the estimate if the book changed since the last one."""
+        view = self._walker.view
+        if view is not None and view.version != self._estimated_version:
+            self.update_estimate()
+
+    @staticmethod
+    def _parse(field: QtWidgets.QLineEdit) -> float | None:
+        try:
+            value = float(field.text().replace(",", ""))
+        except ValueError:
+            return None
+        return value if value > 0 else None
+
+    def update_estimate(self):
+        """Recompute cost, fee and (for crossing orders) the book walk."""
+        view = self._walker.view
+        self._estimated_version = view.version if view else -1
+
+        side = "BUY" if self.buy_btn.isChecked() else "SELL"
+        cost_name = "Est. Cost" if side == "BUY" else "Est. Proceeds"
+        size = self._parse(self.size_input)
+        usd_mode = self.size_type_combo.currentText() == "USD"
+        is_market = self.market_btn.isChecked()
+        price = None if is_market else self._parse(self.price_input)
+
+        if size is None or (not is_market and price is None):
+            self.est_cost.setText(f"{cost_name}: $0.00")
+            self.est_fee.setText("Est. Fee: $0.00")
+            self.est_fill.hide()
+            return
+
+        if is_market:
+            estimate = self._walker.estimate(side, usd=size) if usd_mode else self._walker.estimate(side, shares=size)
+            if estimate is None or not estimate.shares:
+                self.est_cost.setText(f"{cost_name}: --")
+                self.est_fee.setText("Est. Fee: --")
+                self.est_fill.setText("No liquidity")
+                self.est_fill.show()
+                return
+            notional, shares = estimate.notional, estimate.shares
+        else:
+            # Only the marketable part of a limit order fills (and pays fees) now
+            shares = size / price if usd_mode else size
+            notional = shares * price
+            estimate = self._walker.estimate(side, shares=shares, limit=price)
+
+        self.est_cost.setText(f"{cost_name}: ${notional:,.2f} ({shares:,.0f} sh)")
+        fee = estimate.fee if estimate else 0.0
+        self.est_fee.setText(f"Est. Fee: ${fee:,.2f}")
+
+        if estimate is None or not estimate.shares:
+            self.est_fill.hide()
+            return
+        parts = [f"VWAP {estimate.vwap:.4f}", f"worst {estimate.worst:.2f}"]
+        if estimate.slippage is not None:
+            parts.append(f"slip {estimate.slippage * 100:+.2f}¢")
+        if is_market and not estimate.complete:
+            parts.append("book exhausted")
+        elif not is_market:
+            parts.insert(0, f"{estimate.shares:,.0f} sh cross")
+        self.est_fill.setText(" · ".join(parts))
+        self.est_fill.show()
+
+    def _on_place_clicked(self):
+        """Validate the form and emit an order request."""
+        side = "BUY" if self.buy_btn.isChecked() else "SELL"
+        is_market = self.market_btn.isChecked()
+        size = self._parse(self.size_input)
+        price = None if is_market else self._parse(self.price_input)
+        if size is None or (not is_market and price is None):
+            self.est_fill.setText("Enter a size" if size is None else "Enter a price")
+            self.est_fill.show()
+            return
+
+        shares = size
+        if self.size_type_combo.currentText() == "USD":
+            if is_market:
+                estimate = self._walker.estimate(side, usd=size)
+                shares = estimate.shares if estimate else 0.0
+            else:
+                shares = size / price
+        if shares <= 0:
+            self.est_fill.setText("No liquidity")
+            self.est_fill.show()
+            return
+
+        self.order_requested.emit(OrderRequest(
+            market_id="",
+            side=side,
+            outcome=self._outcome,
+            order_type="MARKET" if is_market else "LIMIT",
+            size=round(shares, 2),
+            price=price,
+        ))
+
+    def _on_operation_clicked(self, kind: str, field: QtWidgets.QLineEdit):
+        amount = self._parse(field)
+        if amount is None:
+            field.setFocus()
+            return
+        self.operation_requested.emit(kind, amount)
+        field.clear()
+
+    def reset(self):
+        """Restore the default form state (used when a tab is recycled)."""
+        self.buy_btn.setChecked(True)
+        self.limit_btn.setChecked(True)
+        self.set_outcome("YES")
+        self.size_type_combo.setCurrentIndex(0)
+        for field in (
+            self.size_input,
+            self.price_input,
+            self.split_amount,
+            self.merge_amount,
+            self.redeem_amount,
+        ):
+            field.clear()
+
+
+class MarketTab(QtWidgets.QWidget):
+    """
+    Single market tab: orderbook (left), price chart over liquidity heatmap,
+    order entry over trade tape (right).
+
+    Instances are recycled by TradingPanel, so all per-market state must be
+    reset in `bind()`.
+    """
+
+    # Signal emitted on Place Order (OrderRequest, market title)
+    order_requested = QtCore.Signal(object, str)
+    # Signal emitted on Split/Merge/Redeem (Operation, market title)
+    operation_requested = QtCore.Signal(object, str)
+    # Signal emitted when the user picks an outcome in either widget
+    outcome_changed = QtCore.Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.market_id = ""
+        self.market_title = ""
+        self._book: OrderBook | None = None
+        # Book version the cached (stale) state was restored at, or None if live
+        self._stale_version: int | None = None
+        self._setup_ui()
+
+    def _setup_ui(self):
+        layout = QtWidgets.QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        # Orderbook (left)
+        self.orderbook = OrderbookWidget()
+        layout.addWidget(self.orderbook, 2)
+
+        # Price chart over liquidity heatmap (middle)
+        middle = QtWidgets.QVBoxLayout()
+        middle.setContentsMargins(0, 0, 0, 0)
+        self.price_chart = PriceChart()
+        middle.addWidget(self.price_chart, 1)
+        self.heatmap = LiquidityHeatmap()
+        middle.addWidget(self.heatmap, 1)
+        layout.addLayout(middle, 1)
+
+        # Order entry over trade tape (right)
+        right = QtWidgets.QWidget()
+        right.setMaximumWidth(300)
+        right_layout = QtWidgets.QVBoxLayout(right)
+        right_layout.setContentsMargins(0, 0, 0, 0)
+        self.order_entry = OrderEntryWidget()
+        right_layout.addWidget(self.order_entry)
+        self.trade_tape = TradeTape()
+        right_layout.addWidget(self.trade_tape, 1)
+        layout.addWidget(right)
+
+        # Connect orderbook signals to order entry (bidirectional)
+        self.orderbook.price_clicked.connect(self.order_entry.set_price)
+        self.orderbook.outcome_changed.connect(self.order_entry.set_outcome)
+        self.order_entry.outcome_changed.connect(self.orderbook.set_outcome)
+        self.orderbook.outcome_changed.connect(self.heatmap.set_outcome)
+        self.order_entry.outcome_changed.connect(self.heatmap.set_outcome)
+        self.orderbook.outcome_changed.connect(self.price_chart.set_outcome)
+        self.order_entry.outcome_changed.connect(self.price_chart.set_outcome)
+        self.order_entry.order_requested.connect(self._on_order_requested)
+        self.order_entry.operation_requested.connect(self._on_operation_requested)
+        self.orderbook.outcome_changed.connect(self.outcome_changed)
+        self.order_entry.outcome_changed.connect(self.outcome_changed)
+
+    @property
+    def outcome(self) -> str:
+        return self.order_entry.outcome
+
+    def set_outcome(self, outcome: str):
+        self.orderbook.set_outcome(outcome)
+        self.order_entry.set_outcome(outcome)
+        self.heatmap.set_outcome(outcome)
+        self.price_chart.set_outcome(outcome)
+
+    def set_stale(self, stale: bool):
+        """Flag the book as cached until its first live update."""
+        self._stale_version = self._book.version if stale and self._book is not None else None
+        self.orderbook.set_stale(self._stale_version is not None)
+
+    def _on_order_requested(self, request: OrderRequest):
+        self.order_requested.emit(request._replace(market_id=self.market_id), self.market_title)
+
+    def _on_operation_requested(self, kind: str, amount: float):
+        self.operation_requested.emit(Operation(kind, self.market_id, amount), self.market_title)
+
+    def bind(self, market_id: str, title: str, book: OrderBook,
+             candles: CandleSet | None = None, trades: TradeBuffer | None = None):
+        """Attach this tab to a market, resetting any state from a previous one."""
+        self.market_id = market_id
+        self.market_title = title
+        self._book = book
+        self.set_stale(False)
+        self.orderbook.set_market_title(title)
+        self.order_entry.reset()
+        # Detach the previous market's book first so resetting the outcome
+        # doesn't render it
+        self.orderbook.set_book(None)
+        self.orderbook.set_outcome("YES")
+        self.orderbook.set_book(book)
+        self.heatmap.set_outcome("YES")
+        self.heatmap.set_book(book)
+        self.price_chart.set_outcome("YES")
+        self.price_chart.set_candles(candles)
+        self.trade_tape.set_buffer(trades)
+        self.order_entry.set_book(book)
+
+    def refresh(self):
+        """Pick up book changes since the last refresh."""
+        if self._stale_version is not None and self._book.version != self._stale_version:
+            self.set_stale(False)
+        self.orderbook.refresh()
+        self.order_entry.refresh()
+
+
+class BookWindow(QtWidgets.QWidget):
+    """
+    Orderbook for one market in its own top-level window, e.g. on another
+    monitor.
+
+    The window renders the same OrderBook the market's tab does and is
+    refreshed by TradingPanel's timer, so any number of windows on a market
+    share one book and one ingest subscription.
+    """
+
+    # Signal emitted when a price row is clicked (outcome, price)
+    price_clicked = QtCore.Signal(str, float)
+    # Signal emitted when the window is closed
+    closed = QtCore.Signal()
+
+    def __init__(self, market_id: str, title: str, book: OrderBook, parent=None):
+        super().__init__(parent, QtCore.Qt.WindowType.Window)
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
+        self.setWindowTitle(title)
+        self.market_id = market_id
+        self.market_title = title
+
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.orderbook = OrderbookWidget()
+        self.orderbook.set_market_title(title)
+        self.orderbook.set_book(book)
+        self.orderbook.price_clicked.connect(self._on_price_clicked)
+        layout.addWidget(self.orderbook)
+
+    def _on_price_clicked(self, price: float):
+        self.price_clicked.emit(self.orderbook.outcome, price)
+
+    def refresh(self):
+        """Pick up book changes, unless nothing of the window is on screen."""
+        if self.isVisible() and not self.isMinimized():
+            self.orderbook.refresh()
+
+    def closeEvent(self, event: QtGui.QCloseEvent):
+        self.closed.emit()
+        super().closeEvent(event)
 
 
 class TradingPanel(QtWidgets.QWidget):
@@ -607,12 +947,55 @@ class TradingPanel(QtWidgets.QWidget):
     - Market tabs (for multi-market support)
     - Orderbook
     - Order entry form
+
+    Open tabs are keyed by market id. Closed tabs go back to a small pool of
+    pre-built MarketTab instances so opening a market doesn't construct the
+    whole widget tree from scratch.
+
+    A market's book can also be detached into BookWindows. A market stays
+    open (subscribed) while it has a tab or a window.
     """
 
-    def __init__(self, parent=None):
+    # Signal emitted on Place Order in any tab (OrderRequest, market title)
+    order_requested = QtCore.Signal(object, str)
+    # Signal emitted on Split/Merge/Redeem in any tab (Operation, market title)
+    operation_requested = QtCore.Signal(object, str)
+    # Signal emitted when tabs are opened, closed, moved or switched, or an
+    # outcome is picked (anything the saved session covers)
+    workspace_changed = QtCore.Signal()
+    # Signal emitted when a market's last tab or book window is closed (market id)
+    market_closed = QtCore.Signal(str)
+
+    # Number of spare tabs kept ready for the next open_market()
+    POOL_SIZE = 2
+    # How often the visible tab and book windows pick up book changes
+    REFRESH_MS = 100
+    # Initial size of a detached book window, and the cascade step between them
+    BOOK_WINDOW_SIZE = (360, 560)
+    BOOK_WINDOW_CASCADE = 32
+
+    def __init__(self, book_engine: BookEngine | None = None,
+                 candle_engine: CandleEngine | None = None,
+                 trade_engine: TradeEngine | None = None, parent=None):
         super().__init__(parent)
+        self.book_engine = book_engine if book_engine is not None else BookEngine()
+        self.candle_engine = candle_engine if candle_engine is not None else CandleEngine()
+        self.trade_engine = trade_engine if trade_engine is not None else TradeEngine()
+        self._tabs: dict[str, MarketTab] = {}
+        self._pool: list[MarketTab] = []
+        self._book_windows: list[BookWindow] = []
         self._setup_ui()
 
+        # Pre-build spare tabs once the event loop is idle
+        QtCore.QTimer.singleShot(0, self._fill_pool)
+
+        # Book updates are coalesced: only the visible tab and book windows
+        # re-render, at most once per REFRESH_MS
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.timeout.connect(self._refresh_current)
+        self._refresh_timer.timeout.connect(self._refresh_book_windows)
+        self._refresh_timer.start(self.REFRESH_MS)
+
     def _setup_ui(self):
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -623,54 +1006,185 @@ class TradingPanel(QtWidgets.QWidget):
         self.market_tabs.setTabsClosable(True)
         self.market_tabs.setMovable(True)
         self.market_tabs.tabCloseRequested.connect(self._on_tab_close)
+        self.market_tabs.currentChanged.connect(self.workspace_changed)
+        self.market_tabs.tabBar().tabMoved.connect(self.workspace_changed)
+        self.market_tabs.tabBar().setContextMenuPolicy(QtCore.Qt.ContextMenuPolicy.CustomContextMenu)
+        self.market_tabs.tabBar().customContextMenuRequested.connect(self._on_tab_menu)
 
         # Limit tab size
         self.market_tabs.tabBar().setElideMode(QtCore.Qt.TextElideMode.ElideRight)
         self.market_tabs.tabBar().setExpanding(False)
-        self.market_tabs.setStyleSheet("QTabBar::tab { max-width: 150px; }")
+        self.market_tabs.setObjectName("marketTabs")
 
         # Add placeholder tab
-        self._add_market_tab("BTC > $100k?")
+        self._add_market_tab("BTC > $100k?", "BTC > $100k?")
 
         layout.addWidget(self.market_tabs)
 
+    def _fill_pool(self):
+        """Build spare tabs up to POOL_SIZE."""
+        # Parent spares to the tab widget's page stack: addTab() then skips
+        # the reparent, which would otherwise re-polish the whole subtree.
+        stack = self.market_tabs.findChild(QtWidgets.QStackedWidget)
+        while len(self._pool) < self.POOL_SIZE:
+            tab = self._create_tab(stack)
+            tab.hide()
+            self._pool.append(tab)
+
+    def _create_tab(self, parent=None) -> MarketTab:
+        tab = MarketTab(parent)
+        tab.order_requested.connect(self.order_requested)
+        tab.operation_requested.connect(self.operation_requested)
+        tab.outcome_changed.connect(self.workspace_changed)
+        return tab
+
     def _on_tab_close(self, index: int):
         """Handle tab close request."""
+        tab = self.market_tabs.widget(index)
         self.market_tabs.removeTab(index)
+        if not isinstance(tab, MarketTab):
+            return
 
-    def _add_market_tab(self, market_name: str):
-        """Add a new market tab."""
-        tab_widget = QtWidgets.QWidget()
-        tab_layout = QtWidgets.QHBoxLayout(tab_widget)
-        tab_layout.setContentsMargins(0, 0, 0, 0)
-
-        # Orderbook (left)
-        orderbook = OrderbookWidget()
-        orderbook.set_market_title(market_name)
-        tab_layout.addWidget(orderbook, 1)
-
-        # Order entry (right)
-        order_entry = OrderEntryWidget()
-        order_entry.setMaximumWidth(300)
-        tab_layout.addWidget(order_entry)
-
-        # Connect orderbook signals to order entry (bidirectional)
-        orderbook.price_clicked.connect(order_entry.set_price)
-        orderbook.outcome_changed.connect(order_entry.set_outcome)
-        order_entry.outcome_changed.connect(orderbook.set_outcome)
+        self._tabs.pop(tab.market_id, None)
+        if len(self._pool) < self.POOL_SIZE:
+            # removeTab() leaves the page parented to the stack, hidden
+            self._pool.append(tab)
+        else:
+            tab.deleteLater()
+        self._release(tab.market_id)
+        self.workspace_changed.emit()
+
+    def _release(self, market_id: str):
+        """Report a market closed once neither a tab nor a book window shows it."""
+        if market_id not in self._tabs and not self.book_windows(market_id):
+            self.market_closed.emit(market_id)
+
+    def _on_tab_menu(self, pos: QtCore.QPoint):
+        bar = self.market_tabs.tabBar()
+        tab = self.market_tabs.widget(bar.tabAt(pos))
+        if not isinstance(tab, MarketTab):
+            return
+        menu = QtWidgets.QMenu(self)
+        menu.addAction("Open Book in New Window", lambda: self.detach_book(tab.market_id))
+        menu.addAction("Close Tab", lambda: self._on_tab_close(self.market_tabs.indexOf(tab)))
+        menu.exec(bar.mapToGlobal(pos))
+
+    def _add_market_tab(self, market_id: str, title: str) -> MarketTab:
+        """Add a new market tab, reusing a pooled one when available."""
+        book = self.book_engine.book(market_id)
+        if book.is_empty():
+            self._seed_placeholder_book(book)
+
+        tab = self._pool.pop() if self._pool else self._create_tab()
+        tab.bind(market_id, title, book,
+                 self.candle_engine.candles(market_id), self.trade_engine.trades(market_id))
+        self._tabs[market_id] = tab
 
         # Add tab with tooltip for long titles
-        tab_index = self.market_tabs.addTab(tab_widget, market_name)
-        self.market_tabs.setTabToolTip(tab_index, market_name)
-
-    def open_market(self, market_name: str):
+        tab_index = self.market_tabs.addTab(tab, title)
+        self.market_tabs.setTabToolTip(tab_index, title)
+
+        # Replace the spare we just used
+        if len(self._pool) < self.POOL_SIZE:
+            QtCore.QTimer.singleShot(0, self._fill_pool)
+        self.workspace_changed.emit()
+        return tab
+
+    def _seed_placeholder_book(self, book: OrderBook):
+        """Fill an empty book with placeholder data until live feeds exist."""
+        asks_data = [(0.64, 300), (0.65, 150), (0.66, 200), (0.67, 85), (0.68, 120)]
+        bids_data = [(0.62, 250), (0.61, 180), (0.60, 320), (0.59, 100), (0.58, 450)]
+        book.apply_snapshot(
+            [(to_ticks(price), size) for price, size in bids_data],
+            [(to_ticks(price), size) for price, size in asks_data],
+        )
+        # Not saved with the session
+        book.placeholder = True
+
+    def _refresh_current(self):
+        tab = self.market_tabs.currentWidget()
+        if isinstance(tab, MarketTab):
+            tab.refresh()
+
+    def _refresh_book_windows(self):
+        for window in self._book_windows:
+            window.refresh()
+
+    def book_windows(self, market_id: str | None = None) -> list[BookWindow]:
+        """Open book windows, optionally only those of one market."""
+        return [w for w in self._book_windows if market_id is None or w.market_id == market_id]
+
+    def detach_book(self, market_id: str) -> BookWindow:
+        """
+        Open the market's orderbook in a new top-level window. The window
+        shares the tab's book; it is placed on another screen when there is
+        one.
+        """
+        tab = self._tabs.get(market_id)
+        title = tab.market_title if tab is not None else market_id
+        window = BookWindow(market_id, title, self.book_engine.book(market_id), self)
+        if tab is not None:
+            window.orderbook.set_outcome(tab.outcome)
+        window.price_clicked.connect(
+            lambda outcome, price: self._on_book_window_price(window, outcome, price)
+        )
+        window.closed.connect(lambda: self._on_book_window_closed(window))
+        self._place_book_window(window)
+        self._book_windows.append(window)
+        window.show()
+        return window
+
+    def _place_book_window(self, window: BookWindow):
+        """Cascade new windows on the screens other than the panel's own, if any."""
+        home = self.window().screen()
+        screens = [s for s in QtGui.QGuiApplication.screens() if s is not home] or [home]
+        count = len(self._book_windows)
+        screen = screens[count % len(screens)]
+        geo = screen.availableGeometry()
+        window.resize(*self.BOOK_WINDOW_SIZE)
+        step = self.BOOK_WINDOW_CASCADE * (count // len(screens) % 8)
+        window.move(geo.x() + 40 + step, geo.y() + 40 + step)
+
+    def _on_book_window_price(self, window: BookWindow, outcome: str, price: float):
+        """Send a price clicked in a book window to its market's order entry."""
+        self.open_market(window.market_id, window.market_title)
+        tab = self._tabs[window.market_id]
+        tab.set_outcome(outcome)
+        tab.order_entry.set_price(price)
+
+    def _on_book_window_closed(self, window: BookWindow):
+        if window in self._book_windows:
+            self._book_windows.remove(window)
+            self._release(window.market_id)
+
+    def close_book_windows(self):
+        for window in list(self._book_windows):
+            window.close()
+
+    def open_market(self, market_id: str, title: str | None = None):
         """Open a market in a new tab or switch to existing."""
-        # Check if already open
-        for i in range(self.market_tabs.count()):
-            if self.market_tabs.tabText(i) == market_name:
-                self.market_tabs.setCurrentIndex(i)
-                return
-
-        # Add new tab
-        self._add_market_tab(market_name)
-        self.market_tabs.setCurrentIndex(self.market_tabs.count() - 1)
+        tab = self._tabs.get(market_id)
+        if tab is None:
+            tab = self._add_market_tab(market_id, title or market_id)
+        self.market_tabs.setCurrentWidget(tab)
+
+    def tab_states(self) -> list[tuple[str, str, str]]:
+        """(market id, title, outcome) of the open tabs, in tab bar order."""
+        tabs = (self.market_tabs.widget(i) for i in range(self.market_tabs.count()))
+        return [(tab.market_id, tab.market_title, tab.outcome) for tab in tabs if isinstance(tab, MarketTab)]
+
+    def restore(self, tabs: list[TabState], current: int):
+        """
+        Replace the open tabs with a saved set. Tabs whose book was restored
+        from the session are flagged stale until live data arrives.
+        """
+        keep = {state.market_id for state in tabs}
+        for market_id in [mid for mid in self._tabs if mid not in keep]:
+            self._on_tab_close(self.market_tabs.indexOf(self._tabs[market_id]))
+        for index, state in enumerate(tabs):
+            tab = self._tabs.get(state.market_id) or self._add_market_tab(state.market_id, state.title)
+            self.market_tabs.tabBar().moveTab(self.market_tabs.indexOf(tab), index)
+            tab.set_outcome(state.outcome)
+            tab.set_stale(bool(state.bids or state.asks))
+        if 0 <= current < self.market_tabs.count():
+            self.market_tabs.setCurrentIndex(current)